@@ -1,9 +1,43 @@
-from .aiohttp_client import AiohttpInstagramAPI
-from .httpx_client import HttpxInstagramAPI
-from .requests_client import RequestsInstagramAPI
+from ..core.lazy import lazy_exports
 
 __all__ = [
     "AiohttpInstagramAPI",
+    "Change",
+    "CrawlReport",
+    "DownloadResult",
+    "Highlight",
+    "HlsDownloader",
     "HttpxInstagramAPI",
+    "MediaDownloader",
+    "MediaWatcher",
+    "Post",
+    "Profile",
+    "Reel",
     "RequestsInstagramAPI",
+    "SeenIndex",
+    "SyncInstagramAPI",
+    "Story",
+    "crawl",
+    "extract_media_urls",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "AiohttpInstagramAPI": ".aiohttp_client",
+    "Change": ".watcher",
+    "CrawlReport": ".crawler",
+    "DownloadResult": ".downloader",
+    "Highlight": ".models",
+    "HlsDownloader": ".hls",
+    "HttpxInstagramAPI": ".httpx_client",
+    "MediaDownloader": ".downloader",
+    "MediaWatcher": ".watcher",
+    "Post": ".models",
+    "Profile": ".models",
+    "Reel": ".models",
+    "RequestsInstagramAPI": ".requests_client",
+    "SeenIndex": ".watcher",
+    "SyncInstagramAPI": ".sync_client",
+    "Story": ".models",
+    "crawl": ".crawler",
+    "extract_media_urls": ".downloader",
+})
@@ -1,23 +1,55 @@
-import aiohttp
-from typing import Dict, Any
+from typing import Dict, Any, Optional, AsyncIterable, AsyncIterator, Iterable, Union, List, Type
 
+from ..core.aiohttp_base import AiohttpBaseClient
+from ..core.bulk import BulkResult, bounded_gather
+from ..core.cache import ResponseCache
+from ..core.pool import PoolLimits
+from ..core.ratelimit import TokenBucket
+from ..core.resilience import ResiliencePolicy
+from .models import Highlight, Model, Post, Profile, Reel, Story
 
-class AiohttpInstagramAPI:
+
+class AiohttpInstagramAPI(AiohttpBaseClient):
     """
     A client wrapper for the FastAPI-based Instagram API hosted at taskora.onrender.com using aiohttp.
+
+    Connections are pooled and kept alive between calls. Use the client as an async
+    context manager, or call ``close()`` when done.
     """
 
-    def __init__(self, apikey: str, timeout: int = 60):
+    native_errors = True
+    key_status_method = "validate_key"
+    status_endpoint = "status"
+
+    def __init__(
+        self,
+        apikey: str,
+        timeout: int = 60,
+        limits: Optional[PoolLimits] = None,
+        cache: Optional[ResponseCache] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        resilience: Optional[ResiliencePolicy] = None,
+    ):
         """
         Initialize the API wrapper.
 
         Args:
             apikey (str): Your API key for authenticating with the backend.
             timeout (int): Request timeout in seconds (default: 60).
-        """
+            limits (PoolLimits, optional): Connection pool size, per-host limit and idle expiry.
+            cache (ResponseCache, optional): Serve repeated lookups from memory with
+                per-endpoint TTLs and stale-while-revalidate, or pass a ``DiskCache`` to keep
+                them across restarts. Key validation is never cached.
+            rate_limiter (TokenBucket, optional): Client-side rate limit every request waits on;
+                may be shared across clients (see ``TokenBucket.shared``).
+            resilience (ResiliencePolicy, optional): Retry policy and circuit breaker;
+                transient failures of idempotent calls are retried by default.
+        """
+        super().__init__("https://taskora.onrender.com/api/v1/", timeout, limits)
         self.apikey = apikey
-        self.timeout = timeout
-        self.base_url = "https://taskora.onrender.com/api/v1/"
+        self.rate_limiter = rate_limiter
+        self.resilience = resilience or self.resilience
+        self.cache = cache
 
     async def _get(self, endpoint: str, url_param: str) -> Dict[str, Any]:
         """
@@ -30,14 +62,7 @@ class AiohttpInstagramAPI:
         Returns:
             Dict[str, Any]: JSON response from the API.
         """
-        timeout = aiohttp.ClientTimeout(total=self.timeout)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            async with session.get(
-                self.base_url + endpoint,
-                params={"apikey": self.apikey, "url": url_param}
-            ) as response:
-                response.raise_for_status()
-                return await response.json()
+        return await self._request("GET", endpoint, {"apikey": self.apikey, "url": url_param}, cached=True)
 
     async def _post(self, endpoint: str, query_params: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -50,15 +75,28 @@ class AiohttpInstagramAPI:
         Returns:
             Dict[str, Any]: JSON response from the API.
         """
-        timeout = aiohttp.ClientTimeout(total=self.timeout)
         params = {"apikey": self.apikey, **query_params}
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            async with session.post(
-                self.base_url + endpoint,
-                params=params
-            ) as response:
-                response.raise_for_status()
-                return await response.json()
+        return await self._request("POST", endpoint, params, cached=True, idempotent=True)
+
+    async def _post_models(self, endpoint: str, query_params: Dict[str, Any], model: Type[Model], many: bool) -> Any:
+        """
+        Like ``_post``, but build :class:`Model` instances straight from the response bytes.
+
+        Args:
+            endpoint (str): API endpoint path.
+            query_params (Dict[str, Any]): Dictionary of query parameters.
+            model (Type[Model]): Model class to build.
+            many (bool): The response is a list of entities rather than one.
+
+        Returns:
+            Model | List[Model]: The model, or one model per entity.
+        """
+        params = {"apikey": self.apikey, **query_params}
+        if many:
+            decode, convert = model.many_from_json, model.many_from_response
+        else:
+            decode, convert = model.from_json, model.from_response
+        return await self._request_decoded("POST", endpoint, params, decode, convert, idempotent=True)
 
     # ----------- GET Endpoints ------------
 
@@ -208,6 +246,138 @@ class AiohttpInstagramAPI:
         """
         return await self._post("posts", {"username": username})
 
+    # ----------- Bulk Endpoints ------------
+
+    def get_profiles_many(
+        self,
+        usernames: Union[Iterable[str], AsyncIterable[str]],
+        concurrency: int = 10,
+    ) -> AsyncIterator[BulkResult]:
+        """
+        Fetch profile information for many users concurrently, yielding results as they complete.
+
+        Args:
+            usernames (Iterable[str] | AsyncIterable[str]): Instagram usernames, consumed lazily.
+            concurrency (int): Maximum number of requests in flight (default: 10).
+
+        Returns:
+            AsyncIterator[BulkResult]: One result per username; check ``ok`` before using ``value``.
+        """
+        return bounded_gather(self.get_profile, usernames, concurrency)
+
+    def get_user_infos_many(
+        self,
+        usernames: Union[Iterable[str], AsyncIterable[str]],
+        concurrency: int = 10,
+    ) -> AsyncIterator[BulkResult]:
+        """
+        Retrieve basic profile information for many users concurrently, yielding results as they complete.
+
+        Args:
+            usernames (Iterable[str] | AsyncIterable[str]): Instagram usernames, consumed lazily.
+            concurrency (int): Maximum number of requests in flight (default: 10).
+
+        Returns:
+            AsyncIterator[BulkResult]: One result per username; check ``ok`` before using ``value``.
+        """
+        return bounded_gather(self.get_user_info, usernames, concurrency)
+
+    def get_posts_many(
+        self,
+        usernames: Union[Iterable[str], AsyncIterable[str]],
+        concurrency: int = 10,
+    ) -> AsyncIterator[BulkResult]:
+        """
+        Retrieve recent posts for many users concurrently, yielding results as they complete.
+
+        Args:
+            usernames (Iterable[str] | AsyncIterable[str]): Instagram usernames, consumed lazily.
+            concurrency (int): Maximum number of requests in flight (default: 10).
+
+        Returns:
+            AsyncIterator[BulkResult]: One result per username; check ``ok`` before using ``value``.
+        """
+        return bounded_gather(self.get_posts, usernames, concurrency)
+
+    def get_reels_many(
+        self,
+        usernames: Union[Iterable[str], AsyncIterable[str]],
+        concurrency: int = 10,
+    ) -> AsyncIterator[BulkResult]:
+        """
+        Fetch public reels for many users concurrently, yielding results as they complete.
+
+        Args:
+            usernames (Iterable[str] | AsyncIterable[str]): Instagram usernames, consumed lazily.
+            concurrency (int): Maximum number of requests in flight (default: 10).
+
+        Returns:
+            AsyncIterator[BulkResult]: One result per username; check ``ok`` before using ``value``.
+        """
+        return bounded_gather(self.get_reels, usernames, concurrency)
+
+    # ----------- Typed Endpoints ------------
+
+    async def get_profile_model(self, username: str) -> Profile:
+        """
+        Fetch a user's profile as a compact :class:`Profile`.
+
+        Args:
+            username (str): Instagram username.
+
+        Returns:
+            Profile: Typed profile; ``raw`` returns the original dict.
+        """
+        return await self._post_models("profile", {"username": username}, Profile, False)
+
+    async def get_posts_models(self, username: str) -> List[Post]:
+        """
+        Retrieve recent posts for a user as compact :class:`Post` models.
+
+        Args:
+            username (str): Instagram username.
+
+        Returns:
+            List[Post]: One model per post; nested fields are decoded on access.
+        """
+        return await self._post_models("posts", {"username": username}, Post, True)
+
+    async def get_reels_models(self, username: str) -> List[Reel]:
+        """
+        Fetch a user's public reels as compact :class:`Reel` models.
+
+        Args:
+            username (str): Instagram username.
+
+        Returns:
+            List[Reel]: One model per reel; nested fields are decoded on access.
+        """
+        return await self._post_models("reels", {"username": username}, Reel, True)
+
+    async def get_stories_models(self, username: str) -> List[Story]:
+        """
+        Retrieve a user's active stories as compact :class:`Story` models.
+
+        Args:
+            username (str): Instagram username.
+
+        Returns:
+            List[Story]: One model per story item; nested fields are decoded on access.
+        """
+        return await self._post_models("stories", {"username": username}, Story, True)
+
+    async def get_highlights_models(self, username: str) -> List[Highlight]:
+        """
+        Fetch a user's highlight reels as compact :class:`Highlight` models.
+
+        Args:
+            username (str): Instagram username.
+
+        Returns:
+            List[Highlight]: One model per highlight.
+        """
+        return await self._post_models("highlights", {"username": username}, Highlight, True)
+
     # ----------- API Key Validation (Optional) ------------
 
     async def validate_key(self) -> Dict[str, Any]:
@@ -217,11 +387,4 @@ class AiohttpInstagramAPI:
         Returns:
             Dict[str, Any]: API key status, rate limits, and expiry.
         """
-        timeout = aiohttp.ClientTimeout(total=self.timeout)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            async with session.get(
-                self.base_url + "instagram/validate_key",
-                params={"apikey": self.apikey}
-            ) as response:
-                response.raise_for_status()
-                return await response.json()
+        return await self._request("GET", "instagram/validate_key", {"apikey": self.apikey})
@@ -0,0 +1,302 @@
+import argparse
+import asyncio
+import inspect
+import json
+import multiprocessing
+import os
+import queue as queue_module
+import sys
+import time
+import traceback
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from typing import Any, BinaryIO, Dict, Iterable, List, Optional, Union
+
+from ..core.bulk import bounded_gather
+from ..core.jsonlib import get_encoder
+from ..core.pool import PoolLimits
+from ..core.ratelimit import SharedTokenBucket
+
+#: Result lines are shipped to the parent in batches of this many...
+BATCH_SIZE = 256
+#: ...or at least this often, in seconds.
+FLUSH_INTERVAL = 0.5
+
+
+@dataclass
+class CrawlReport:
+    """
+    Summary of a :func:`crawl` run.
+
+    Attributes:
+        total (int): Usernames crawled.
+        succeeded (int): Lookups that returned data.
+        failed (int): Lookups that raised, after retries.
+        elapsed (float): Wall-clock seconds of the whole run.
+        errors (Dict[str, int]): Failures by exception type and HTTP status.
+        workers (List[Dict[str, Any]]): Per-process counts, elapsed time and throughput.
+        rate_waited (float): Seconds workers spent waiting on the shared rate budget.
+    """
+
+    total: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    elapsed: float = 0.0
+    errors: Dict[str, int] = field(default_factory=dict)
+    workers: List[Dict[str, Any]] = field(default_factory=list)
+    rate_waited: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Lookups per second over the whole run."""
+        return self.total / self.elapsed if self.elapsed else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {**asdict(self), "throughput": self.throughput}
+
+    def __str__(self) -> str:
+        lines = [
+            f"crawled {self.total} usernames in {self.elapsed:.1f}s ({self.throughput:.1f}/s): "
+            f"{self.succeeded} ok, {self.failed} failed",
+        ]
+        for name, count in sorted(self.errors.items(), key=lambda item: -item[1]):
+            lines.append(f"  {count:>8}  {name}")
+        for worker in self.workers:
+            lines.append(
+                f"  worker {worker['index']}: {worker['total']} in {worker['elapsed']:.1f}s "
+                f"({worker['throughput']:.1f}/s), {worker['failed']} failed"
+                + (f", crashed: {worker['crash']}" if worker.get("crash") else "")
+            )
+        if self.rate_waited:
+            lines.append(f"  waited {self.rate_waited:.1f}s on the shared rate budget")
+        return "\n".join(lines)
+
+
+def _error_key(error: BaseException) -> str:
+    status = getattr(error, "status", None)
+    return f"{type(error).__name__} {status}" if status else type(error).__name__
+
+
+async def _crawl_shard(index: int, shard: List[str], results: Any, options: Dict[str, Any]) -> None:
+    from .aiohttp_client import AiohttpInstagramAPI
+
+    encode = get_encoder()
+    concurrency = options["concurrency"]
+    limits = PoolLimits(max_connections=concurrency, max_connections_per_host=concurrency)
+    client = AiohttpInstagramAPI(options["apikey"], options["timeout"], limits, rate_limiter=options["rate_limiter"])
+    if options["base_url"]:
+        client.base_url = options["base_url"]
+
+    lines: List[bytes] = []
+    errors: Counter = Counter()
+    succeeded = failed = 0
+    started = flushed = time.monotonic()
+
+    def flush() -> None:
+        nonlocal flushed
+        if lines:
+            results.put(("lines", b"".join(lines)))
+            lines.clear()
+        flushed = time.monotonic()
+
+    async with client:
+        async for result in bounded_gather(getattr(client, options["method"]), shard, concurrency):
+            if result.ok:
+                succeeded += 1
+                record = {"username": result.key, "ok": True, "data": result.value}
+            else:
+                failed += 1
+                kind = _error_key(result.error)
+                errors[kind] += 1
+                record = {"username": result.key, "ok": False, "error": kind, "message": str(result.error)}
+            lines.append(encode(record) + b"\n")
+            if len(lines) >= BATCH_SIZE or time.monotonic() - flushed >= FLUSH_INTERVAL:
+                flush()
+    flush()
+    elapsed = time.monotonic() - started
+    results.put(("done", index, {
+        "index": index,
+        "pid": os.getpid(),
+        "total": succeeded + failed,
+        "succeeded": succeeded,
+        "failed": failed,
+        "elapsed": elapsed,
+        "throughput": (succeeded + failed) / elapsed if elapsed else 0.0,
+        "errors": dict(errors),
+    }))
+
+
+def _worker(index: int, shard: List[str], results: Any, options: Dict[str, Any]) -> None:
+    try:
+        asyncio.run(_crawl_shard(index, shard, results, options))
+    except BaseException:
+        results.put(("crashed", index, traceback.format_exc(limit=5)))
+
+
+def crawl(
+    usernames: Iterable[str],
+    output: Union[str, os.PathLike, BinaryIO],
+    apikey: str,
+    method: str = "get_profile",
+    processes: Optional[int] = None,
+    concurrency: int = 32,
+    rate: Optional[float] = None,
+    burst: Optional[float] = None,
+    base_url: Optional[str] = None,
+    timeout: int = 60,
+    context: Any = None,
+) -> CrawlReport:
+    """
+    Look up many usernames with a pool of processes and stream the results as NDJSON.
+
+    The usernames are split round-robin into one shard per process. Each process
+    runs its own pooled :class:`AiohttpInstagramAPI` with at most ``concurrency``
+    requests in flight, so TLS and JSON work spread over all cores. Results are
+    encoded in the workers and written by the parent in completion order, one
+    line per username::
+
+        {"username": "...", "ok": true, "data": {...}}
+        {"username": "...", "ok": false, "error": "ClientResponseError 404", "message": "..."}
+
+    Args:
+        usernames (Iterable[str]): Usernames to crawl; blanks and duplicates are skipped.
+        output (str | PathLike | BinaryIO): NDJSON destination: a path, "-" for stdout,
+            or a binary file object.
+        apikey (str): Your API key.
+        method (str): Client method taking one username (default: "get_profile").
+        processes (int, optional): Worker processes (default: CPU count).
+        concurrency (int): Requests in flight per process (default: 32).
+        rate (float, optional): Requests per second across all workers; unlimited when None.
+        burst (float, optional): Burst size of the shared budget (default: ``max(1, rate)``).
+        base_url (str, optional): Override the API base URL.
+        timeout (int): Request timeout in seconds (default: 60).
+        context (multiprocessing context, optional): Context used to start the workers.
+
+    Returns:
+        CrawlReport: Throughput and error summary.
+    """
+    from .aiohttp_client import AiohttpInstagramAPI
+
+    func = getattr(AiohttpInstagramAPI, method, None)
+    if (
+        method.startswith("_")
+        or method.endswith(("_model", "_models"))
+        or not inspect.iscoroutinefunction(func)
+        or "username" not in inspect.signature(func).parameters
+    ):
+        raise ValueError(f"{method!r} is not an AiohttpInstagramAPI method taking a username and returning JSON")
+    names = list(dict.fromkeys(name.strip() for name in usernames if name and name.strip()))
+    processes = max(1, min(processes or os.cpu_count() or 1, len(names)))
+    context = context or multiprocessing.get_context()
+    options = {
+        "apikey": apikey,
+        "method": method,
+        "concurrency": concurrency,
+        "base_url": base_url,
+        "timeout": timeout,
+        "rate_limiter": SharedTokenBucket(rate, burst, context=context) if rate else None,
+    }
+
+    report = CrawlReport()
+    results = context.Queue()
+    workers = [
+        context.Process(
+            target=_worker,
+            args=(index, names[index::processes], results, options),
+            name=f"TaskoraApi-crawler-{index}",
+            daemon=True,
+        )
+        for index in range(processes)
+    ]
+
+    if output == "-":
+        stream, owned = sys.stdout.buffer, False
+    elif isinstance(output, (str, os.PathLike)):
+        stream, owned = open(output, "wb"), True
+    else:
+        stream, owned = output, False
+
+    started = time.monotonic()
+    try:
+        for worker in workers:
+            worker.start()
+        running = set(range(processes))
+        while running:
+            try:
+                message = results.get(timeout=1.0)
+            except queue_module.Empty:
+                for index in [i for i in running if workers[i].exitcode is not None]:
+                    running.discard(index)
+                    report.workers.append({"index": index, "total": 0, "succeeded": 0, "failed": 0, "elapsed": 0.0,
+                                           "throughput": 0.0, "crash": f"exit code {workers[index].exitcode}"})
+                continue
+            if message[0] == "lines":
+                stream.write(message[1])
+            elif message[0] == "done":
+                _, index, summary = message
+                running.discard(index)
+                report.workers.append(summary)
+            else:
+                _, index, crash = message
+                running.discard(index)
+                report.workers.append({"index": index, "total": 0, "succeeded": 0, "failed": 0, "elapsed": 0.0,
+                                       "throughput": 0.0, "crash": crash.strip().splitlines()[-1]})
+        stream.flush()
+    finally:
+        for worker in workers:
+            if worker.is_alive():
+                worker.terminate()
+            worker.join()
+        if owned:
+            stream.close()
+
+    report.elapsed = time.monotonic() - started
+    report.workers.sort(key=lambda worker: worker["index"])
+    for worker in report.workers:
+        report.succeeded += worker["succeeded"]
+        report.failed += worker["failed"]
+        for name, count in worker.pop("errors", {}).items():
+            report.errors[name] = report.errors.get(name, 0) + count
+    report.total = report.succeeded + report.failed
+    if options["rate_limiter"] is not None:
+        report.rate_waited = options["rate_limiter"].waited
+    return report
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Crawl Instagram usernames with a pool of processes into NDJSON.")
+    parser.add_argument("input", help="file with one username per line, or - for stdin")
+    parser.add_argument("-o", "--output", default="-", help="NDJSON output file (default: stdout)")
+    parser.add_argument("--apikey", default=os.environ.get("TASKORA_API_KEY"), help="default: $TASKORA_API_KEY")
+    parser.add_argument("--method", default="get_profile")
+    parser.add_argument("--processes", type=int, default=None, help="default: CPU count")
+    parser.add_argument("--concurrency", type=int, default=32, help="requests in flight per process")
+    parser.add_argument("--rate", type=float, default=None, help="requests per second across all processes")
+    parser.add_argument("--burst", type=float, default=None)
+    parser.add_argument("--base-url", default=None)
+    parser.add_argument("--timeout", type=int, default=60)
+    parser.add_argument("--report", default=None, help="also write the report as JSON to this file")
+    args = parser.parse_args(argv)
+    if not args.apikey:
+        parser.error("an API key is required (--apikey or TASKORA_API_KEY)")
+
+    if args.input == "-":
+        usernames = sys.stdin.read().splitlines()
+    else:
+        with open(args.input, encoding="utf-8") as file:
+            usernames = file.read().splitlines()
+
+    report = crawl(
+        usernames, args.output, args.apikey, args.method, args.processes, args.concurrency,
+        args.rate, args.burst, args.base_url, args.timeout,
+    )
+    print(report, file=sys.stderr)
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as file:
+            json.dump(report.to_dict(), file, indent=2)
+    if any(worker.get("crash") for worker in report.workers):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,484 @@
+import asyncio
+import inspect
+import json
+import os
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+from ..core.bulk import BulkResult, bounded_gather
+from ..core.errors import DownloadError
+from ..core.pool import PoolLimits
+from ..core.ratelimit import TokenBucket
+from ..core.resilience import DEFAULT_RESILIENCE, RetryPolicy
+
+CHUNK_SIZE = 256 * 1024
+PART_SIZE = 8 * 1024 * 1024
+#: Progress is written to the sidecar file at least this often (bytes per part).
+CHECKPOINT_BYTES = 4 * 1024 * 1024
+
+#: Response keys that hold downloadable media URLs in ``get_links``/``get_story``/``get_stories`` payloads.
+MEDIA_URL_KEYS = ("url", "download_url", "video_url", "image_url", "display_url", "src")
+
+Destination = Union[str, os.PathLike, Any]
+
+
+def extract_media_urls(data: Any, keys: Iterable[str] = MEDIA_URL_KEYS) -> List[str]:
+    """
+    Collect media URLs from an API response, in document order and without duplicates.
+
+    Args:
+        data (Any): Decoded response, e.g. from ``get_links`` or ``get_stories``.
+        keys (Iterable[str]): Keys whose http(s) string values are taken as media URLs.
+
+    Returns:
+        List[str]: The URLs found anywhere in the structure.
+    """
+    keys = frozenset(keys)
+    found: Dict[str, None] = {}
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if key in keys and isinstance(value, str) and value.startswith(("http://", "https://")):
+                    found.setdefault(value)
+            stack.extend(reversed([v for v in node.values() if isinstance(v, (dict, list))]))
+        elif isinstance(node, list):
+            stack.extend(reversed([v for v in node if isinstance(v, (dict, list))]))
+    return list(found)
+
+
+def filename_for(url: str, index: int = 0) -> str:
+    """File name for a media URL: the last path segment, or ``media-<index>``."""
+    name = os.path.basename(urlsplit(url).path)
+    return name or f"media-{index}"
+
+
+@dataclass
+class DownloadResult:
+    """
+    Outcome of one download.
+
+    Attributes:
+        url (str): The downloaded URL.
+        path (str, optional): Final file path, or None when streamed to a file-like sink.
+        size (int): Size of the complete file in bytes.
+        transferred (int): Bytes received by this call; less than ``size`` after a resume.
+        parts (int): Number of ranges the file was split into.
+        elapsed (float): Wall time in seconds.
+    """
+
+    url: str
+    path: Optional[str]
+    size: int
+    transferred: int
+    parts: int
+    elapsed: float
+
+
+class _Part:
+    __slots__ = ("start", "end", "done", "saved")
+
+    def __init__(self, start: int, end: Optional[int], done: int = 0):
+        self.start = start
+        self.end = end  # inclusive; None when the size is unknown
+        self.done = done  # bytes written
+        self.saved = done  # bytes flushed to the file; only these are checkpointed
+
+    @property
+    def complete(self) -> bool:
+        return self.end is not None and self.start + self.done > self.end
+
+
+class _RangeIgnored(DownloadError):
+    """A server answered a range request with the full body."""
+
+
+class _AiohttpTransport:
+    def __init__(self, limits: PoolLimits, timeout: float):
+        import aiohttp
+
+        self._aiohttp = aiohttp
+        self.limits = limits
+        self.timeout = timeout
+        self.session = None
+
+    def _session(self):
+        if self.session is None or self.session.closed:
+            self.session = self._aiohttp.ClientSession(
+                connector=self.limits.aiohttp_connector(),
+                # No total timeout: large files legitimately take long; stalls are caught per read.
+                timeout=self._aiohttp.ClientTimeout(total=None, sock_connect=self.timeout, sock_read=self.timeout),
+                auto_decompress=False,
+            )
+        return self.session
+
+    async def head(self, url: str, headers: Dict[str, str]) -> Tuple[int, Any]:
+        async with self._session().head(url, headers=headers, allow_redirects=True) as response:
+            return response.status, response.headers
+
+    @asynccontextmanager
+    async def stream(self, url: str, headers: Dict[str, str], chunk_size: int):
+        async with self._session().get(url, headers=headers) as response:
+            response.raise_for_status()
+            yield response.status, response.content.iter_chunked(chunk_size)
+
+    async def read(self, url: str, headers: Dict[str, str]) -> bytes:
+        async with self._session().get(url, headers=headers) as response:
+            response.raise_for_status()
+            return await response.read()
+
+    def failure_info(self, exc: Exception) -> Optional[Tuple[Optional[int], Optional[float]]]:
+        if isinstance(exc, self._aiohttp.ClientResponseError):
+            return exc.status, None
+        if isinstance(exc, (self._aiohttp.ClientError, asyncio.TimeoutError)):
+            return None, None
+        return None
+
+    async def close(self) -> None:
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+
+
+class _HttpxTransport:
+    def __init__(self, limits: PoolLimits, timeout: float):
+        import httpx
+
+        self._httpx = httpx
+        self.client = httpx.AsyncClient(
+            timeout=httpx.Timeout(timeout),
+            limits=limits.httpx_limits(),
+            follow_redirects=True,
+        )
+
+    async def head(self, url: str, headers: Dict[str, str]) -> Tuple[int, Any]:
+        response = await self.client.head(url, headers=headers)
+        return response.status_code, response.headers
+
+    @asynccontextmanager
+    async def stream(self, url: str, headers: Dict[str, str], chunk_size: int):
+        async with self.client.stream("GET", url, headers=headers) as response:
+            response.raise_for_status()
+            yield response.status_code, response.aiter_raw(chunk_size)
+
+    async def read(self, url: str, headers: Dict[str, str]) -> bytes:
+        response = await self.client.get(url, headers=headers)
+        response.raise_for_status()
+        return response.content
+
+    def failure_info(self, exc: Exception) -> Optional[Tuple[Optional[int], Optional[float]]]:
+        if isinstance(exc, self._httpx.HTTPStatusError):
+            return exc.response.status_code, None
+        if isinstance(exc, self._httpx.TransportError):
+            return None, None
+        return None
+
+    async def close(self) -> None:
+        await self.client.aclose()
+
+
+_TRANSPORTS = {"aiohttp": _AiohttpTransport, "httpx": _HttpxTransport}
+
+
+class MediaDownloader:
+    """
+    Streams media files to disk or any file-like sink without holding them in memory.
+
+    Files larger than ``2 * part_size`` on servers that support ``Range`` are split
+    into up to ``max_parts`` ranges fetched in parallel. Downloads to a path go
+    through ``<path>.part`` with a ``<path>.part.json`` progress sidecar, so an
+    interrupted download resumes where it stopped; the sidecar only records bytes
+    already flushed to the file. A part that fails midway is retried from its
+    current offset. If the server advertises ranges but answers one with the whole
+    body, the file is fetched again as a single part.
+
+    ``max_connections`` caps the open connections across every download of this
+    downloader, and ``bandwidth`` (bytes per second, or a shared :class:`TokenBucket`)
+    caps the combined throughput.
+
+    Use it as an async context manager, or call ``close()`` when done.
+    """
+
+    def __init__(
+        self,
+        backend: str = "aiohttp",
+        max_connections: int = 16,
+        max_parts: int = 4,
+        part_size: int = PART_SIZE,
+        chunk_size: int = CHUNK_SIZE,
+        bandwidth: Union[float, TokenBucket, None] = None,
+        retry: Optional[RetryPolicy] = DEFAULT_RESILIENCE.retry,
+        timeout: float = 60,
+    ):
+        """
+        Args:
+            backend (str): "aiohttp" or "httpx".
+            max_connections (int): Open connections across all downloads (default: 16).
+            max_parts (int): Parallel ranges per file (default: 4).
+            part_size (int): Smallest range worth splitting off, in bytes (default: 8 MiB).
+            chunk_size (int): Read and write size in bytes (default: 256 KiB).
+            bandwidth (float | TokenBucket, optional): Byte rate limit, or a bucket shared
+                with other downloaders; unlimited by default.
+            retry (RetryPolicy, optional): Retries for failed parts; None disables them.
+            timeout (float): Connect and per-read timeout in seconds (default: 60).
+        """
+        if backend not in _TRANSPORTS:
+            raise ValueError(f"Unknown backend {backend!r}; expected one of {', '.join(_TRANSPORTS)}.")
+        self.max_parts = max(1, max_parts)
+        self.part_size = part_size
+        self.chunk_size = chunk_size
+        if isinstance(bandwidth, (int, float)):
+            bandwidth = TokenBucket(rate=bandwidth, capacity=max(chunk_size, bandwidth / 4))
+        self.bandwidth: Optional[TokenBucket] = bandwidth
+        self.retry = retry
+        self.max_connections = max_connections
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        limits = PoolLimits(max_connections=max_connections, max_connections_per_host=max_connections)
+        self._transport = _TRANSPORTS[backend](limits, timeout)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    # ----------- Public API ------------
+
+    async def download(self, url: str, dest: Destination, resume: bool = True) -> DownloadResult:
+        """
+        Download ``url`` to a file path or a writable file-like object.
+
+        Args:
+            url (str): Media URL, e.g. from :func:`extract_media_urls`.
+            dest (str | PathLike | file-like): Target path, or an object with a ``write``
+                method (sync or async). File-like sinks are written sequentially and
+                cannot be resumed.
+            resume (bool): Continue a previous partial download of the same path.
+
+        Returns:
+            DownloadResult: Sizes and timing of the download.
+
+        Raises:
+            DownloadError: If the server's answers are inconsistent with the download plan.
+        """
+        started = time.monotonic()
+        if isinstance(dest, (str, os.PathLike)):
+            path = os.fspath(dest)
+            size, transferred, parts = await self._download_to_path(url, path, resume)
+        else:
+            path = None
+            size = transferred = await self._download_to_sink(url, dest)
+            parts = 1
+        return DownloadResult(url, path, size, transferred, parts, time.monotonic() - started)
+
+    def download_many(
+        self,
+        items: Iterable[Tuple[str, Destination]],
+        concurrency: int = 4,
+    ) -> AsyncIterator[BulkResult]:
+        """
+        Download many files concurrently, yielding results as they complete.
+
+        Args:
+            items (Iterable[Tuple[str, Destination]]): ``(url, dest)`` pairs, consumed lazily.
+            concurrency (int): Files in flight at once (default: 4); connections and
+                bandwidth are still capped globally.
+
+        Returns:
+            AsyncIterator[BulkResult]: One result per pair; ``value`` is a :class:`DownloadResult`.
+        """
+        return bounded_gather(lambda item: self.download(*item), items, concurrency)
+
+    def download_media(self, data: Any, directory: str, concurrency: int = 4) -> AsyncIterator[BulkResult]:
+        """
+        Download every media URL in an API response into ``directory``.
+
+        Args:
+            data (Any): Response of ``get_links``, ``get_story``, ``get_stories``, ...
+            directory (str): Target directory, created if missing.
+            concurrency (int): Files in flight at once (default: 4).
+
+        Returns:
+            AsyncIterator[BulkResult]: One result per URL.
+        """
+        os.makedirs(directory, exist_ok=True)
+        urls = extract_media_urls(data)
+        return self.download_many(
+            ((url, os.path.join(directory, filename_for(url, i))) for i, url in enumerate(urls)), concurrency
+        )
+
+    async def close(self) -> None:
+        """Close the underlying HTTP session."""
+        await self._transport.close()
+
+    # ----------- Internals ------------
+
+    @property
+    def _connections(self) -> asyncio.Semaphore:
+        # Created on first use so it binds to the running loop.
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_connections)
+        return self._semaphore
+
+    async def _probe(self, url: str) -> Tuple[Optional[int], bool, Optional[str]]:
+        """Return ``(size, accepts_ranges, validator)`` from a HEAD request; unknowns on failure."""
+        try:
+            async with self._connections:
+                status, headers = await self._transport.head(url, {"Accept-Encoding": "identity"})
+        except Exception:
+            return None, False, None
+        if status >= 400:
+            return None, False, None
+        length = headers.get("Content-Length")
+        size = int(length) if length and length.isdigit() else None
+        ranges = headers.get("Accept-Ranges", "").lower() == "bytes"
+        return size, ranges, headers.get("ETag") or headers.get("Last-Modified")
+
+    def _plan(self, size: Optional[int], ranges: bool) -> List[_Part]:
+        if size is None:
+            return [_Part(0, None)]
+        if not ranges or size < 2 * self.part_size:
+            return [_Part(0, size - 1)]
+        count = min(self.max_parts, size // self.part_size)
+        step = -(-size // count)
+        return [_Part(start, min(start + step, size) - 1) for start in range(0, size, step)]
+
+    @staticmethod
+    def _load_state(sidecar: str, size: Optional[int], validator: Optional[str]) -> Optional[List[_Part]]:
+        try:
+            with open(sidecar, encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if state.get("size") != size or state.get("validator") != validator:
+            return None
+        return [_Part(*part) for part in state["parts"]]
+
+    @staticmethod
+    def _save_state(sidecar: str, size: Optional[int], validator: Optional[str], parts: List[_Part]) -> None:
+        state = {"size": size, "validator": validator, "parts": [[p.start, p.end, p.saved] for p in parts]}
+        tmp = sidecar + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp, sidecar)
+
+    async def _download_to_path(self, url: str, path: str, resume: bool) -> Tuple[int, int, int]:
+        size, ranges, validator = await self._probe(url)
+        partial, sidecar = path + ".part", path + ".part.json"
+
+        parts = self._load_state(sidecar, size, validator) if resume and os.path.exists(partial) else None
+        if parts is not None and not ranges and any(p.done for p in parts):
+            parts = None  # progress is useless if the server cannot continue it
+        if parts is None:
+            parts = self._plan(size, ranges)
+            with open(partial, "wb") as f:
+                if size is not None:
+                    f.truncate(size)
+        before = sum(p.done for p in parts)
+
+        def checkpoint() -> None:
+            self._save_state(sidecar, size, validator, parts)
+
+        async def fetch_all() -> None:
+            tasks = [
+                asyncio.ensure_future(self._fetch_part(url, partial, part, validator, len(parts) == 1, checkpoint))
+                for part in parts
+                if not part.complete
+            ]
+            try:
+                await asyncio.gather(*tasks)
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+
+        checkpoint()
+        try:
+            try:
+                await fetch_all()
+            except _RangeIgnored:
+                # Advertised ranges but sent the whole file: fetch it as one part instead.
+                parts[:] = [_Part(0, None if size is None else size - 1)]
+                before = 0
+                checkpoint()
+                await fetch_all()
+        except BaseException:
+            checkpoint()
+            raise
+
+        total = sum(p.done for p in parts)
+        if size is not None and total != size:
+            checkpoint()
+            raise DownloadError(f"{url}: received {total} of {size} bytes")
+        os.replace(partial, path)
+        os.remove(sidecar)
+        return total, total - before, len(parts)
+
+    async def _fetch_part(self, url, partial, part, validator, only_part, checkpoint) -> None:
+        attempt = 0
+        while True:
+            try:
+                await self._stream_part(url, partial, part, validator, only_part, checkpoint)
+                return
+            except Exception as exc:
+                info = self._transport.failure_info(exc)
+                delay = None
+                if info is not None and self.retry is not None:
+                    delay = self.retry.next_delay(attempt, info[0], info[1], idempotent=True)
+                if delay is None:
+                    raise
+                checkpoint()
+                attempt += 1
+                await asyncio.sleep(delay)
+
+    async def _stream_part(self, url, partial, part, validator, only_part, checkpoint) -> None:
+        headers = {"Accept-Encoding": "identity"}
+        offset = part.start + part.done
+        if offset > 0 or part.end is not None and not only_part:
+            headers["Range"] = f"bytes={offset}-{'' if part.end is None else part.end}"
+            if validator:
+                headers["If-Range"] = validator
+
+        async with self._connections:
+            async with self._transport.stream(url, headers, self.chunk_size) as (status, chunks):
+                if "Range" in headers and status != 206:
+                    if not only_part:
+                        raise _RangeIgnored(f"{url}: server ignored the range request", status)
+                    part.done = part.saved = offset = 0  # full body instead of the rest: start over
+                    with open(partial, "r+b") as f:
+                        f.truncate(0)
+                with open(partial, "r+b") as f:
+                    f.seek(offset)
+                    unsaved = 0
+                    try:
+                        async for chunk in chunks:
+                            if self.bandwidth is not None:
+                                await self.bandwidth.acquire(len(chunk))
+                            f.write(chunk)
+                            part.done += len(chunk)
+                            unsaved += len(chunk)
+                            if unsaved >= CHECKPOINT_BYTES:
+                                f.flush()
+                                part.saved = part.done
+                                checkpoint()
+                                unsaved = 0
+                    finally:
+                        f.flush()
+                        part.saved = part.done
+
+    async def _download_to_sink(self, url: str, sink: Any) -> int:
+        written = 0
+        async with self._connections:
+            async with self._transport.stream(url, {"Accept-Encoding": "identity"}, self.chunk_size) as (_, chunks):
+                async for chunk in chunks:
+                    if self.bandwidth is not None:
+                        await self.bandwidth.acquire(len(chunk))
+                    result = sink.write(chunk)
+                    if inspect.isawaitable(result):
+                        await result
+                    written += len(chunk)
+        return written
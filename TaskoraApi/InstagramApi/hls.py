@@ -0,0 +1,374 @@
+import asyncio
+import inspect
+import os
+import re
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Tuple, Union
+from urllib.parse import urljoin
+
+from ..core.errors import DownloadError
+from ..core.pool import PoolLimits
+from ..core.ratelimit import TokenBucket
+from ..core.resilience import DEFAULT_RESILIENCE, RetryPolicy
+from .downloader import _TRANSPORTS, Destination, extract_media_urls
+
+_ATTRIBUTE = re.compile(r'([A-Z0-9-]+)=("[^"]*"|[^,]*)')
+_IDENTITY = {"Accept-Encoding": "identity"}
+
+
+def _attributes(text: str) -> Dict[str, str]:
+    return {key: value.strip('"') for key, value in _ATTRIBUTE.findall(text)}
+
+
+@dataclass
+class Variant:
+    """
+    One rendition listed in a master playlist.
+
+    Attributes:
+        uri (str): Absolute URL of the variant's media playlist.
+        bandwidth (int): Peak bits per second (``BANDWIDTH``).
+        resolution (Tuple[int, int], optional): Width and height, if advertised.
+        codecs (str, optional): ``CODECS`` attribute.
+    """
+
+    uri: str
+    bandwidth: int = 0
+    resolution: Optional[Tuple[int, int]] = None
+    codecs: Optional[str] = None
+
+    @property
+    def height(self) -> int:
+        return self.resolution[1] if self.resolution else 0
+
+
+@dataclass
+class Segment:
+    """
+    One media segment (or the fMP4 initialization section).
+
+    Attributes:
+        uri (str): Absolute URL.
+        duration (float): Duration in seconds (0 for the init section).
+        byterange (Tuple[int, int], optional): ``(offset, length)`` within ``uri``.
+    """
+
+    uri: str
+    duration: float = 0.0
+    byterange: Optional[Tuple[int, int]] = None
+
+    def headers(self) -> Dict[str, str]:
+        if self.byterange is None:
+            return dict(_IDENTITY)
+        offset, length = self.byterange
+        return dict(_IDENTITY, Range=f"bytes={offset}-{offset + length - 1}")
+
+
+@dataclass
+class MasterPlaylist:
+    variants: List[Variant] = field(default_factory=list)
+
+
+@dataclass
+class MediaPlaylist:
+    """
+    A media playlist.
+
+    Attributes:
+        segments (List[Segment]): Segments in playback order.
+        init (Segment, optional): fMP4 initialization section (``EXT-X-MAP``).
+        ended (bool): Whether ``EXT-X-ENDLIST`` was present (VOD).
+    """
+
+    segments: List[Segment] = field(default_factory=list)
+    init: Optional[Segment] = None
+    ended: bool = False
+
+    @property
+    def duration(self) -> float:
+        return sum(segment.duration for segment in self.segments)
+
+
+def _byterange(value: str, previous_end: int) -> Tuple[int, int]:
+    length, _, offset = value.partition("@")
+    return (int(offset) if offset else previous_end), int(length)
+
+
+def parse_playlist(text: str, base_url: str = "") -> Union[MasterPlaylist, MediaPlaylist]:
+    """
+    Parse an m3u8 master or media playlist.
+
+    Args:
+        text (str): Playlist contents.
+        base_url (str): URL the playlist was loaded from; relative URIs resolve against it.
+
+    Returns:
+        MasterPlaylist | MediaPlaylist: Depending on whether ``EXT-X-STREAM-INF`` tags are present.
+
+    Raises:
+        DownloadError: If the text is not a playlist or its segments are encrypted.
+    """
+    lines = [line.strip() for line in text.splitlines() if line.strip()]
+    if not lines or not lines[0].startswith("#EXTM3U"):
+        raise DownloadError("not an m3u8 playlist")
+
+    master, media = MasterPlaylist(), MediaPlaylist()
+    pending_variant: Optional[Dict[str, str]] = None
+    duration: Optional[float] = None
+    byterange: Optional[Tuple[int, int]] = None
+    range_end = 0
+
+    for line in lines[1:]:
+        if line.startswith("#EXT-X-STREAM-INF:"):
+            pending_variant = _attributes(line.partition(":")[2])
+        elif line.startswith("#EXTINF:"):
+            duration = float(line.partition(":")[2].split(",")[0] or 0)
+        elif line.startswith("#EXT-X-BYTERANGE:"):
+            byterange = _byterange(line.partition(":")[2], range_end)
+        elif line.startswith("#EXT-X-MAP:"):
+            attrs = _attributes(line.partition(":")[2])
+            init_range = _byterange(attrs["BYTERANGE"], 0) if "BYTERANGE" in attrs else None
+            media.init = Segment(urljoin(base_url, attrs["URI"]), byterange=init_range)
+        elif line.startswith("#EXT-X-KEY:"):
+            method = _attributes(line.partition(":")[2]).get("METHOD", "NONE")
+            if method != "NONE":
+                raise DownloadError(f"encrypted HLS ({method}) is not supported")
+        elif line.startswith("#EXT-X-ENDLIST"):
+            media.ended = True
+        elif line.startswith("#"):
+            continue
+        elif pending_variant is not None:
+            resolution = None
+            if "x" in pending_variant.get("RESOLUTION", ""):
+                width, _, height = pending_variant["RESOLUTION"].partition("x")
+                resolution = (int(width), int(height))
+            master.variants.append(Variant(
+                urljoin(base_url, line),
+                int(pending_variant.get("BANDWIDTH", 0)),
+                resolution,
+                pending_variant.get("CODECS"),
+            ))
+            pending_variant = None
+        else:
+            media.segments.append(Segment(urljoin(base_url, line), duration or 0.0, byterange))
+            if byterange is not None:
+                range_end = byterange[0] + byterange[1]
+            duration = byterange = None
+
+    return master if master.variants else media
+
+
+def select_variant(
+    variants: List[Variant],
+    max_bandwidth: Optional[int] = None,
+    max_height: Optional[int] = None,
+) -> Variant:
+    """
+    Pick the best variant within the given limits.
+
+    Args:
+        variants (List[Variant]): Candidates from a master playlist.
+        max_bandwidth (int, optional): Highest acceptable ``BANDWIDTH`` in bits per second.
+        max_height (int, optional): Highest acceptable vertical resolution, e.g. 720.
+
+    Returns:
+        Variant: The highest resolution (then bandwidth) within the limits, or the smallest
+        variant if none fits.
+    """
+    if not variants:
+        raise DownloadError("master playlist lists no variants")
+    fitting = [
+        v for v in variants
+        if (max_bandwidth is None or v.bandwidth <= max_bandwidth)
+        and (max_height is None or not v.resolution or v.height <= max_height)
+    ]
+    if fitting:
+        return max(fitting, key=lambda v: (v.height, v.bandwidth))
+    return min(variants, key=lambda v: (v.bandwidth, v.height))
+
+
+def find_playlist_url(data: Any) -> Optional[str]:
+    """Return the playlist URL in a ``get_hls_stream`` response, preferring ``.m3u8`` URLs; strings pass through."""
+    if isinstance(data, str):
+        return data
+    urls = extract_media_urls(data, keys=("url", "hls_url", "playlist", "playlist_url", "manifest", "m3u8", "src"))
+    return next((url for url in urls if ".m3u8" in url), urls[0] if urls else None)
+
+
+@dataclass
+class HlsResult:
+    """
+    Outcome of one HLS download.
+
+    Attributes:
+        variant (Variant, optional): The chosen rendition, or None for a bare media playlist.
+        segments (int): Segments written, excluding the init section.
+        size (int): Bytes written.
+        duration (float): Media duration in seconds according to the playlist.
+        elapsed (float): Wall time in seconds.
+    """
+
+    variant: Optional[Variant]
+    segments: int
+    size: int
+    duration: float
+    elapsed: float
+
+
+class HlsDownloader:
+    """
+    Turns an HLS stream into a single file.
+
+    Resolves the master playlist, picks a variant, then fetches the segments of
+    its media playlist concurrently while writing them strictly in order. At
+    most ``window`` segments are in flight or waiting to be written, so memory
+    stays bounded by ``window`` times the segment size, however long the video.
+
+    Only VOD playlists are downloaded completely. For a live playlist the segments
+    listed at request time are fetched. Encrypted streams are rejected.
+    """
+
+    def __init__(
+        self,
+        backend: str = "aiohttp",
+        window: int = 8,
+        max_connections: int = 8,
+        bandwidth: Union[float, TokenBucket, None] = None,
+        retry: Optional[RetryPolicy] = DEFAULT_RESILIENCE.retry,
+        timeout: float = 60,
+    ):
+        """
+        Args:
+            backend (str): "aiohttp" or "httpx".
+            window (int): Segments fetched ahead of the writer (default: 8).
+            max_connections (int): Connection pool size (default: 8).
+            bandwidth (float | TokenBucket, optional): Byte rate limit, or a shared bucket.
+            retry (RetryPolicy, optional): Retries for failed segments; None disables them.
+            timeout (float): Request timeout in seconds (default: 60).
+        """
+        if backend not in _TRANSPORTS:
+            raise ValueError(f"Unknown backend {backend!r}; expected one of {', '.join(_TRANSPORTS)}.")
+        self.window = max(1, window)
+        if isinstance(bandwidth, (int, float)):
+            bandwidth = TokenBucket(rate=bandwidth, capacity=bandwidth)
+        self.bandwidth: Optional[TokenBucket] = bandwidth
+        self.retry = retry
+        limits = PoolLimits(max_connections=max_connections, max_connections_per_host=max_connections)
+        self._transport = _TRANSPORTS[backend](limits, timeout)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def load_playlist(self, url: str) -> Union[MasterPlaylist, MediaPlaylist]:
+        """Fetch and parse the playlist at ``url``."""
+        body = await self._fetch(Segment(url))
+        return parse_playlist(body.decode("utf-8"), url)
+
+    async def resolve(
+        self,
+        source: Any,
+        max_bandwidth: Optional[int] = None,
+        max_height: Optional[int] = None,
+    ) -> Tuple[Optional[Variant], MediaPlaylist]:
+        """
+        Resolve a playlist URL or ``get_hls_stream`` response to a media playlist.
+
+        Returns:
+            Tuple[Variant | None, MediaPlaylist]: The chosen variant and its media playlist.
+        """
+        url = find_playlist_url(source)
+        if url is None:
+            raise DownloadError("no m3u8 playlist URL found")
+        playlist = await self.load_playlist(url)
+        if isinstance(playlist, MediaPlaylist):
+            return None, playlist
+        variant = select_variant(playlist.variants, max_bandwidth, max_height)
+        media = await self.load_playlist(variant.uri)
+        if not isinstance(media, MediaPlaylist):
+            raise DownloadError("variant points at another master playlist")
+        return variant, media
+
+    async def download(
+        self,
+        source: Any,
+        dest: Destination,
+        max_bandwidth: Optional[int] = None,
+        max_height: Optional[int] = None,
+    ) -> HlsResult:
+        """
+        Download a stream into one file.
+
+        Args:
+            source (Any): Playlist URL, or the response of ``get_hls_stream``.
+            dest (str | PathLike | file-like): Output path, or an object with a sync or
+                async ``write`` method. A path is written via ``<path>.part`` and renamed
+                when complete.
+            max_bandwidth (int, optional): Variant limit in bits per second.
+            max_height (int, optional): Variant limit in pixels, e.g. 720.
+
+        Returns:
+            HlsResult: The chosen variant, segment count, size and timing.
+        """
+        started = time.monotonic()
+        variant, media = await self.resolve(source, max_bandwidth, max_height)
+        if isinstance(dest, (str, os.PathLike)):
+            path = os.fspath(dest)
+            with open(path + ".part", "wb") as f:
+                size = await self._write_segments(media, f)
+            os.replace(path + ".part", path)
+        else:
+            size = await self._write_segments(media, dest)
+        return HlsResult(variant, len(media.segments), size, media.duration, time.monotonic() - started)
+
+    async def close(self) -> None:
+        """Close the underlying HTTP session."""
+        await self._transport.close()
+
+    async def _write_segments(self, media: MediaPlaylist, sink: Any) -> int:
+        segments = ([media.init] if media.init else []) + media.segments
+        pending: Deque[asyncio.Future] = deque()
+        written = 0
+        try:
+            for segment in segments:
+                pending.append(asyncio.ensure_future(self._fetch(segment)))
+                if len(pending) < self.window:
+                    continue
+                written += await self._write(sink, await pending.popleft())
+            while pending:
+                written += await self._write(sink, await pending.popleft())
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        return written
+
+    @staticmethod
+    async def _write(sink: Any, data: bytes) -> int:
+        result = sink.write(data)
+        if inspect.isawaitable(result):
+            await result
+        return len(data)
+
+    async def _fetch(self, segment: Segment) -> bytes:
+        attempt = 0
+        while True:
+            try:
+                data = await self._transport.read(segment.uri, segment.headers())
+            except Exception as exc:
+                info = self._transport.failure_info(exc)
+                delay = None
+                if info is not None and self.retry is not None:
+                    delay = self.retry.next_delay(attempt, info[0], info[1], idempotent=True)
+                if delay is None:
+                    raise
+                attempt += 1
+                await asyncio.sleep(delay)
+                continue
+            if self.bandwidth is not None:
+                await self.bandwidth.acquire(len(data))
+            return data
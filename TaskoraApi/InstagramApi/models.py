@@ -0,0 +1,434 @@
+import json
+import re
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Type, TypeVar, Union
+
+from ..core.jsonlib import get_decoder, get_encoder
+
+M = TypeVar("M", bound="Model")
+
+_decode = get_decoder()
+_encode = get_encoder()
+_scan = json.JSONDecoder().raw_decode
+_whitespace = re.compile(r"[ \t\n\r]*")
+
+#: Keys under which list endpoints return their items, tried in order.
+_LIST_KEYS = ("items", "posts", "reels", "stories", "highlights", "results", "data")
+#: Keys under which single-entity endpoints may wrap their payload.
+_WRAPPER_KEYS = ("data", "user", "result")
+
+
+def _unwrap(data: Dict[str, Any]) -> Dict[str, Any]:
+    for key in _WRAPPER_KEYS:
+        inner = data.get(key)
+        if isinstance(inner, dict):
+            return inner
+    return data
+
+
+def _items(data: Any) -> List[Any]:
+    if isinstance(data, list):
+        return data
+    if not isinstance(data, dict):
+        return []
+    for key in _LIST_KEYS:
+        value = data.get(key)
+        if isinstance(value, list):
+            return value
+    inner = _unwrap(data)
+    return _items(inner) if inner is not data else []
+
+
+@lru_cache(maxsize=None)
+def _msgspec() -> Optional[Tuple[Callable, Callable, Callable, type]]:
+    """``(container, array, value)`` decoders and msgspec's ValidationError, or None without msgspec."""
+    try:
+        import msgspec
+    except ImportError:
+        return None
+    raw = msgspec.Raw
+    return (
+        msgspec.json.Decoder(Union[Dict[str, raw], List[raw]]).decode,
+        msgspec.json.Decoder(List[raw]).decode,
+        msgspec.json.Decoder().decode,
+        msgspec.ValidationError,
+    )
+
+
+@lru_cache(maxsize=None)
+def _fields_decoder(cls: type) -> Callable:
+    """msgspec decoder of an entity into a struct of ``cls.FIELDS`` only; other keys are skipped, not decoded."""
+    import msgspec
+
+    struct = msgspec.defstruct(f"{cls.__name__}Fields", [(name, Any, None) for name in cls.FIELDS])
+    return msgspec.json.Decoder(struct).decode
+
+
+def _opens(raw: Any, char: bytes) -> bool:
+    return memoryview(raw)[:1].tobytes() == char
+
+
+def _raw_items(body: Any, decoders: Tuple[Callable, Callable, Callable, type]) -> List[Any]:
+    """``_items`` of ``body`` as undecoded ``msgspec.Raw`` slices; containers are skipped over, not decoded."""
+    container, array, _, invalid = decoders
+    try:
+        node = container(body)
+    except invalid:
+        return []
+    if isinstance(node, list):
+        return node
+    for key in _LIST_KEYS:
+        value = node.get(key)
+        if value is not None and _opens(value, b"["):
+            return array(value)
+    for key in _WRAPPER_KEYS:
+        value = node.get(key)
+        if value is not None and _opens(value, b"{"):
+            return _raw_items(value, decoders)
+    return []
+
+
+# Without msgspec, the scanners below mirror ``_unwrap``/``_items`` on the undecoded text. Each
+# value is decoded exactly once by the stdlib's C scanner, which also reports
+# where it ends, so an entity's original JSON is sliced out instead of re-encoded.
+
+def _skip(text: str, pos: int) -> int:
+    return _whitespace.match(text, pos).end()
+
+
+def _members(text: str, pos: int, value: Callable[[str, int], int]) -> int:
+    """Walk the object at ``pos``; ``value(key, start)`` consumes each member value and returns its end."""
+    pos = _skip(text, pos + 1)
+    if text[pos:pos + 1] == "}":
+        return pos + 1
+    while True:
+        if text[pos:pos + 1] != '"':
+            raise json.JSONDecodeError("Expecting property name enclosed in double quotes", text, pos)
+        key, pos = _scan(text, pos)
+        pos = _skip(text, pos)
+        if text[pos:pos + 1] != ":":
+            raise json.JSONDecodeError("Expecting ':' delimiter", text, pos)
+        pos = _skip(text, value(key, _skip(text, pos + 1)))
+        if text[pos:pos + 1] == "}":
+            return pos + 1
+        if text[pos:pos + 1] != ",":
+            raise json.JSONDecodeError("Expecting ',' delimiter", text, pos)
+        pos = _skip(text, pos + 1)
+
+
+def _elements(text: str, pos: int) -> Tuple[List[Tuple[Any, str]], int]:
+    """Decode the array at ``pos`` into ``(value, source)`` pairs."""
+    elements = []
+    pos = _skip(text, pos + 1)
+    if text[pos:pos + 1] == "]":
+        return elements, pos + 1
+    while True:
+        value, end = _scan(text, pos)
+        elements.append((value, text[pos:end]))
+        pos = _skip(text, end)
+        if text[pos:pos + 1] == "]":
+            return elements, pos + 1
+        if text[pos:pos + 1] != ",":
+            raise json.JSONDecodeError("Expecting ',' delimiter", text, pos)
+        pos = _skip(text, pos + 1)
+
+
+def _source_items(text: str, pos: int) -> Tuple[List[Tuple[Any, str]], int]:
+    """``_items`` of the value at ``pos``, as ``(item, source)`` pairs."""
+    if text[pos:pos + 1] == "[":
+        return _elements(text, pos)
+    if text[pos:pos + 1] != "{":
+        return [], _scan(text, pos)[1]
+    lists: Dict[str, List[Tuple[Any, str]]] = {}
+    wrapped: Dict[str, List[Tuple[Any, str]]] = {}
+
+    def value(key: str, start: int) -> int:
+        if key in _LIST_KEYS and text[start:start + 1] == "[":
+            lists[key], end = _elements(text, start)
+        elif key in _WRAPPER_KEYS and text[start:start + 1] == "{":
+            wrapped[key], end = _source_items(text, start)
+        else:
+            end = _scan(text, start)[1]
+        return end
+
+    end = _members(text, pos, value)
+    for key in _LIST_KEYS:
+        if key in lists:
+            return lists[key], end
+    for key in _WRAPPER_KEYS:
+        if key in wrapped:
+            return wrapped[key], end
+    return [], end
+
+
+def _source_entity(text: str) -> Tuple[Any, str]:
+    """``_unwrap`` of a whole document, as ``(entity, source)``."""
+    pos = _skip(text, 0)
+    if text[pos:pos + 1] != "{":
+        return json.loads(text), text
+    top: Dict[str, Any] = {}
+    wrapped: Dict[str, Tuple[Any, str]] = {}
+
+    def value(key: str, start: int) -> int:
+        top[key], end = _scan(text, start)
+        if key in _WRAPPER_KEYS and isinstance(top[key], dict):
+            wrapped[key] = top[key], text[start:end]
+        return end
+
+    _finish(text, _members(text, pos, value))
+    for key in _WRAPPER_KEYS:
+        if key in wrapped:
+            return wrapped[key]
+    return top, text
+
+
+def _finish(text: str, end: int) -> None:
+    end = _skip(text, end)
+    if end != len(text):
+        raise json.JSONDecodeError("Extra data", text, end)
+
+
+def _text(body: Union[bytes, str]) -> str:
+    return body if isinstance(body, str) else bytes(body).decode("utf-8")
+
+
+class Model:
+    """
+    Compact, read-only view of an Instagram entity.
+
+    Frequently used scalar fields (``FIELDS``) live in ``__slots__``. The entity
+    itself, including all nested objects and lists, is kept as its compact JSON
+    ``bytes`` and decoded only when a field outside the slots is first read, so
+    a model costs a fraction of the dict it was built from.
+
+    Fields missing from the response are None. Other keys are reachable as
+    attributes (``post.owner``), by key (``post["owner"]``) or through
+    :attr:`extra`. The first such access decodes the blob and keeps the dict,
+    so later ones are free; :attr:`raw` returns the original entity.
+
+    :meth:`from_json`/:meth:`many_from_json` decode each entity once and keep
+    its JSON sliced from the response body (with msgspec, envelopes are only
+    skipped over); :meth:`from_dict` encodes an already decoded entity.
+    """
+
+    __slots__ = ("_json", "_decoded")
+
+    #: Response keys stored as attributes; subclasses extend this.
+    FIELDS: Tuple[str, ...] = ()
+
+    @classmethod
+    def _build(cls: Type[M], data: Dict[str, Any], source: bytes) -> M:
+        obj = cls.__new__(cls)
+        for name in cls.FIELDS:
+            value = data.get(name)
+            setattr(obj, name, None if isinstance(value, (dict, list)) else value)
+        obj._json = source
+        obj._decoded = None
+        return obj
+
+    @classmethod
+    def from_dict(cls: Type[M], data: Dict[str, Any]) -> M:
+        """
+        Build a model from one decoded entity.
+
+        Args:
+            data (Dict[str, Any]): The entity as returned by the API.
+
+        Returns:
+            Model: The compact model.
+        """
+        return cls._build(data, _encode(data))
+
+    @classmethod
+    def from_response(cls: Type[M], data: Dict[str, Any]) -> M:
+        """Build a model from a single-entity response, unwrapping ``data``/``user`` envelopes."""
+        return cls.from_dict(_unwrap(data))
+
+    @classmethod
+    def many_from_response(cls: Type[M], data: Any) -> List[M]:
+        """Build models from a list response (``items``, ``posts``, ``reels``, ... or a bare list)."""
+        return [cls.from_dict(item) for item in _items(data) if isinstance(item, dict)]
+
+    @classmethod
+    def from_json(cls: Type[M], body: Union[bytes, str]) -> M:
+        """Build a model from a single-entity response body, decoding it once."""
+        decoders = _msgspec()
+        if decoders is not None:
+            container, _, decode, invalid = decoders
+            try:
+                node = container(body)
+            except invalid:
+                node = None
+            if not isinstance(node, dict):
+                raise ValueError("expected a JSON object")
+            for key in _WRAPPER_KEYS:
+                value = node.get(key)
+                if value is not None and _opens(value, b"{"):
+                    source = bytes(value)
+                    return cls._build(decode(source), source)
+            source = body if isinstance(body, bytes) else body.encode("utf-8")
+            return cls._build(decode(source), source)
+        text = _text(body)
+        data, source = _source_entity(text)
+        if not isinstance(data, dict):
+            raise ValueError(f"expected a JSON object, got {type(data).__name__}")
+        return cls._build(data, body if source is text and isinstance(body, bytes) else source.encode("utf-8"))
+
+    @classmethod
+    def many_from_json(cls: Type[M], body: Union[bytes, str]) -> List[M]:
+        """Build models from a list response body, decoding every item once."""
+        decoders = _msgspec()
+        if decoders is not None:
+            fields, invalid = _fields_decoder(cls), decoders[3]
+            models = []
+            for raw in _raw_items(body, decoders):
+                try:
+                    struct = fields(raw)
+                except invalid:
+                    continue  # not an object
+                obj = cls.__new__(cls)
+                for name in cls.FIELDS:
+                    value = getattr(struct, name)
+                    setattr(obj, name, None if isinstance(value, (dict, list)) else value)
+                obj._json = bytes(raw)
+                obj._decoded = None
+                models.append(obj)
+            return models
+        text = _text(body)
+        pos = _skip(text, 0)
+        items, end = _source_items(text, pos)
+        _finish(text, end)
+        return [cls._build(item, source.encode("utf-8")) for item, source in items if isinstance(item, dict)]
+
+    def _data(self) -> Dict[str, Any]:
+        if self._decoded is None:
+            self._decoded = _decode(self._json)
+        return self._decoded
+
+    @property
+    def extra(self) -> Dict[str, Any]:
+        """Fields not stored as attributes."""
+        return {key: value for key, value in self._data().items()
+                if key not in self.FIELDS or getattr(self, key) is None}
+
+    @property
+    def raw(self) -> Dict[str, Any]:
+        """The full entity as a plain dict, exactly as received."""
+        return dict(self._data())
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self.FIELDS:
+            value = getattr(self, key)
+            if value is not None:
+                return value
+        return self._data()[key]
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for names that are not slots, i.e. the lazily decoded fields.
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self._data()[name]
+        except KeyError:
+            raise AttributeError(f"{type(self).__name__!r} has no field {name!r}") from None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data())
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._json == other._json or self._data() == other._data()
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        shown = ", ".join(
+            f"{name}={getattr(self, name)!r}" for name in self.FIELDS if getattr(self, name) is not None
+        )
+        return f"{type(self).__name__}({shown})"
+
+    def __getstate__(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self.FIELDS) + (self._json,)
+
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        for name, value in zip(self.FIELDS, state):
+            setattr(self, name, value)
+        self._json = state[-1]
+        self._decoded = None
+
+
+class Profile(Model):
+    """Instagram user profile (``get_profile`` / ``get_user_info``)."""
+
+    __slots__ = (
+        "id",
+        "pk",
+        "username",
+        "full_name",
+        "biography",
+        "follower_count",
+        "following_count",
+        "media_count",
+        "is_private",
+        "is_verified",
+        "is_business",
+        "profile_pic_url",
+        "external_url",
+    )
+    FIELDS = __slots__
+
+
+class Media(Model):
+    """Fields shared by posts, reels and stories."""
+
+    __slots__ = (
+        "id",
+        "pk",
+        "code",
+        "shortcode",
+        "taken_at",
+        "media_type",
+        "is_video",
+        "like_count",
+        "comment_count",
+        "caption_text",
+        "display_url",
+        "thumbnail_url",
+        "video_url",
+    )
+    FIELDS = __slots__
+
+
+class Post(Media):
+    """Feed post (``get_posts``)."""
+
+    __slots__ = ()
+
+
+class Reel(Media):
+    """Reel (``get_reels``)."""
+
+    __slots__ = ("play_count", "view_count", "video_duration")
+    FIELDS = Media.FIELDS + __slots__
+
+
+class Story(Media):
+    """Story item (``get_stories``, ``get_story``, ``get_highlight_stories``)."""
+
+    __slots__ = ("expiring_at",)
+    FIELDS = Media.FIELDS + __slots__
+
+
+class Highlight(Model):
+    """Highlight reel summary (``get_highlights``)."""
+
+    __slots__ = ("id", "title", "media_count", "created_at", "cover_url")
+    FIELDS = __slots__
+
@@ -1,22 +1,55 @@
-import requests
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Iterable, Iterator, List, Type
 
-class RequestsInstagramAPI:
+from ..core.requests_base import RequestsBaseClient
+from ..core.bulk import BulkResult, threaded_gather
+from ..core.cache import ResponseCache
+from ..core.pool import PoolLimits
+from ..core.ratelimit import TokenBucket
+from ..core.resilience import ResiliencePolicy
+from .models import Highlight, Model, Post, Profile, Reel, Story
+
+
+class RequestsInstagramAPI(RequestsBaseClient):
     """
     A client wrapper for the FastAPI-based Instagram API hosted at taskora.onrender.com using requests.
+
+    Connections are pooled and kept alive between calls. Use the client as a
+    context manager, or call ``close()`` when done.
     """
 
-    def __init__(self, apikey: str, timeout: int = 60):
+    native_errors = True
+    key_status_method = "validate_key"
+    status_endpoint = "status"
+
+    def __init__(
+        self,
+        apikey: str,
+        timeout: int = 60,
+        limits: Optional[PoolLimits] = None,
+        cache: Optional[ResponseCache] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        resilience: Optional[ResiliencePolicy] = None,
+    ):
         """
         Initialize the API wrapper.
 
         Args:
             apikey (str): Your API key for authenticating with the backend.
             timeout (int): Request timeout in seconds (default: 60).
-        """
+            limits (PoolLimits, optional): Connection pool size, per-host limit and idle expiry.
+            cache (ResponseCache, optional): Serve repeated lookups from memory with
+                per-endpoint TTLs and stale-while-revalidate, or pass a ``DiskCache`` to keep
+                them across restarts. Key validation is never cached.
+            rate_limiter (TokenBucket, optional): Client-side rate limit every request waits on;
+                may be shared across clients (see ``TokenBucket.shared``).
+            resilience (ResiliencePolicy, optional): Retry policy and circuit breaker;
+                transient failures of idempotent calls are retried by default.
+        """
+        super().__init__("https://taskora.onrender.com/api/v1/", timeout, limits)
         self.apikey = apikey
-        self.timeout = timeout
-        self.base_url = "https://taskora.onrender.com/api/v1/"
+        self.rate_limiter = rate_limiter
+        self.resilience = resilience or self.resilience
+        self.cache = cache
 
     def _get(self, endpoint: str, url_param: str) -> Dict[str, Any]:
         """
@@ -29,13 +62,7 @@ class RequestsInstagramAPI:
         Returns:
             Dict[str, Any]: JSON response from the API.
         """
-        response = requests.get(
-            self.base_url + endpoint,
-            params={"apikey": self.apikey, "url": url_param},
-            timeout=self.timeout
-        )
-        response.raise_for_status()
-        return response.json()
+        return self._request("GET", endpoint, {"apikey": self.apikey, "url": url_param}, cached=True)
 
     def _post(self, endpoint: str, query_params: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -49,13 +76,27 @@ class RequestsInstagramAPI:
             Dict[str, Any]: JSON response from the API.
         """
         params = {"apikey": self.apikey, **query_params}
-        response = requests.post(
-            self.base_url + endpoint,
-            params=params,
-            timeout=self.timeout
-        )
-        response.raise_for_status()
-        return response.json()
+        return self._request("POST", endpoint, params, cached=True, idempotent=True)
+
+    def _post_models(self, endpoint: str, query_params: Dict[str, Any], model: Type[Model], many: bool) -> Any:
+        """
+        Like ``_post``, but build :class:`Model` instances straight from the response bytes.
+
+        Args:
+            endpoint (str): API endpoint path.
+            query_params (Dict[str, Any]): Dictionary of query parameters.
+            model (Type[Model]): Model class to build.
+            many (bool): The response is a list of entities rather than one.
+
+        Returns:
+            Model | List[Model]: The model, or one model per entity.
+        """
+        params = {"apikey": self.apikey, **query_params}
+        if many:
+            decode, convert = model.many_from_json, model.many_from_response
+        else:
+            decode, convert = model.from_json, model.from_response
+        return self._request_decoded("POST", endpoint, params, decode, convert, idempotent=True)
 
     # ----------- GET Endpoints ------------
 
@@ -205,6 +246,122 @@ class RequestsInstagramAPI:
         """
         return self._post("posts", {"username": username})
 
+    # ----------- Bulk Endpoints ------------
+
+    def get_profiles_many(self, usernames: Iterable[str], concurrency: int = 10) -> Iterator[BulkResult]:
+        """
+        Fetch profile information for many users on a thread pool, yielding results as they complete.
+
+        Args:
+            usernames (Iterable[str]): Instagram usernames, consumed lazily.
+            concurrency (int): Number of worker threads (default: 10).
+
+        Returns:
+            Iterator[BulkResult]: One result per username; check ``ok`` before using ``value``.
+        """
+        return threaded_gather(self.get_profile, usernames, concurrency)
+
+    def get_user_infos_many(self, usernames: Iterable[str], concurrency: int = 10) -> Iterator[BulkResult]:
+        """
+        Retrieve basic profile information for many users on a thread pool, yielding results as they complete.
+
+        Args:
+            usernames (Iterable[str]): Instagram usernames, consumed lazily.
+            concurrency (int): Number of worker threads (default: 10).
+
+        Returns:
+            Iterator[BulkResult]: One result per username; check ``ok`` before using ``value``.
+        """
+        return threaded_gather(self.get_user_info, usernames, concurrency)
+
+    def get_posts_many(self, usernames: Iterable[str], concurrency: int = 10) -> Iterator[BulkResult]:
+        """
+        Retrieve recent posts for many users on a thread pool, yielding results as they complete.
+
+        Args:
+            usernames (Iterable[str]): Instagram usernames, consumed lazily.
+            concurrency (int): Number of worker threads (default: 10).
+
+        Returns:
+            Iterator[BulkResult]: One result per username; check ``ok`` before using ``value``.
+        """
+        return threaded_gather(self.get_posts, usernames, concurrency)
+
+    def get_reels_many(self, usernames: Iterable[str], concurrency: int = 10) -> Iterator[BulkResult]:
+        """
+        Fetch public reels for many users on a thread pool, yielding results as they complete.
+
+        Args:
+            usernames (Iterable[str]): Instagram usernames, consumed lazily.
+            concurrency (int): Number of worker threads (default: 10).
+
+        Returns:
+            Iterator[BulkResult]: One result per username; check ``ok`` before using ``value``.
+        """
+        return threaded_gather(self.get_reels, usernames, concurrency)
+
+    # ----------- Typed Endpoints ------------
+
+    def get_profile_model(self, username: str) -> Profile:
+        """
+        Fetch a user's profile as a compact :class:`Profile`.
+
+        Args:
+            username (str): Instagram username.
+
+        Returns:
+            Profile: Typed profile; ``raw`` returns the original dict.
+        """
+        return self._post_models("profile", {"username": username}, Profile, False)
+
+    def get_posts_models(self, username: str) -> List[Post]:
+        """
+        Retrieve recent posts for a user as compact :class:`Post` models.
+
+        Args:
+            username (str): Instagram username.
+
+        Returns:
+            List[Post]: One model per post; nested fields are decoded on access.
+        """
+        return self._post_models("posts", {"username": username}, Post, True)
+
+    def get_reels_models(self, username: str) -> List[Reel]:
+        """
+        Fetch a user's public reels as compact :class:`Reel` models.
+
+        Args:
+            username (str): Instagram username.
+
+        Returns:
+            List[Reel]: One model per reel; nested fields are decoded on access.
+        """
+        return self._post_models("reels", {"username": username}, Reel, True)
+
+    def get_stories_models(self, username: str) -> List[Story]:
+        """
+        Retrieve a user's active stories as compact :class:`Story` models.
+
+        Args:
+            username (str): Instagram username.
+
+        Returns:
+            List[Story]: One model per story item; nested fields are decoded on access.
+        """
+        return self._post_models("stories", {"username": username}, Story, True)
+
+    def get_highlights_models(self, username: str) -> List[Highlight]:
+        """
+        Fetch a user's highlight reels as compact :class:`Highlight` models.
+
+        Args:
+            username (str): Instagram username.
+
+        Returns:
+            List[Highlight]: One model per highlight.
+        """
+        return self._post_models("highlights", {"username": username}, Highlight, True)
+
     # ----------- API Key Validation (Optional) ------------
 
     def validate_key(self) -> Dict[str, Any]:
@@ -214,10 +371,4 @@ class RequestsInstagramAPI:
         Returns:
             Dict[str, Any]: API key status, rate limits, and expiry.
         """
-        response = requests.get(
-            self.base_url + "instagram/validate_key",
-            params={"apikey": self.apikey},
-            timeout=self.timeout
-        )
-        response.raise_for_status()
-        return response.json()
+        return self._request("GET", "instagram/validate_key", {"apikey": self.apikey})
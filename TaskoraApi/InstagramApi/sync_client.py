@@ -0,0 +1,16 @@
+from ..core.background import SyncFacade
+
+
+class SyncInstagramAPI(SyncFacade):
+    """
+    Blocking Instagram client running the async client on a shared background event loop.
+
+    Takes the same arguments as ``AiohttpInstagramAPI`` plus ``backend`` ("aiohttp" or
+    "httpx"). Methods block like the ``Requests`` client's, but ``submit()`` and
+    ``map()`` run many calls concurrently over one connection pool (see :class:`SyncClient`).
+    """
+
+    BACKENDS = {
+        "aiohttp": "..InstagramApi.aiohttp_client:AiohttpInstagramAPI",
+        "httpx": "..InstagramApi.httpx_client:HttpxInstagramAPI",
+    }
@@ -1,6 +1,10 @@
-from .aiohttp_client import AiohttpQuizAPI
-from .httpx_client import HttpxQuizAPI
-from .requests_client import RequestQuizAPI
+from ..core.lazy import lazy_exports
 
-__all__ = ["AiohttpQuizAPI", "HttpxQuizAPI", "RequestQuizAPI"]
+__all__ = ["AiohttpQuizAPI", "HttpxQuizAPI", "RequestQuizAPI", "SyncQuizAPI"]
 
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "AiohttpQuizAPI": ".aiohttp_client",
+    "HttpxQuizAPI": ".httpx_client",
+    "RequestQuizAPI": ".requests_client",
+    "SyncQuizAPI": ".sync_client",
+})
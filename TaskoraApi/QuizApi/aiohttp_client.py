@@ -1,45 +1,40 @@
-import aiohttp
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Iterable, AsyncIterator
 
+from ..core.aiohttp_base import AiohttpBaseClient
+from ..core.pool import PoolLimits
+from ..core.ratelimit import TokenBucket
+from ..core.resilience import ResiliencePolicy
+from .prefetch import MAX_QUIZ_SIZE, QUIZ_CATEGORIES, AsyncQuizPrefetcher
 
-class AiohttpQuizAPI:
+
+class AiohttpQuizAPI(AiohttpBaseClient):
     """
     Asynchronous client for interacting with the Quiz API.
     """
 
-    def __init__(self, apikey: str):
+    key_status_method = "is_key_validate"
+
+    def __init__(
+        self,
+        apikey: str,
+        timeout: int = 60,
+        limits: Optional[PoolLimits] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        resilience: Optional[ResiliencePolicy] = None,
+    ):
+        super().__init__("https://taskora.onrender.com", timeout, limits)
         self.apikey = apikey
-        self.base_url = "https://taskora.onrender.com"
-        self.session: Optional[aiohttp.ClientSession] = None
-
-    async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
-        return self
-
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self.close()
-
-    async def _ensure_session(self):
-        if self.session is None or self.session.closed:
-            self.session = aiohttp.ClientSession()
+        self.rate_limiter = rate_limiter
+        self.resilience = resilience or self.resilience
+        self.prefetcher: Optional[AsyncQuizPrefetcher] = None
 
     async def _get(self, endpoint: str, params: Optional[Dict] = None) -> dict:
-        await self._ensure_session()
-        url = f"{self.base_url}{endpoint}"
-
-        async with self.session.get(url, params=params) as response:
-            if response.status != 200:
-                try:
-                    error_data = await response.json()
-                except Exception:
-                    error_data = await response.text()
-                raise Exception(f"API Error: {response.status} - {error_data}")
-            return await response.json()
+        return await self._request("GET", endpoint, params)
 
     
     async def get_collections_info(self) -> dict:
-        """Fetch all quiz collections and the number of questions in each."""
-        return await self._get("/api/v1/quiz/collections")
+        """Fetch all quiz collections and the number of questions in each; cached when ``self.cache`` is set."""
+        return await self._request("GET", "/api/v1/quiz/collections", cached=True)
 
 
     async def check_status(self) -> dict:
@@ -54,10 +49,22 @@ class AiohttpQuizAPI:
         """Fetch author details and API metadata."""
         return await self._get("/api/v1/author")
 
+    async def _fetch_quiz(self, category: str, size: int) -> List[dict]:
+        params = {
+            "apikey": self.apikey,
+            "QuizType": category,
+            "size": size
+        }
+        # Every call draws fresh random questions, so concurrent calls must not be coalesced.
+        data = await self._request("GET", "/api/v1/quiz", params, idempotent=False)
+        return data.get("questions", [])
+
     async def _get_quiz(self, category: str, size: int = 1) -> List[dict]:
         """
         Retrieve quiz questions for a specific category.
 
+        Served from the prefetch buffer when prefetching is enabled.
+
         Args:
             category (str): The quiz category name (e.g., 'Python').
             size (int): Number of questions to retrieve (1 to 15).
@@ -65,16 +72,58 @@ class AiohttpQuizAPI:
         Returns:
             List[dict]: A list of quiz questions.
         """
-        if not 1 <= size <= 15:
+        if not 1 <= size <= MAX_QUIZ_SIZE:
             raise ValueError("Quiz size must be between 1 and 15.")
 
-        params = {
-            "apikey": self.apikey,
-            "QuizType": category,
-            "size": size
-        }
-        data = await self._get("/api/v1/quiz", params)
-        return data.get("questions", [])
+        if self.prefetcher is not None:
+            return await self.prefetcher.get(category, size)
+        return await self._fetch_quiz(category, size)
+
+    async def enable_prefetch(
+        self,
+        categories: Iterable[str] = QUIZ_CATEGORIES,
+        low_water: int = 5,
+        high_water: int = 30,
+    ) -> AsyncQuizPrefetcher:
+        """
+        Keep per-category question buffers filled in the background.
+
+        Afterwards the ``get_*_quiz`` methods return from memory, and buffers
+        below ``low_water`` are topped up to ``high_water`` by a background task.
+
+        Args:
+            categories (Iterable[str]): Categories to keep warm (default: all).
+            low_water (int): Refill threshold (default: 5).
+            high_water (int): Buffer target size (default: 30).
+
+        Returns:
+            AsyncQuizPrefetcher: The prefetcher, exposing ``buffers`` and ``last_error``.
+        """
+        if self.prefetcher is not None:
+            self.prefetcher.close()
+        self.prefetcher = AsyncQuizPrefetcher(self._fetch_quiz, categories, low_water, high_water)
+        self.prefetcher.start()
+        return self.prefetcher
+
+    async def stream_quiz(self, category: str) -> AsyncIterator[dict]:
+        """
+        Yield questions from a category one at a time, indefinitely.
+
+        Args:
+            category (str): The quiz category name (e.g., 'Python').
+
+        Yields:
+            dict: A quiz question. Stops only if the API returns no questions.
+        """
+        while True:
+            if self.prefetcher is not None:
+                batch = await self.prefetcher.get(category, 1)
+            else:
+                batch = await self._fetch_quiz(category, MAX_QUIZ_SIZE)
+            if not batch:
+                return
+            for question in batch:
+                yield question
 
     # Public quiz methods for each category
     async def get_anime_quiz(self, size: int = 1) -> List[dict]:
@@ -99,6 +148,7 @@ class AiohttpQuizAPI:
         return await self._get_quiz("C", size)
 
     async def close(self):
-        """Close the aiohttp session."""
-        if self.session and not self.session.closed:
-            await self.session.close()
+        """Stop prefetching and close the pooled connections."""
+        if self.prefetcher is not None:
+            self.prefetcher.close()
+        await super().close()
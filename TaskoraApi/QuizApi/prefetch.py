@@ -0,0 +1,180 @@
+import asyncio
+import threading
+from collections import deque
+from typing import Awaitable, Callable, Deque, Dict, Iterable, List, Optional
+
+QUIZ_CATEGORIES = ("Anime", "Games", "WorldCapital", "Python", "Biology", "Cpp", "C")
+MAX_QUIZ_SIZE = 15
+
+
+class AsyncQuizPrefetcher:
+    """
+    Per-category question buffers refilled in the background.
+
+    Whenever a buffer drops below ``low_water`` a single refill task tops it up
+    to ``high_water`` in batches of at most 15, so reads are usually served
+    straight from memory. A read that finds its buffer short waits for the
+    running refill instead of issuing its own request.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[str, int], Awaitable[List[dict]]],
+        categories: Iterable[str] = QUIZ_CATEGORIES,
+        low_water: int = 5,
+        high_water: int = 30,
+    ):
+        """
+        Args:
+            fetch (Callable): Coroutine function ``(category, size) -> questions`` hitting the API.
+            categories (Iterable[str]): Categories to keep warm (default: all).
+            low_water (int): Refill when a buffer holds fewer questions than this (default: 5).
+            high_water (int): Refill up to this many questions (default: 30).
+        """
+        if not 0 <= low_water <= high_water or high_water < 1:
+            raise ValueError("Expected 0 <= low_water <= high_water and high_water >= 1.")
+        self._fetch = fetch
+        self.low_water = low_water
+        self.high_water = high_water
+        self.buffers: Dict[str, Deque[dict]] = {category: deque() for category in categories}
+        self._refills: Dict[str, asyncio.Task] = {}
+        self.last_error: Optional[BaseException] = None
+
+    def start(self) -> None:
+        """Begin filling every buffer in the background."""
+        for category in self.buffers:
+            self._schedule(category)
+
+    def _schedule(self, category: str) -> asyncio.Task:
+        task = self._refills.get(category)
+        if task is None or task.done():
+            task = asyncio.ensure_future(self._refill(category))
+            task.add_done_callback(self._record_error)
+            self._refills[category] = task
+        return task
+
+    def _record_error(self, task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            self.last_error = task.exception()
+
+    async def _refill(self, category: str) -> None:
+        buffer = self.buffers[category]
+        while len(buffer) < self.high_water:
+            batch = await self._fetch(category, min(MAX_QUIZ_SIZE, self.high_water - len(buffer)))
+            if not batch:
+                return
+            buffer.extend(batch)
+
+    async def get(self, category: str, size: int = 1) -> List[dict]:
+        """
+        Take ``size`` questions from the category's buffer, waiting for a refill if it runs short.
+
+        Returns fewer than ``size`` questions only if the API returns none.
+        """
+        buffer = self.buffers.setdefault(category, deque())
+        while len(buffer) < size:
+            before = len(buffer)
+            if before >= self.high_water:
+                # Refills stop at ``high_water``; fetch the rest of a larger read directly.
+                buffer.extend(await self._fetch(category, min(MAX_QUIZ_SIZE, size - before)))
+            else:
+                await asyncio.shield(self._schedule(category))
+            if len(buffer) == before:
+                break
+        questions = [buffer.popleft() for _ in range(min(size, len(buffer)))]
+        if len(buffer) < self.low_water:
+            self._schedule(category)
+        return questions
+
+    def close(self) -> None:
+        """Stop all background refills."""
+        for task in self._refills.values():
+            task.cancel()
+
+
+class QuizPrefetcher:
+    """
+    Thread-backed counterpart of :class:`AsyncQuizPrefetcher` for the blocking client.
+
+    One daemon thread refills buffers that dropped below ``low_water``. A read
+    that finds its buffer short fetches the missing questions itself.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[str, int], List[dict]],
+        categories: Iterable[str] = QUIZ_CATEGORIES,
+        low_water: int = 5,
+        high_water: int = 30,
+    ):
+        """
+        Args:
+            fetch (Callable): Function ``(category, size) -> questions`` hitting the API.
+            categories (Iterable[str]): Categories to keep warm (default: all).
+            low_water (int): Refill when a buffer holds fewer questions than this (default: 5).
+            high_water (int): Refill up to this many questions (default: 30).
+        """
+        if not 0 <= low_water <= high_water or high_water < 1:
+            raise ValueError("Expected 0 <= low_water <= high_water and high_water >= 1.")
+        self._fetch = fetch
+        self.low_water = low_water
+        self.high_water = high_water
+        self.buffers: Dict[str, Deque[dict]] = {category: deque() for category in categories}
+        self.last_error: Optional[BaseException] = None
+        self._pending: Deque[str] = deque()
+        self._wakeup = threading.Condition()
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the refill thread and queue every category for filling."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="TaskoraApi-quiz-prefetch", daemon=True)
+            self._thread.start()
+        for category in list(self.buffers):
+            self._schedule(category)
+
+    def _schedule(self, category: str) -> None:
+        with self._wakeup:
+            if category not in self._pending:
+                self._pending.append(category)
+                self._wakeup.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._wakeup:
+                while not self._pending and not self._closed:
+                    self._wakeup.wait()
+                if self._closed:
+                    return
+                category = self._pending.popleft()
+            buffer = self.buffers[category]
+            try:
+                while len(buffer) < self.high_water and not self._closed:
+                    batch = self._fetch(category, min(MAX_QUIZ_SIZE, self.high_water - len(buffer)))
+                    if not batch:
+                        break
+                    buffer.extend(batch)
+            except Exception as exc:
+                self.last_error = exc
+
+    def get(self, category: str, size: int = 1) -> List[dict]:
+        """Take ``size`` questions from the category's buffer, fetching any shortfall directly."""
+        buffer = self.buffers.setdefault(category, deque())
+        questions = []
+        while len(questions) < size:
+            try:
+                questions.append(buffer.popleft())
+            except IndexError:
+                break
+        if len(questions) < size:
+            questions.extend(self._fetch(category, size - len(questions)))
+        if len(buffer) < self.low_water:
+            self._schedule(category)
+        return questions
+
+    def close(self) -> None:
+        """Stop the refill thread."""
+        with self._wakeup:
+            self._closed = True
+            self._wakeup.notify_all()
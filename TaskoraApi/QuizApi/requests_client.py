@@ -1,29 +1,35 @@
-import requests
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Iterable, Iterator
 
+from ..core.requests_base import RequestsBaseClient
+from ..core.pool import PoolLimits
+from ..core.ratelimit import TokenBucket
+from ..core.resilience import ResiliencePolicy
+from .prefetch import MAX_QUIZ_SIZE, QUIZ_CATEGORIES, QuizPrefetcher
 
-class RequestQuizAPI:
+
+class RequestQuizAPI(RequestsBaseClient):
     """
     Synchronous client for interacting with the Quiz API using `requests`.
     """
 
-    def __init__(self, apikey: str):
+    key_status_method = "is_key_validate"
+
+    def __init__(
+        self,
+        apikey: str,
+        timeout: int = 60,
+        limits: Optional[PoolLimits] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        resilience: Optional[ResiliencePolicy] = None,
+    ):
+        super().__init__("https://taskora.onrender.com", timeout, limits)
         self.apikey = apikey
-        self.base_url = "https://taskora.onrender.com"
-        self.session = requests.Session()
+        self.rate_limiter = rate_limiter
+        self.resilience = resilience or self.resilience
+        self.prefetcher: Optional[QuizPrefetcher] = None
 
     def _get(self, endpoint: str, params: Optional[Dict] = None) -> dict:
-        url = f"{self.base_url}{endpoint}"
-        response = self.session.get(url, params=params, timeout=60)
-
-        if response.status_code != 200:
-            try:
-                error_data = response.json()
-            except Exception:
-                error_data = response.text
-            raise Exception(f"API Error: {response.status_code} - {error_data}")
-
-        return response.json()
+        return self._request("GET", endpoint, params)
 
     def check_status(self) -> dict:
         """Check the overall API status."""
@@ -37,10 +43,21 @@ class RequestQuizAPI:
         """Fetch author details and API metadata."""
         return self._get("/api/v1/author")
 
+    def _fetch_quiz(self, category: str, size: int) -> List[dict]:
+        params = {
+            "apikey": self.apikey,
+            "QuizType": category,
+            "size": size
+        }
+        data = self._get("/api/v1/quiz", params)
+        return data.get("questions", [])
+
     def _get_quiz(self, category: str, size: int = 1) -> List[dict]:
         """
         Retrieve quiz questions for a specific category.
 
+        Served from the prefetch buffer when prefetching is enabled.
+
         Args:
             category (str): The quiz category name (e.g., 'Python').
             size (int): Number of questions to retrieve (1 to 15).
@@ -48,20 +65,61 @@ class RequestQuizAPI:
         Returns:
             List[dict]: A list of quiz questions.
         """
-        if not 1 <= size <= 15:
+        if not 1 <= size <= MAX_QUIZ_SIZE:
             raise ValueError("Quiz size must be between 1 and 15.")
 
-        params = {
-            "apikey": self.apikey,
-            "QuizType": category,
-            "size": size
-        }
-        data = self._get("/api/v1/quiz", params)
-        return data.get("questions", [])
+        if self.prefetcher is not None:
+            return self.prefetcher.get(category, size)
+        return self._fetch_quiz(category, size)
+
+    def enable_prefetch(
+        self,
+        categories: Iterable[str] = QUIZ_CATEGORIES,
+        low_water: int = 5,
+        high_water: int = 30,
+    ) -> QuizPrefetcher:
+        """
+        Keep per-category question buffers filled in the background.
+
+        Afterwards the ``get_*_quiz`` methods return from memory, and buffers
+        below ``low_water`` are topped up to ``high_water`` by a background thread.
+
+        Args:
+            categories (Iterable[str]): Categories to keep warm (default: all).
+            low_water (int): Refill threshold (default: 5).
+            high_water (int): Buffer target size (default: 30).
+
+        Returns:
+            QuizPrefetcher: The prefetcher, exposing ``buffers`` and ``last_error``.
+        """
+        if self.prefetcher is not None:
+            self.prefetcher.close()
+        self.prefetcher = QuizPrefetcher(self._fetch_quiz, categories, low_water, high_water)
+        self.prefetcher.start()
+        return self.prefetcher
+
+    def stream_quiz(self, category: str) -> Iterator[dict]:
+        """
+        Yield questions from a category one at a time, indefinitely.
+
+        Args:
+            category (str): The quiz category name (e.g., 'Python').
+
+        Yields:
+            dict: A quiz question. Stops only if the API returns no questions.
+        """
+        while True:
+            if self.prefetcher is not None:
+                batch = self.prefetcher.get(category, 1)
+            else:
+                batch = self._fetch_quiz(category, MAX_QUIZ_SIZE)
+            if not batch:
+                return
+            yield from batch
 
     def get_collections_info(self) -> dict:
-        """Fetch all quiz collections and the number of questions in each."""
-        return self._get("/api/v1/quiz/collections")
+        """Fetch all quiz collections and the number of questions in each; cached when ``self.cache`` is set."""
+        return self._request("GET", "/api/v1/quiz/collections", cached=True)
 
     # Public quiz methods for each category
     def get_anime_quiz(self, size: int = 1) -> List[dict]:
@@ -86,5 +144,7 @@ class RequestQuizAPI:
         return self._get_quiz("C", size)
 
     def close(self):
-        """Close the requests session."""
-        self.session.close()
+        """Stop prefetching and close the pooled connections."""
+        if self.prefetcher is not None:
+            self.prefetcher.close()
+        super().close()
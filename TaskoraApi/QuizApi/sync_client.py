@@ -0,0 +1,16 @@
+from ..core.background import SyncFacade
+
+
+class SyncQuizAPI(SyncFacade):
+    """
+    Blocking Quiz client running the async client on a shared background event loop.
+
+    Takes the same arguments as ``AiohttpQuizAPI`` plus ``backend`` ("aiohttp" or
+    "httpx"). Methods block like the ``Requests`` client's, but ``submit()`` and
+    ``map()`` run many calls concurrently over one connection pool (see :class:`SyncClient`).
+    """
+
+    BACKENDS = {
+        "aiohttp": "..QuizApi.aiohttp_client:AiohttpQuizAPI",
+        "httpx": "..QuizApi.httpx_client:HttpxQuizAPI",
+    }
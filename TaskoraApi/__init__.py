@@ -7,35 +7,28 @@ __DISCORD__ = "https://discord.com/invite/wMkKzGtAuQ"
 __GITHUB__ = "https://github.com/taskorabot/TaskoraApi.git"
 
 
-from .InstagramApi.aiohttp_client import AiohttpInstagramAPI
-from .InstagramApi.httpx_client import HttpxInstagramAPI
-from .InstagramApi.requests_client import RequestsInstagramAPI
-from .QuizApi.aiohttp_client import AiohttpQuizAPI
-from .QuizApi.httpx_client import HttpxQuizAPI
-from .QuizApi.requests_client import RequestQuizAPI
-from .reCaptchaV3Solver.client import AiohttpreChaptchaAPI
-from .reCaptchaV3Solver.client import HttpxreChaptchaAPI
-from .reCaptchaV3Solver.client import RequestsreChaptchaAPI
-from .chatBot.client import AiohttpChatbotAPI
-from .chatBot.client import HttpxChatbotAPI
-from .chatBot.client import RequestsChatbotAPI
+import os
 
-from json import loads
-from requests import get
+from .core.lazy import lazy_exports
 
 __all__ = [
     "AiohttpInstagramAPI",
     "HttpxInstagramAPI",
     "RequestsInstagramAPI",
+    "SyncInstagramAPI",
     "AiohttpQuizAPI",
     "HttpxQuizAPI",
     "RequestQuizAPI",
+    "SyncQuizAPI",
     "AiohttpreChaptchaAPI",
     "HttpxreChaptchaAPI",
     "RequestsreChaptchaAPI",
+    "SyncreChaptchaAPI",
     "AiohttpChatbotAPI",
     "HttpxChatbotAPI",
     "RequestsChatbotAPI",
+    "SyncChatbotAPI",
+    "check_for_update",
     "__VERSION__",
     "__AUTHOR__",
     "__EMAIL__",
@@ -44,9 +37,29 @@ __all__ = [
     "__GITHUB__"
 ]
 
+# Clients are imported on first access, so only the backend you use gets loaded.
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "AiohttpInstagramAPI": ".InstagramApi.aiohttp_client",
+    "HttpxInstagramAPI": ".InstagramApi.httpx_client",
+    "RequestsInstagramAPI": ".InstagramApi.requests_client",
+    "SyncInstagramAPI": ".InstagramApi.sync_client",
+    "AiohttpQuizAPI": ".QuizApi.aiohttp_client",
+    "HttpxQuizAPI": ".QuizApi.httpx_client",
+    "RequestQuizAPI": ".QuizApi.requests_client",
+    "SyncQuizAPI": ".QuizApi.sync_client",
+    "AiohttpreChaptchaAPI": ".reCaptchaV3Solver.aiohttp_client",
+    "HttpxreChaptchaAPI": ".reCaptchaV3Solver.httpx_client",
+    "RequestsreChaptchaAPI": ".reCaptchaV3Solver.requests_client",
+    "SyncreChaptchaAPI": ".reCaptchaV3Solver.sync_client",
+    "AiohttpChatbotAPI": ".chatBot.aiohttp_client",
+    "HttpxChatbotAPI": ".chatBot.httpx_client",
+    "RequestsChatbotAPI": ".chatBot.requests_client",
+    "SyncChatbotAPI": ".chatBot.sync_client",
+    "check_for_update": ".core.update",
+})
 
-__newest__ = loads(get("https://pypi.org/pypi/TaskoraApi/json").text)["info"]["version"]
+# The PyPI version check is opt-in and never blocks the import.
+if os.environ.get("TASKORAAPI_CHECK_UPDATES", "").lower() in ("1", "true", "yes"):
+    from .core.update import check_for_update_in_background
 
-if __VERSION__ != __newest__:
-    print(f"New version of {__TITLE__} available: {__newest__} (Using {__VERSION__})")
-    print("Visit our discord - https://discord.com/invite/wMkKzGtAuQ")
+    check_for_update_in_background()
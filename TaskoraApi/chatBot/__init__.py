@@ -1,9 +1,17 @@
-from .client import AiohttpChatbotAPI
-from .client import HttpxChatbotAPI
-from .client import RequestsChatbotAPI
+from ..core.lazy import lazy_exports
 
 __all__ = [
     "AiohttpChatbotAPI",
+    "ChatbotDispatcher",
     "HttpxChatbotAPI",
-    "RequestsChatbotAPI"
+    "RequestsChatbotAPI",
+    "SyncChatbotAPI",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "AiohttpChatbotAPI": ".aiohttp_client",
+    "ChatbotDispatcher": ".dispatcher",
+    "HttpxChatbotAPI": ".httpx_client",
+    "RequestsChatbotAPI": ".requests_client",
+    "SyncChatbotAPI": ".sync_client",
+})
@@ -0,0 +1,212 @@
+import asyncio
+import heapq
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Hashable, List, Optional, Set, Tuple
+
+from ..core.metrics import LatencyHistogram
+
+
+class _Job:
+    __slots__ = ("message", "future", "queued_at")
+
+    def __init__(self, message: str, future: asyncio.Future, queued_at: float):
+        self.message = message
+        self.future = future
+        self.queued_at = queued_at
+
+
+class ChatbotDispatcher:
+    """
+    Multiplexes many conversations over one async chatbot client.
+
+    Messages are queued per conversation and sent by a fixed pool of
+    ``workers``, which bounds the number of requests in flight globally.
+
+    - Ordering: a conversation has at most one message in flight, and its
+      messages are sent in the order they were submitted, also after failures.
+    - Fairness: conversations with queued messages take turns, one message
+      per turn, so a chatty user delays others by at most one request.
+    - Backpressure: with ``max_pending`` set, ``submit`` waits while that many
+      messages are queued.
+
+    ``stats()`` reports queue depths, in-flight requests and queue-wait and
+    service-time percentiles.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        workers: int = 16,
+        max_pending: Optional[int] = None,
+        send: Optional[Callable[[str], Awaitable[Any]]] = None,
+    ):
+        """
+        Args:
+            client: An ``AiohttpChatbotAPI`` or ``HttpxChatbotAPI``; long messages are sent as
+                a request body according to its ``message_encoding``.
+            workers (int): Requests in flight at most, across all conversations (default: 16).
+            max_pending (int, optional): Queued messages at most before ``submit`` waits.
+            send (Callable, optional): Coroutine function ``(message) -> reply`` used instead of
+                ``client.chatbot``.
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1.")
+        self.client = client
+        self.workers = workers
+        self.max_pending = max_pending
+        self._send = send or client.chatbot
+        self._queues: Dict[Hashable, Deque[_Job]] = {}
+        self._ready: Optional[asyncio.Queue] = None
+        self._active: Set[Hashable] = set()
+        self._space: Optional[asyncio.Condition] = None
+        self._tasks: List[asyncio.Task] = []
+        self.pending = 0
+        self.max_depth = 0
+        self.completed = self.failed = 0
+        self.wait_time = LatencyHistogram()
+        self.service_time = LatencyHistogram()
+
+    async def __aenter__(self) -> "ChatbotDispatcher":
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close(drain=exc_type is None)
+
+    def start(self) -> None:
+        """Start the worker pool; ``submit`` does this on first use."""
+        if self._tasks:
+            return
+        self._ready = asyncio.Queue()
+        self._space = asyncio.Condition()
+        self._tasks = [asyncio.ensure_future(self._work()) for _ in range(self.workers)]
+
+    def depth(self, conversation: Hashable) -> int:
+        """Messages of ``conversation`` queued or in flight."""
+        return len(self._queues.get(conversation, ())) + (conversation in self._active)
+
+    async def submit(self, conversation: Hashable, message: str) -> Any:
+        """
+        Queue ``message`` for ``conversation`` and wait for the chatbot's reply.
+
+        Returns:
+            Any: What ``client.chatbot`` returns.
+        """
+        if self.max_pending is None:
+            future = self.submit_nowait(conversation, message)
+        else:
+            future = await self._submit_when_space(conversation, message)
+        return await future
+
+    async def _submit_when_space(self, conversation: Hashable, message: str) -> asyncio.Future:
+        self.start()
+        async with self._space:
+            await self._space.wait_for(lambda: self.pending < self.max_pending)
+            return self.submit_nowait(conversation, message)
+
+    def submit_nowait(self, conversation: Hashable, message: str) -> asyncio.Future:
+        """Queue ``message`` without waiting for space; returns a future resolving to the reply."""
+        self.start()
+        future = asyncio.get_running_loop().create_future()
+        queue = self._queues.get(conversation)
+        if queue is None:
+            queue = self._queues[conversation] = deque()
+        queue.append(_Job(message, future, time.perf_counter()))
+        self.pending += 1
+        self.max_depth = max(self.max_depth, len(queue))
+        # A conversation enters the ready queue only while it has nothing in flight.
+        if len(queue) == 1 and conversation not in self._active:
+            self._ready.put_nowait(conversation)
+        return future
+
+    async def _work(self) -> None:
+        while True:
+            conversation = await self._ready.get()
+            queue = self._queues[conversation]
+            job = queue.popleft()
+            self.pending -= 1
+            self._active.add(conversation)
+            try:
+                await self._run(job)
+            finally:
+                self._active.discard(conversation)
+                if queue:
+                    self._ready.put_nowait(conversation)
+                else:
+                    del self._queues[conversation]
+                self._ready.task_done()
+                await self._notify_space()
+
+    async def _run(self, job: _Job) -> None:
+        if job.future.cancelled():
+            return
+        started = time.perf_counter()
+        self.wait_time.observe(started - job.queued_at)
+        try:
+            reply = await self._send(job.message)
+        except asyncio.CancelledError:
+            job.future.cancel()
+            raise
+        except Exception as exc:
+            self.failed += 1
+            if not job.future.done():
+                job.future.set_exception(exc)
+        else:
+            self.completed += 1
+            if not job.future.done():
+                job.future.set_result(reply)
+        finally:
+            self.service_time.observe(time.perf_counter() - started)
+
+    async def _notify_space(self) -> None:
+        if self.max_pending is not None:
+            async with self._space:
+                self._space.notify_all()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Queue and throughput counters.
+
+        Returns:
+            Dict[str, Any]: ``pending`` (queued messages), ``in_flight``, ``conversations``
+            (with queued or in-flight messages), ``max_depth`` (deepest conversation queue seen),
+            ``deepest`` (the five currently deepest conversations), ``completed``, ``failed``, and
+            ``wait`` / ``service`` latency summaries in seconds.
+        """
+        deepest: List[Tuple[Hashable, int]] = heapq.nlargest(
+            5, ((conversation, self.depth(conversation)) for conversation in self._queues), key=lambda item: item[1]
+        )
+        return {
+            "pending": self.pending,
+            "in_flight": len(self._active),
+            "conversations": len(self._queues),
+            "max_depth": self.max_depth,
+            "deepest": deepest,
+            "completed": self.completed,
+            "failed": self.failed,
+            "wait": self.wait_time.summary(),
+            "service": self.service_time.summary(),
+        }
+
+    async def close(self, drain: bool = True) -> None:
+        """
+        Stop the workers.
+
+        Args:
+            drain (bool): Send everything already queued first (default: True);
+                otherwise queued messages are cancelled.
+        """
+        if not self._tasks:
+            return
+        if drain:
+            await self._ready.join()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        for queue in self._queues.values():
+            for job in queue:
+                job.future.cancel()
+        self._queues.clear()
+        self.pending = 0
@@ -0,0 +1,126 @@
+from functools import partial
+from typing import Optional, Dict, Any, AsyncIterator
+
+from ..core.httpx_base import HttpxBaseClient
+from ..core.pool import PoolLimits
+from ..core.ratelimit import TokenBucket
+from ..core.resilience import ResiliencePolicy
+from .message import encode_message
+from .stream import aiter_text, delta_text
+
+
+class HttpxChatbotAPI(HttpxBaseClient):
+    """
+    A Python client for interacting with a FastAPI chatbot service.
+
+    This client provides methods to:
+    - Send chat messages to the chatbot.
+    - Validate an API key for expiration and usage.
+    """
+
+    native_errors = True
+    key_status_method = "validate_key"
+
+    def __init__(
+        self,
+        apikey: str,
+        base_url: str = "https://your-api-url.com",
+        timeout: int = 60,
+        limits: Optional[PoolLimits] = None,
+        http2: bool = False,
+        rate_limiter: Optional[TokenBucket] = None,
+        resilience: Optional[ResiliencePolicy] = None,
+        message_encoding: str = "auto",
+    ):
+        """
+        Initialize the ChatbotAPIClient.
+
+        Args:
+            base_url (str): The base URL of the FastAPI backend (e.g., "https://example.com").
+            timeout (int): Request timeout in seconds (default: 60).
+            limits (PoolLimits, optional): Connection pool settings.
+            http2 (bool): Multiplex concurrent calls over HTTP/2 when the server supports it.
+            rate_limiter (TokenBucket, optional): Client-side rate limit every request waits on;
+                may be shared across clients (see ``TokenBucket.shared``).
+            resilience (ResiliencePolicy, optional): Retry policy and circuit breaker;
+                transient failures of idempotent calls are retried by default.
+            message_encoding (str): How messages are sent: "query" (query string), "json"
+                (JSON request body) or "auto" (default), which uses the body for long messages.
+        """
+        super().__init__(base_url.rstrip("/"), timeout, limits, http2)
+        self.apikey = apikey
+        self.rate_limiter = rate_limiter
+        self.resilience = resilience or self.resilience
+        self.message_encoding = message_encoding
+
+    async def _get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        return await self._request("GET", endpoint, params)
+
+    async def _post(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        return await self._request("POST", endpoint, params)
+
+    async def chatbot(self, message: str) -> Dict[str, Any]:
+        """
+        Send a message to the chatbot and receive a response.
+
+        Args:
+            message (str): The message to send to the chatbot.
+
+        Returns:
+            Dict[str, Any]: The JSON response from the chatbot API.
+
+        Raises:
+            httpx.HTTPStatusError: If the API responds with an error status.
+        """
+        params, json_body = encode_message(self.apikey, message, self.message_encoding)
+        if json_body is not None:
+            send = partial(self._send, json_body=json_body)
+            return await self._transmit("POST", "/api/v1/chatbot", params, False, send=send)
+        return await self._post("/api/v1/chatbot", params)
+
+    async def chatbot_stream(self, message: str) -> AsyncIterator[str]:
+        """
+        Send a message and yield the reply text as it is generated.
+
+        Consumes server-sent events, NDJSON or chunked text as it arrives. A server
+        that answers with one JSON document is handled too: its text is yielded
+        once. With a cassette attached the buffered ``chatbot`` call is used instead,
+        so the exchange can be recorded and replayed.
+
+        Args:
+            message (str): The message to send to the chatbot.
+
+        Yields:
+            str: Reply text deltas, in order.
+
+        Raises:
+            httpx.HTTPStatusError: If the API responds with an error status.
+        """
+        if self.cassette is not None:
+            reply = await self.chatbot(message)
+            text = delta_text(reply)
+            if text:
+                yield text
+            return
+        params, json_body = encode_message(self.apikey, message, self.message_encoding, stream="true")
+        # Only opening the stream is retried; once text was yielded the call cannot be repeated.
+        send = partial(self._open_stream, json_body=json_body)
+        stream = await self._transmit("POST", "/api/v1/chatbot", params, False, send=send)
+        try:
+            async for text in aiter_text(stream, self.json_loads):
+                yield text
+        finally:
+            await stream.aclose()
+
+    async def validate_key(self) -> Dict[str, Any]:
+        """
+        Validate an API key to check expiration and usage limits.
+
+        Returns:
+            Dict[str, Any]: The JSON response with validation details.
+
+        Raises:
+            httpx.HTTPStatusError: If the API responds with an error status.
+        """
+        params = {"apikey": self.apikey}
+        return await self._get("/api/v1/chatbot/validate_key", params)
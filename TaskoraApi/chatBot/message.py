@@ -0,0 +1,37 @@
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import quote_plus
+
+ENCODINGS = ("auto", "query", "json")
+#: Longest URL-encoded message kept in the query string under the "auto" encoding.
+MAX_QUERY_MESSAGE = 2048
+
+
+def encode_message(
+    apikey: str,
+    message: str,
+    encoding: str = "auto",
+    limit: int = MAX_QUERY_MESSAGE,
+    **extra: Any,
+) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+    """
+    Split a chatbot call into query parameters and an optional JSON body.
+
+    Args:
+        apikey (str): API key; always sent in the query string.
+        message (str): The user's message.
+        encoding (str): "query" keeps the message in the query string, "json" always
+            sends it as ``{"message": ...}`` in the body, and "auto" (default) switches
+            to the body once the URL-encoded message is longer than ``limit``.
+        limit (int): Threshold for "auto", in URL-encoded characters.
+        **extra: Further query parameters.
+
+    Returns:
+        Tuple[Dict[str, Any], Optional[Dict[str, Any]]]: ``(params, json_body)``.
+    """
+    if encoding not in ENCODINGS:
+        raise ValueError(f"encoding must be one of {ENCODINGS}, got {encoding!r}")
+    params = {"apikey": apikey, **extra}
+    if encoding == "json" or (encoding == "auto" and len(quote_plus(message)) > limit):
+        return params, {"message": message}
+    params["message"] = message
+    return params, None
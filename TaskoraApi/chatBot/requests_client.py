@@ -0,0 +1,118 @@
+from functools import partial
+from typing import Optional, Dict, Any, Iterator
+
+from ..core.requests_base import RequestsBaseClient
+from ..core.pool import PoolLimits
+from ..core.ratelimit import TokenBucket
+from ..core.resilience import ResiliencePolicy
+from .message import encode_message
+from .stream import delta_text, iter_text
+
+
+class RequestsChatbotAPI(RequestsBaseClient):
+    """
+    A Python client for interacting with a FastAPI chatbot service.
+
+    This client provides methods to:
+    - Send chat messages to the chatbot.
+    - Validate an API key for expiration and usage.
+    """
+
+    native_errors = True
+    key_status_method = "validate_key"
+
+    def __init__(
+        self,
+        apikey: str,
+        base_url: str = "https://your-api-url.com",
+        timeout: int = 60,
+        limits: Optional[PoolLimits] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        resilience: Optional[ResiliencePolicy] = None,
+        message_encoding: str = "auto",
+    ):
+        """
+        Initialize the ChatbotAPIClient.
+
+        Args:
+            apikey (str): The API key for authenticating with the chatbot service.
+            base_url (str): The base URL of the FastAPI backend (e.g., "https://example.com").
+            timeout (int): Request timeout in seconds (default: 60).
+            limits (PoolLimits, optional): Connection pool settings.
+            rate_limiter (TokenBucket, optional): Client-side rate limit every request waits on;
+                may be shared across clients (see ``TokenBucket.shared``).
+            resilience (ResiliencePolicy, optional): Retry policy and circuit breaker;
+                transient failures of idempotent calls are retried by default.
+            message_encoding (str): How messages are sent: "query" (query string), "json"
+                (JSON request body) or "auto" (default), which uses the body for long messages.
+        """
+        super().__init__(base_url.rstrip("/"), timeout, limits)
+        self.apikey = apikey
+        self.rate_limiter = rate_limiter
+        self.resilience = resilience or self.resilience
+        self.message_encoding = message_encoding
+
+    def chatbot(self, message: str) -> Dict[str, Any]:
+        """
+        Send a message to the chatbot and receive a response.
+
+        Args:
+            message (str): The message to send to the chatbot.
+
+        Returns:
+            Dict[str, Any]: The JSON response from the chatbot API.
+
+        Raises:
+            requests.HTTPError: If the API responds with an error status.
+        """
+        params, json_body = encode_message(self.apikey, message, self.message_encoding)
+        if json_body is not None:
+            send = partial(self._send, json_body=json_body)
+            return self._transmit("POST", "/api/v1/chatbot", params, False, send=send)
+        return self._request("POST", "/api/v1/chatbot", params)
+
+    def chatbot_stream(self, message: str) -> Iterator[str]:
+        """
+        Send a message and yield the reply text as it is generated.
+
+        Consumes server-sent events, NDJSON or chunked text as it arrives. A server
+        that answers with one JSON document is handled too: its text is yielded
+        once. With a cassette attached the buffered ``chatbot`` call is used instead,
+        so the exchange can be recorded and replayed.
+
+        Args:
+            message (str): The message to send to the chatbot.
+
+        Yields:
+            str: Reply text deltas, in order.
+
+        Raises:
+            requests.HTTPError: If the API responds with an error status.
+        """
+        if self.cassette is not None:
+            reply = self.chatbot(message)
+            text = delta_text(reply)
+            if text:
+                yield text
+            return
+        params, json_body = encode_message(self.apikey, message, self.message_encoding, stream="true")
+        # Only opening the stream is retried; once text was yielded the call cannot be repeated.
+        send = partial(self._open_stream, json_body=json_body)
+        stream = self._transmit("POST", "/api/v1/chatbot", params, False, send=send)
+        try:
+            yield from iter_text(stream, self.json_loads)
+        finally:
+            stream.close()
+
+    def validate_key(self) -> Dict[str, Any]:
+        """
+        Validate an API key to check expiration and usage limits.
+
+        Returns:
+            Dict[str, Any]: The JSON response with validation details.
+
+        Raises:
+            requests.HTTPError: If the API responds with an error status.
+        """
+        params = {"apikey": self.apikey}
+        return self._request("GET", "/api/v1/chatbot/validate_key", params)
@@ -0,0 +1,75 @@
+from typing import Any, AsyncIterator, Callable, Iterator, Optional
+
+from ..core.errors import TaskoraApiError
+from ..core.streaming import AsyncResponseStream, Event, EventDecoder, ResponseStream
+
+#: Keys that may carry reply text, tried in order; OpenAI-style ``choices`` are handled first.
+TEXT_KEYS = ("delta", "token", "text", "content", "response", "message", "reply", "answer", "output")
+
+
+def delta_text(data: Any) -> Optional[str]:
+    """
+    Reply text carried by one streamed event or a whole buffered reply.
+
+    Accepts plain strings, ``{"delta": "..."}``-style objects (see ``TEXT_KEYS``),
+    nested ones such as ``{"delta": {"content": "..."}}`` and OpenAI-style
+    ``{"choices": [{"delta": {"content": "..."}}]}``. Returns None for events without text.
+    """
+    if isinstance(data, str):
+        return data
+    if not isinstance(data, dict):
+        return None
+    choices = data.get("choices")
+    if isinstance(choices, list) and choices and isinstance(choices[0], dict):
+        text = delta_text(choices[0])
+        if text is not None:
+            return text
+    for key in TEXT_KEYS:
+        value = data.get(key)
+        if isinstance(value, str):
+            return value
+        if isinstance(value, dict):
+            text = delta_text(value)
+            if text is not None:
+                return text
+    return None
+
+
+def _texts(events: Iterator[Event], decoder: EventDecoder, body: bytearray) -> Iterator[str]:
+    for event, data in events:
+        if event == "error":
+            raise TaskoraApiError(200, data)
+        text = delta_text(data)
+        if text:
+            yield text
+        elif not decoder.streaming:
+            # A buffered reply without a recognised text field: hand over the body as is.
+            yield body.decode("utf-8", "replace")
+
+
+async def aiter_text(stream: AsyncResponseStream, loads: Callable[[bytes], Any]) -> AsyncIterator[str]:
+    """Yield text deltas from an open streamed reply, or the whole text once if it was not streamed."""
+    decoder = EventDecoder(stream.content_type, loads)
+    body = bytearray()
+    async for chunk in stream.chunks():
+        if not decoder.streaming:
+            body += chunk
+        for text in _texts(decoder.feed(chunk), decoder, body):
+            yield text
+        if decoder.done:
+            return
+    for text in _texts(decoder.close(), decoder, body):
+        yield text
+
+
+def iter_text(stream: ResponseStream, loads: Callable[[bytes], Any]) -> Iterator[str]:
+    """Blocking counterpart of :func:`aiter_text`."""
+    decoder = EventDecoder(stream.content_type, loads)
+    body = bytearray()
+    for chunk in stream.chunks():
+        if not decoder.streaming:
+            body += chunk
+        yield from _texts(decoder.feed(chunk), decoder, body)
+        if decoder.done:
+            return
+    yield from _texts(decoder.close(), decoder, body)
@@ -0,0 +1,16 @@
+from ..core.background import SyncFacade
+
+
+class SyncChatbotAPI(SyncFacade):
+    """
+    Blocking Chatbot client running the async client on a shared background event loop.
+
+    Takes the same arguments as ``AiohttpChatbotAPI`` plus ``backend`` ("aiohttp" or
+    "httpx"). Methods block like the ``Requests`` client's, but ``submit()`` and
+    ``map()`` run many calls concurrently over one connection pool (see :class:`SyncClient`).
+    """
+
+    BACKENDS = {
+        "aiohttp": "..chatBot.aiohttp_client:AiohttpChatbotAPI",
+        "httpx": "..chatBot.httpx_client:HttpxChatbotAPI",
+    }
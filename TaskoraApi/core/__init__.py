@@ -0,0 +1,53 @@
+from .lazy import lazy_exports
+
+__all__ = [
+    "BackgroundLoop",
+    "BulkResult",
+    "Cassette",
+    "CassetteMissError",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "DiskCache",
+    "DownloadError",
+    "JobStore",
+    "Metrics",
+    "PoolLimits",
+    "QuotaExhaustedError",
+    "RequestEvent",
+    "ResiliencePolicy",
+    "ResponseCache",
+    "RetryPolicy",
+    "SharedTokenBucket",
+    "SyncClient",
+    "TaskoraApiError",
+    "TokenBucket",
+    "get_decoder",
+    "run_job",
+    "serve_prometheus",
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "BackgroundLoop": ".background",
+    "BulkResult": ".bulk",
+    "Cassette": ".cassette",
+    "CassetteMissError": ".errors",
+    "CircuitBreaker": ".resilience",
+    "CircuitOpenError": ".errors",
+    "DiskCache": ".diskcache",
+    "DownloadError": ".errors",
+    "JobStore": ".jobs",
+    "Metrics": ".metrics",
+    "PoolLimits": ".pool",
+    "QuotaExhaustedError": ".errors",
+    "RequestEvent": ".metrics",
+    "ResiliencePolicy": ".resilience",
+    "ResponseCache": ".cache",
+    "RetryPolicy": ".resilience",
+    "SharedTokenBucket": ".ratelimit",
+    "SyncClient": ".background",
+    "TaskoraApiError": ".errors",
+    "TokenBucket": ".ratelimit",
+    "get_decoder": ".jsonlib",
+    "run_job": ".jobs",
+    "serve_prometheus": ".metrics",
+})
@@ -0,0 +1,201 @@
+import asyncio
+import time
+import aiohttp
+from multidict import CIMultiDict, CIMultiDictProxy
+from typing import Any, Callable, Dict, Optional, Tuple
+from yarl import URL
+
+from .async_base import AsyncBaseClient
+from .cache import Validators
+from .cassette import Interaction, reason_phrase
+from .errors import TaskoraApiError
+from .pool import PoolLimits
+from .resilience import parse_retry_after
+from .streaming import STREAM_ACCEPT, AsyncResponseStream
+
+
+def _trace_config() -> aiohttp.TraceConfig:
+    """Record connection and response timestamps into the dict passed as ``trace_request_ctx``."""
+    config = aiohttp.TraceConfig()
+
+    def mark(name: str):
+        async def callback(session, context, params) -> None:
+            if context.trace_request_ctx is not None:
+                context.trace_request_ctx[name] = time.perf_counter()
+        return callback
+
+    config.on_dns_resolvehost_start.append(mark("dns_start"))
+    config.on_dns_resolvehost_end.append(mark("dns_end"))
+    config.on_connection_create_start.append(mark("connect_start"))
+    config.on_connection_create_end.append(mark("connect_end"))
+    config.on_request_headers_sent.append(mark("request_start"))
+    config.on_request_end.append(mark("headers"))
+    return config
+
+
+class AiohttpBaseClient(AsyncBaseClient):
+    """
+    Shared aiohttp plumbing for the service clients.
+
+    Each instance keeps one long-lived ``aiohttp.ClientSession`` whose connector
+    pools keep-alive connections, so consecutive calls skip DNS, TCP and TLS setup.
+    """
+
+    backend = "aiohttp"
+
+    #: Raise ``aiohttp.ClientResponseError`` on HTTP errors instead of the generic API error.
+    native_errors = False
+
+    def __init__(self, base_url: str, timeout: int = 60, limits: Optional[PoolLimits] = None):
+        """
+        Args:
+            base_url (str): Prefix prepended to every endpoint.
+            timeout (int): Total request timeout in seconds (default: 60).
+            limits (PoolLimits, optional): Connection pool settings.
+        """
+        super().__init__(base_url, timeout, limits)
+        self.session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self):
+        await self._ensure_session()
+        return self
+
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                connector=self.limits.aiohttp_connector(),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                trace_configs=[_trace_config()],
+            )
+        return self.session
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_body: Optional[Any] = None,
+        validators: Optional[Validators] = None,
+        decode: Optional[Callable[[bytes], Any]] = None,
+    ) -> Any:
+        """
+        Send one request over the pooled session and return the decoded JSON body.
+
+        Args:
+            method (str): HTTP method.
+            endpoint (str): Path appended to ``base_url``.
+            params (Dict[str, Any], optional): Query parameters.
+            json_body (Any, optional): Sent as a JSON request body when given.
+            validators (Validators, optional): Make the request conditional; a 304
+                returns None and sets ``validators.not_modified``.
+            decode (Callable[[bytes], Any], optional): Builds the result from the body
+                instead of ``self.json_loads``.
+
+        Returns:
+            Any: JSON response from the API.
+        """
+        if self.cassette is not None:
+            interaction = self.cassette.play(method, endpoint, params, json_body)
+            if interaction is not None:
+                return self._replay(method, endpoint, interaction, validators, decode)
+        session = await self._ensure_session()
+        data, headers = self._body_headers(json_body, validators.request_headers() if validators else None)
+        marks: Dict[str, float] = {}
+        status: Optional[int] = None
+        body = b""
+        error: Optional[BaseException] = None
+        started = time.perf_counter()
+        try:
+            async with session.request(
+                method, self.base_url + endpoint, params=params, data=data, headers=headers, trace_request_ctx=marks
+            ) as response:
+                status, body = response.status, await response.read()
+                marks["done"] = time.perf_counter()
+                if self.cassette is not None:
+                    self.cassette.record(method, endpoint, params, status, response.headers, body, json_body)
+                if validators is not None:
+                    validators.update(status, response.headers)
+                    if validators.not_modified:
+                        return None
+                if self.native_errors:
+                    response.raise_for_status()
+                elif status != 200:
+                    raise TaskoraApiError(
+                        status, self._error_data(body), parse_retry_after(response.headers.get("Retry-After"))
+                    )
+            return (decode or self.json_loads)(body)
+        except BaseException as exc:
+            error = exc
+            raise
+        finally:
+            self._record(method, endpoint, status, len(body), marks, started, error)
+
+    async def _open_stream(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_body: Optional[Any] = None,
+    ) -> AsyncResponseStream:
+        """
+        Send a request asking for a streamed reply and return the open response once its status is OK.
+
+        ``timeout`` bounds each read instead of the whole stream. Error statuses raise
+        like ``_send``; the attempt is recorded when the stream is closed.
+        """
+        session = await self._ensure_session()
+        data, headers = self._body_headers(json_body, {"Accept": STREAM_ACCEPT})
+        marks: Dict[str, float] = {}
+        status: Optional[int] = None
+        body = b""
+        started = time.perf_counter()
+        try:
+            response = await session.request(
+                method, self.base_url + endpoint, params=params, data=data, headers=headers,
+                timeout=aiohttp.ClientTimeout(total=None, sock_read=self.timeout), trace_request_ctx=marks,
+            )
+            status = response.status
+            if status != 200:
+                body = await response.read()
+                marks["done"] = time.perf_counter()
+                response.release()
+                if self.native_errors:
+                    response.raise_for_status()
+                raise TaskoraApiError(
+                    status, self._error_data(body), parse_retry_after(response.headers.get("Retry-After"))
+                )
+        except BaseException as exc:
+            self._record(method, endpoint, status, len(body), marks, started, exc)
+            raise
+
+        async def release() -> None:
+            response.release()
+
+        return AsyncResponseStream(
+            response.headers.get("Content-Type", ""),
+            response.content.iter_any(),
+            release,
+            lambda size, error: self._record(method, endpoint, status, size, marks, started, error),
+        )
+
+    def _native_error(self, method: str, endpoint: str, interaction: Interaction) -> Exception:
+        url = URL(self.base_url + endpoint)
+        info = aiohttp.RequestInfo(url, method, CIMultiDictProxy(CIMultiDict()), url)
+        return aiohttp.ClientResponseError(
+            info, (), status=interaction.status, message=reason_phrase(interaction.status),
+            headers=CIMultiDictProxy(CIMultiDict(interaction.headers)),
+        )
+
+    def _failure_info(self, exc: Exception) -> Optional[Tuple[Optional[int], Optional[float]]]:
+        if isinstance(exc, aiohttp.ClientResponseError):
+            headers = exc.headers or {}
+            return exc.status, parse_retry_after(headers.get("Retry-After"))
+        if isinstance(exc, (aiohttp.ClientError, asyncio.TimeoutError)):
+            return None, None
+        return super()._failure_info(exc)
+
+    async def close(self) -> None:
+        """Close the pooled session and release its connections."""
+        await super().close()
+        if self.session and not self.session.closed:
+            await self.session.close()
@@ -0,0 +1,385 @@
+import asyncio
+import time
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from .cache import FRESH, STALE, ResponseCache, Validators
+from .cassette import Cassette, Interaction
+from .errors import TaskoraApiError
+from .jsonlib import get_decoder, get_encoder
+from .metrics import Hook, Metrics, RequestEvent, emit, phase_timings
+from .pool import DEFAULT_LIMITS, PoolLimits
+from .ratelimit import TokenBucket
+from .resilience import DEFAULT_RESILIENCE, ResiliencePolicy, parse_retry_after
+from .singleflight import SingleFlight
+from .streaming import AsyncResponseStream
+
+
+class AsyncBaseClient:
+    """
+    Backend-independent request pipeline for the async clients.
+
+    Subclasses implement ``_send`` for their HTTP library; everything layered on
+    top of a single request (caching, coalescing, ...) lives here once for both backends.
+
+    Concurrent identical idempotent calls are coalesced into one request;
+    ``self.singleflight.stats()`` reports how many were deduplicated. Set
+    ``singleflight`` to None to send every call separately.
+
+    With a ``rate_limiter`` set, every request that reaches the network first
+    waits for a token; cache hits and coalesced calls are free.
+
+    Failed attempts are retried and counted by ``self.resilience`` (see
+    :class:`ResiliencePolicy`); idempotent calls retry on transport errors and
+    5xx, others only on 429.
+
+    Response bodies are decoded from raw bytes with ``self.json_loads``, the
+    fastest installed decoder (see :func:`get_decoder`), chosen once per client.
+
+    Every HTTP attempt is timed per phase and aggregated into ``self.metrics``;
+    ``stats()`` returns a snapshot and ``add_hook`` subscribes to the raw events.
+
+    Attach a :class:`Cassette` as ``self.cassette`` to record live responses or
+    replay recorded ones without touching the network.
+    """
+
+    #: Backend name reported in request events.
+    backend = ""
+    #: Name of the method returning the key's status, used by ``seed_rate_limiter``.
+    key_status_method: Optional[str] = None
+    #: Cheap endpoint probed by a half-open circuit breaker.
+    status_endpoint = "/api/v1/status"
+
+    def __init__(self, base_url: str, timeout: int = 60, limits: Optional[PoolLimits] = None):
+        """
+        Args:
+            base_url (str): Prefix prepended to every endpoint.
+            timeout (int): Request timeout in seconds (default: 60).
+            limits (PoolLimits, optional): Connection pool settings.
+        """
+        self.base_url = base_url
+        self.timeout = timeout
+        self.limits = limits or DEFAULT_LIMITS
+        self.cache: Optional[ResponseCache] = None
+        self.singleflight: Optional[SingleFlight] = SingleFlight()
+        self.rate_limiter: Optional[TokenBucket] = None
+        self.resilience: ResiliencePolicy = DEFAULT_RESILIENCE
+        self.json_loads = get_decoder()
+        self.json_dumps = get_encoder()
+        self.metrics: Optional[Metrics] = Metrics()
+        self.hooks: List[Hook] = []
+        self.cassette: Optional[Cassette] = None
+        self._background: Set[asyncio.Task] = set()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_body: Optional[Any] = None,
+    ) -> Any:
+        raise NotImplementedError
+
+    async def _open_stream(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_body: Optional[Any] = None,
+    ) -> AsyncResponseStream:
+        """Send a request asking for a streamed reply and return the open response once its status is OK."""
+        raise NotImplementedError
+
+    def add_hook(self, hook: Hook) -> Hook:
+        """
+        Call ``hook`` with a :class:`RequestEvent` after every HTTP attempt.
+
+        Returns the hook, so this also works as a decorator.
+        """
+        self.hooks.append(hook)
+        return hook
+
+    def _record(
+        self,
+        method: str,
+        endpoint: str,
+        status: Optional[int],
+        size: int,
+        marks: Dict[str, float],
+        started: float,
+        error: Optional[BaseException],
+    ) -> None:
+        if self.metrics is None and not self.hooks:
+            return
+        finished = marks.get("done") or time.perf_counter()
+        event = RequestEvent(
+            type(self).__name__, self.backend, method, endpoint, status, size,
+            phase_timings(marks, started, finished), error,
+        )
+        if self.metrics is not None:
+            self.metrics.record(event)
+        emit(self.hooks, event)
+
+    def _error_data(self, body: bytes) -> Any:
+        """Decode an error body, falling back to its text."""
+        try:
+            return self.json_loads(body)
+        except Exception:
+            return body.decode("utf-8", "replace")
+
+    def _body_headers(
+        self, json_body: Optional[Any], headers: Optional[Dict[str, str]] = None
+    ) -> Tuple[Optional[bytes], Dict[str, str]]:
+        """Encode an optional JSON request body; returns ``(data, headers)``."""
+        headers = dict(headers or {})
+        if json_body is None:
+            return None, headers
+        headers["Content-Type"] = "application/json"
+        return self.json_dumps(json_body), headers
+
+    def _native_error(self, method: str, endpoint: str, interaction: Interaction) -> Exception:
+        """The error the HTTP library would raise for a recorded failure; see ``native_errors``."""
+        return TaskoraApiError(
+            interaction.status, self._error_data(interaction.body),
+            parse_retry_after(interaction.headers.get("Retry-After")),
+        )
+
+    def _replay(
+        self,
+        method: str,
+        endpoint: str,
+        interaction: Interaction,
+        validators: Optional[Validators] = None,
+        decode: Optional[Callable[[bytes], Any]] = None,
+    ) -> Any:
+        """Return or raise a recorded response exactly as ``_send`` would for a live one."""
+        status, body = interaction.status, interaction.body
+        if validators is not None:
+            validators.update(status, interaction.headers)
+            if validators.not_modified:
+                self._record(method, endpoint, status, len(body), {}, time.perf_counter(), None)
+                return None
+        error: Optional[BaseException] = None
+        started = time.perf_counter()
+        try:
+            if self.native_errors:
+                if status >= 400:
+                    raise self._native_error(method, endpoint, interaction)
+            elif status != 200:
+                raise TaskoraApiError(
+                    status, self._error_data(body), parse_retry_after(interaction.headers.get("Retry-After"))
+                )
+            return (decode or self.json_loads)(body)
+        except BaseException as exc:
+            error = exc
+            raise
+        finally:
+            self._record(method, endpoint, status, len(body), {}, started, error)
+
+    def _failure_info(self, exc: Exception) -> Optional[Tuple[Optional[int], Optional[float]]]:
+        """
+        Classify an exception raised by ``_send``.
+
+        Returns:
+            Optional[Tuple]: ``(status, retry_after)`` for HTTP and transport failures
+            (status None for the latter), or None for anything else.
+        """
+        if isinstance(exc, TaskoraApiError):
+            return exc.status, exc.retry_after
+        return None
+
+    async def _probe(self) -> None:
+        breaker = self.resilience.breaker
+        try:
+            await self._send("GET", self.status_endpoint)
+        except BaseException:
+            breaker.record_failure()
+            raise
+        breaker.record_success()
+
+    async def _transmit(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        idempotent: bool,
+        send: Optional[Callable[..., Awaitable[Any]]] = None,
+    ) -> Any:
+        """Run ``send`` (default ``_send``) under the circuit breaker, rate limiter and retry policy."""
+        send = send or self._send
+        retry, breaker = self.resilience.retry, self.resilience.breaker
+        attempt = 0
+        while True:
+            if breaker is not None and breaker.before_call():
+                await self._probe()
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire()
+            try:
+                result = await send(method, endpoint, params)
+            except Exception as exc:
+                info = self._failure_info(exc)
+                if info is None:
+                    raise
+                status, retry_after = info
+                if breaker is not None:
+                    if self.resilience.is_backend_failure(status):
+                        breaker.record_failure()
+                    else:
+                        breaker.record_success()
+                delay = retry.next_delay(attempt, status, retry_after, idempotent) if retry else None
+                if delay is None:
+                    raise
+                attempt += 1
+                await asyncio.sleep(delay)
+            else:
+                if breaker is not None:
+                    breaker.record_success()
+                return result
+
+    def _spawn(self, coro: Awaitable[Any]) -> asyncio.Task:
+        """Run ``coro`` in the background, keeping a reference until it finishes."""
+        task = asyncio.ensure_future(coro)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+        return task
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        cached: bool = False,
+        idempotent: Optional[bool] = None,
+    ) -> Any:
+        """
+        Send a request and return the decoded JSON body.
+
+        Args:
+            method (str): HTTP method.
+            endpoint (str): Path appended to ``base_url``.
+            params (Dict[str, Any], optional): Query parameters.
+            cached (bool): Serve from ``self.cache`` when one is configured.
+            idempotent (bool, optional): Whether repeating the call is harmless, which
+                allows coalescing. Defaults to True for GET and False otherwise.
+
+        Returns:
+            Any: JSON response from the API.
+        """
+        if idempotent is None:
+            idempotent = method == "GET"
+        if not cached or self.cache is None:
+            return await self._fetch(method, endpoint, params, idempotent)
+
+        key = self.cache.make_key(method, endpoint, params)
+        state, value = self.cache.lookup(key)
+        if state == FRESH:
+            return value
+        if state == STALE:
+            if self.cache.begin_refresh(key):
+                self._spawn(self._refresh(key, method, endpoint, params, idempotent))
+            return value
+        return await self._cache_fill(key, method, endpoint, params, idempotent)
+
+    async def _request_decoded(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        decode: Callable[[bytes], Any],
+        convert: Callable[[Any], Any],
+        idempotent: Optional[bool] = None,
+    ) -> Any:
+        """
+        Send a request and build the result straight from the response bytes with ``decode``.
+
+        With ``self.cache`` configured the decoded JSON goes through the cache as in
+        ``_request(cached=True)``, and ``convert`` builds the result from it instead.
+        """
+        if idempotent is None:
+            idempotent = method == "GET"
+        if self.cache is not None:
+            return convert(await self._request(method, endpoint, params, cached=True, idempotent=idempotent))
+        send = partial(self._send, decode=decode)
+        if not idempotent or self.singleflight is None:
+            return await self._transmit(method, endpoint, params, idempotent, send)
+        key = (decode,) + ResponseCache.make_key(method, endpoint, params)
+        return await self.singleflight.do(key, lambda: self._transmit(method, endpoint, params, idempotent, send))
+
+    async def _fetch(self, method: str, endpoint: str, params: Optional[Dict[str, Any]], idempotent: bool) -> Any:
+        if not idempotent or self.singleflight is None:
+            return await self._transmit(method, endpoint, params, idempotent)
+        key = ResponseCache.make_key(method, endpoint, params)
+        return await self.singleflight.do(key, lambda: self._transmit(method, endpoint, params, idempotent))
+
+    async def _cache_fill(
+        self, key: Any, method: str, endpoint: str, params: Optional[Dict[str, Any]], idempotent: bool
+    ) -> Any:
+        """Fetch a response into the cache, as a conditional request when validators are stored for it."""
+        async def fetch(validators: Validators) -> Any:
+            return await self._transmit(method, endpoint, params, idempotent, partial(self._send, validators=validators))
+
+        async def fill() -> Any:
+            validators = self.cache.validators(key)
+            value = await fetch(validators)
+            if validators.not_modified:
+                found, value = self.cache.renew(key, endpoint)
+                if found:
+                    return value
+                # Evicted meanwhile: fetch the body unconditionally.
+                validators = Validators()
+                value = await fetch(validators)
+            self.cache.store(key, endpoint, value, validators)
+            return value
+
+        if not idempotent or self.singleflight is None:
+            return await fill()
+        return await self.singleflight.do(ResponseCache.make_key(method, endpoint, params), fill)
+
+    async def _refresh(
+        self, key: Any, method: str, endpoint: str, params: Optional[Dict[str, Any]], idempotent: bool
+    ) -> None:
+        try:
+            await self._cache_fill(key, method, endpoint, params, idempotent)
+        except Exception:
+            # Keep serving the stale entry; the next stale hit schedules another attempt.
+            pass
+        finally:
+            self.cache.end_refresh(key)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Snapshot of this client's request metrics and of every optional layer.
+
+        Returns:
+            Dict[str, Any]: ``requests`` (per-endpoint counts and p50/p95/p99 latencies,
+            see :meth:`Metrics.snapshot`) plus ``cache``, ``singleflight``, ``rate_limiter``
+            and ``circuit`` when those are enabled.
+        """
+        breaker = self.resilience.breaker
+        return {
+            "requests": self.metrics.snapshot() if self.metrics is not None else {},
+            "cache": self.cache.stats() if self.cache is not None else None,
+            "singleflight": self.singleflight.stats() if self.singleflight is not None else None,
+            "rate_limiter": self.rate_limiter.stats() if self.rate_limiter is not None else None,
+            "circuit": breaker.state if breaker is not None else None,
+        }
+
+    async def seed_rate_limiter(self) -> bool:
+        """
+        Query the key status endpoint and adopt its rate and remaining budget.
+
+        Returns:
+            bool: True if the limiter was updated.
+        """
+        if self.rate_limiter is None or self.key_status_method is None:
+            return False
+        status = await getattr(self, self.key_status_method)()
+        return self.rate_limiter.seed_from_status(status)
+
+    async def close(self) -> None:
+        """Cancel background work started by this client."""
+        for task in list(self._background):
+            task.cancel()
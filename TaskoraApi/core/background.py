@@ -0,0 +1,254 @@
+import asyncio
+import concurrent.futures
+import functools
+import inspect
+import threading
+from collections import deque
+from importlib import import_module
+from typing import Any, Awaitable, Callable, Deque, Dict, Iterable, Iterator, Optional, Set
+
+
+class BackgroundLoop:
+    """
+    An asyncio event loop running in a daemon thread, for calling async code from sync code.
+
+    ``BackgroundLoop.default()`` is shared by every sync facade, so their
+    async clients, connection pools and background tasks all live on one loop.
+    """
+
+    _default: Optional["BackgroundLoop"] = None
+    _default_lock = threading.Lock()
+
+    def __init__(self, name: str = "TaskoraApi-loop"):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    @classmethod
+    def default(cls) -> "BackgroundLoop":
+        """The process-wide shared loop, started on first use."""
+        with cls._default_lock:
+            if cls._default is None or cls._default.loop.is_closed():
+                cls._default = cls()
+            return cls._default
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def submit(self, coro: Awaitable[Any]) -> concurrent.futures.Future:
+        """Schedule ``coro`` on the loop and return a thread-safe future for its result."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Awaitable[Any], timeout: Optional[float] = None) -> Any:
+        """Run ``coro`` on the loop and block until it finishes."""
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("BackgroundLoop.run() called from its own loop thread; await the coroutine instead.")
+        return self.submit(coro).result(timeout)
+
+    def close(self) -> None:
+        """Stop the loop and wait for its thread to exit."""
+        if self.loop.is_closed():
+            return
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
+
+
+class SyncClient:
+    """
+    Blocking facade over an async client, run on a shared :class:`BackgroundLoop`.
+
+    Every coroutine method of the wrapped client becomes a blocking method,
+    and methods returning async iterators (``stream_quiz``, ``chatbot_stream``,
+    ``get_profiles_many``, ...) return plain iterators instead. Unlike the
+    ``Requests*`` clients, many calls can be in flight at once from one thread,
+    over the async client's connection pool:
+
+    - ``submit(name, *args)`` starts a call and returns a ``concurrent.futures.Future``.
+    - ``map(name, items)`` runs a call for every item concurrently and yields
+      results in input order (or as they complete).
+
+    Facades may be shared between threads; all calls run on the loop thread.
+    Other attributes are read from and written to the wrapped client.
+    """
+
+    _own = frozenset({"client", "runner"})
+
+    def __init__(self, client: Any, runner: Optional[BackgroundLoop] = None):
+        """
+        Args:
+            client: An aiohttp- or httpx-based client.
+            runner (BackgroundLoop, optional): Loop to run on (default: the shared one).
+        """
+        self.client = client
+        self.runner = runner or BackgroundLoop.default()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self.client, name)
+        if inspect.iscoroutinefunction(attribute):
+            @functools.wraps(attribute)
+            def call(*args: Any, **kwargs: Any) -> Any:
+                return self.runner.run(attribute(*args, **kwargs))
+            return call
+        if inspect.isasyncgenfunction(attribute):
+            @functools.wraps(attribute)
+            def iterate(*args: Any, **kwargs: Any) -> Iterator[Any]:
+                return self._iterate(attribute(*args, **kwargs))
+            return iterate
+        if inspect.ismethod(attribute):
+            # Plain methods may still hand back async iterators (``*_many``) or awaitables.
+            @functools.wraps(attribute)
+            def adapt(*args: Any, **kwargs: Any) -> Any:
+                result = attribute(*args, **kwargs)
+                if hasattr(result, "__anext__"):
+                    return self._iterate(result)
+                if inspect.isawaitable(result):
+                    return self.runner.run(result)
+                return result
+            return adapt
+        return attribute
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in self._own:
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self.client, name, value)
+
+    def _iterate(self, agen: Any) -> Iterator[Any]:
+        try:
+            while True:
+                try:
+                    yield self.runner.run(agen.__anext__())
+                except StopAsyncIteration:
+                    return
+        finally:
+            if hasattr(agen, "aclose"):
+                self.runner.run(agen.aclose())
+
+    def _method(self, name: str) -> Callable[..., Awaitable[Any]]:
+        method = getattr(self.client, name)
+        if not inspect.iscoroutinefunction(method):
+            raise TypeError(f"{type(self.client).__name__}.{name} is not a coroutine method")
+        return method
+
+    def submit(self, name: str, *args: Any, **kwargs: Any) -> concurrent.futures.Future:
+        """
+        Start ``client.<name>(*args, **kwargs)`` without waiting for it.
+
+        Returns:
+            concurrent.futures.Future: Resolves to the call's result or exception.
+        """
+        return self.runner.submit(self._method(name)(*args, **kwargs))
+
+    @staticmethod
+    async def _semaphore(limit: int) -> asyncio.Semaphore:
+        # Created on the loop, which Python 3.9 semaphores bind to at construction.
+        return asyncio.Semaphore(limit)
+
+    @staticmethod
+    async def _limited(semaphore: asyncio.Semaphore, method: Callable[..., Awaitable[Any]], args: tuple) -> Any:
+        async with semaphore:
+            return await method(*args)
+
+    def map(
+        self,
+        name: str,
+        *iterables: Iterable[Any],
+        concurrency: int = 32,
+        ordered: bool = True,
+    ) -> Iterator[Any]:
+        """
+        Call ``client.<name>`` for every item, at most ``concurrency`` at a time.
+
+        Like ``Executor.map``, positional arguments are taken from ``iterables``
+        in parallel, and an item's exception is raised when its result is reached.
+        The iterables are read lazily, at most ``2 * concurrency`` items ahead of
+        the results consumed so far.
+
+        Args:
+            name (str): Coroutine method of the client, e.g. "get_profile".
+            *iterables: Argument iterables.
+            concurrency (int): Calls in flight at most (default: 32).
+            ordered (bool): Yield results in input order (default) or as they complete.
+
+        Yields:
+            Any: The results.
+        """
+        method = self._method(name)
+        semaphore = self.runner.run(self._semaphore(concurrency))
+        items = zip(*iterables)
+        window = 2 * max(1, concurrency)
+
+        def start() -> Optional[concurrent.futures.Future]:
+            args = next(items, None)
+            return None if args is None else self.runner.submit(self._limited(semaphore, method, args))
+
+        if ordered:
+            queue: Deque[concurrent.futures.Future] = deque()
+            try:
+                while True:
+                    while len(queue) < window:
+                        future = start()
+                        if future is None:
+                            break
+                        queue.append(future)
+                    if not queue:
+                        return
+                    yield queue.popleft().result()
+            finally:
+                for future in queue:
+                    future.cancel()
+        else:
+            pending: Set[concurrent.futures.Future] = set()
+            exhausted = False
+            try:
+                while True:
+                    while not exhausted and len(pending) < window:
+                        future = start()
+                        if future is None:
+                            exhausted = True
+                        else:
+                            pending.add(future)
+                    if not pending:
+                        return
+                    done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def close(self) -> None:
+        """Close the wrapped client; the shared loop keeps running for other facades."""
+        self.runner.run(self.client.close())
+
+
+class SyncFacade(SyncClient):
+    """
+    Base for the per-service facades: builds the async client for ``backend``.
+
+    Subclasses list their async clients in ``BACKENDS`` as ``"module:Class"``.
+    """
+
+    BACKENDS: Dict[str, str] = {}
+
+    def __init__(self, *args: Any, backend: str = "aiohttp", runner: Optional[BackgroundLoop] = None, **kwargs: Any):
+        """
+        Args:
+            *args, **kwargs: Passed to the async client's constructor.
+            backend (str): "aiohttp" (default) or "httpx".
+            runner (BackgroundLoop, optional): Loop to run on (default: the shared one).
+        """
+        try:
+            module, name = self.BACKENDS[backend].split(":")
+        except KeyError:
+            raise ValueError(f"backend must be one of {sorted(self.BACKENDS)}, got {backend!r}") from None
+        cls = getattr(import_module(module, __package__), name)
+        super().__init__(cls(*args, **kwargs), runner)
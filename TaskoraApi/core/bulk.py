@@ -0,0 +1,185 @@
+import asyncio
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, AsyncIterable, AsyncIterator, Awaitable, Callable, Deque, Dict, Iterable, Iterator, Optional, Union
+
+
+@dataclass
+class BulkResult:
+    """
+    Outcome of one item of a bulk call.
+
+    Attributes:
+        key (Any): The input item (e.g. the username).
+        value (Any): The API response, or None when the call failed.
+        error (BaseException, optional): The exception raised for this item, if any.
+    """
+
+    key: Any
+    value: Any = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+async def _aiterate(items: Union[Iterable[Any], AsyncIterable[Any]]) -> AsyncIterator[Any]:
+    if hasattr(items, "__aiter__"):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+async def bounded_gather(
+    func: Callable[[Any], Awaitable[Any]],
+    items: Union[Iterable[Any], AsyncIterable[Any]],
+    concurrency: int = 10,
+) -> AsyncIterator[BulkResult]:
+    """
+    Run ``func`` over ``items`` with at most ``concurrency`` calls in flight, yielding results as they complete.
+
+    Items are pulled from the input only when a slot frees up and the caller has
+    consumed the previous result, so memory stays flat for arbitrarily long inputs.
+    Exceptions are captured per item in ``BulkResult.error``; they never abort the run.
+    Closing the iterator early cancels the calls still in flight.
+
+    Args:
+        func (Callable): Coroutine function taking one item.
+        items (Iterable | AsyncIterable): Inputs, consumed lazily.
+        concurrency (int): Maximum number of concurrent calls (default: 10).
+
+    Yields:
+        BulkResult: One result per input item, in completion order.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1.")
+
+    source = _aiterate(items).__aiter__()
+    running: Dict[asyncio.Task, Any] = {}
+    exhausted = False
+
+    async def fill() -> None:
+        nonlocal exhausted
+        while not exhausted and len(running) < concurrency:
+            try:
+                item = await source.__anext__()
+            except StopAsyncIteration:
+                exhausted = True
+                return
+            running[asyncio.ensure_future(func(item))] = item
+
+    try:
+        await fill()
+        while running:
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                key = running.pop(task)
+                if task.cancelled():
+                    yield BulkResult(key, error=asyncio.CancelledError())
+                elif task.exception() is not None:
+                    yield BulkResult(key, error=task.exception())
+                else:
+                    yield BulkResult(key, task.result())
+            await fill()
+    finally:
+        for task in running:
+            task.cancel()
+
+
+def threaded_gather(
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    concurrency: int = 10,
+) -> Iterator[BulkResult]:
+    """
+    Thread-pool counterpart of :func:`bounded_gather` for the blocking clients.
+
+    Args:
+        func (Callable): Blocking function taking one item.
+        items (Iterable): Inputs, consumed lazily.
+        concurrency (int): Number of worker threads (default: 10).
+
+    Yields:
+        BulkResult: One result per input item, in completion order.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1.")
+
+    source = iter(items)
+    running: Dict[Future, Any] = {}
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="TaskoraApi-bulk")
+
+    def fill() -> None:
+        for item in source:
+            running[executor.submit(func, item)] = item
+            if len(running) >= concurrency:
+                return
+
+    try:
+        fill()
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                key = running.pop(future)
+                error = future.exception()
+                yield BulkResult(key, error=error) if error is not None else BulkResult(key, future.result())
+            fill()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def threaded_map(
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    workers: int = 10,
+    ordered: bool = True,
+) -> Iterator[Any]:
+    """
+    Run ``func`` over ``items`` on a thread pool, yielding the return values.
+
+    Unlike :func:`threaded_gather`, an item's exception is raised when its
+    result is reached. At most ``2 * workers`` items are read ahead of the
+    consumer; closing the iterator early cancels the calls not yet started.
+
+    Args:
+        func (Callable): Blocking function taking one item.
+        items (Iterable): Inputs, consumed lazily.
+        workers (int): Number of worker threads (default: 10).
+        ordered (bool): Yield in input order (default) or in completion order.
+
+    Yields:
+        Any: One result per input item.
+    """
+    if workers < 1:
+        raise ValueError("workers must be at least 1.")
+
+    source = iter(items)
+    pending: Deque[Future] = deque()
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="TaskoraApi-map")
+
+    def fill() -> None:
+        while len(pending) < 2 * workers:
+            try:
+                item = next(source)
+            except StopIteration:
+                return
+            pending.append(executor.submit(func, item))
+
+    try:
+        fill()
+        while pending:
+            if ordered:
+                future = pending.popleft()
+            else:
+                future = next(iter(wait(pending, return_when=FIRST_COMPLETED).done))
+                pending.remove(future)
+            value = future.result()
+            fill()
+            yield value
+    finally:
+        # After a full run the idle workers are joined, so their sessions can be released.
+        executor.shutdown(wait=not pending, cancel_futures=True)
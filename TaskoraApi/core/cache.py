@@ -0,0 +1,207 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Mapping, Optional, Tuple
+
+FRESH = "fresh"
+STALE = "stale"
+MISS = "miss"
+
+
+class Validators:
+    """
+    Conditional-request state for one cache fill.
+
+    Carries a stored response's ``ETag`` and ``Last-Modified`` to ``_send``,
+    which sends them as ``If-None-Match`` and ``If-Modified-Since`` and records
+    the answer: ``not_modified`` after a 304, the new validators otherwise.
+    """
+
+    __slots__ = ("etag", "last_modified", "not_modified")
+
+    def __init__(self, etag: Optional[str] = None, last_modified: Optional[str] = None):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.not_modified = False
+
+    def __bool__(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+    def request_headers(self) -> Dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def update(self, status: int, headers: Mapping[str, str]) -> None:
+        """Take in a response: remember a 304, or the validators of a fresh body."""
+        if status == 304:
+            self.not_modified = True
+            return
+        lowered = {name.lower(): value for name, value in headers.items()}
+        self.not_modified = False
+        self.etag = lowered.get("etag")
+        self.last_modified = lowered.get("last-modified")
+
+
+class _Entry:
+    __slots__ = ("value", "expires_at", "stale_until", "validators")
+
+    def __init__(self, value: Any, expires_at: float, stale_until: float, validators: Optional[Validators] = None):
+        self.value = value
+        self.expires_at = expires_at
+        self.stale_until = stale_until
+        self.validators = validators
+
+
+class ResponseCache:
+    """
+    In-memory TTL + LRU cache for API responses, with stale-while-revalidate.
+
+    An entry is *fresh* for its endpoint's TTL. After that it is *stale* for
+    ``stale_ttl`` more seconds: callers still get it instantly while a single
+    background refresh replaces it. Past that window it is a miss. When more
+    than ``maxsize`` entries are stored, the least recently used one is evicted.
+
+    When the server sent an ``ETag`` or ``Last-Modified``, the refresh of a stale
+    entry is a conditional request, and a 304 just renews the entry.
+
+    Cached values are shared between callers; treat them as read-only.
+    See :class:`DiskCache` for a cache that survives restarts.
+
+    The cache is thread-safe and can be shared by several clients.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float = 60.0,
+        ttls: Optional[Dict[str, float]] = None,
+        stale_ttl: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            maxsize (int): Maximum number of cached responses (default: 1024).
+            ttl (float): Default freshness in seconds (default: 60).
+            ttls (Dict[str, float], optional): Per-endpoint freshness overriding ``ttl``,
+                e.g. ``{"profile": 300, "highlights": 900}``. A TTL of 0 disables caching for that endpoint.
+            stale_ttl (float): Seconds an expired entry may still be served while it is refreshed (default: 300).
+            clock (Callable[[], float]): Time source, monotonic by default.
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1.")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.ttls = dict(ttls or {})
+        self.stale_ttl = stale_ttl
+        self.clock = clock
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._refreshing = set()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.refreshes = 0
+        self.revalidated = 0
+
+    @staticmethod
+    def make_key(method: str, endpoint: str, params: Optional[Dict[str, Any]]) -> Tuple:
+        return method, endpoint, tuple(sorted((params or {}).items()))
+
+    def ttl_for(self, endpoint: str) -> float:
+        return self.ttls.get(endpoint, self.ttl)
+
+    def lookup(self, key: Hashable) -> Tuple[str, Any]:
+        """Return ``(FRESH | STALE | MISS, value)`` for ``key``."""
+        now = self.clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or now >= entry.stale_until:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return MISS, None
+            self._entries.move_to_end(key)
+            if now < entry.expires_at:
+                self.hits += 1
+                return FRESH, entry.value
+            self.stale_hits += 1
+            return STALE, entry.value
+
+    def store(self, key: Hashable, endpoint: str, value: Any, validators: Optional[Validators] = None) -> None:
+        ttl = self.ttl_for(endpoint)
+        if ttl <= 0:
+            return
+        now = self.clock()
+        with self._lock:
+            self._entries[key] = _Entry(value, now + ttl, now + ttl + self.stale_ttl, validators or None)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def validators(self, key: Hashable) -> Validators:
+        """Validators to revalidate ``key`` with; empty when none were stored."""
+        with self._lock:
+            entry = self._entries.get(key)
+            stored = entry.validators if entry is not None else None
+        return Validators(stored.etag, stored.last_modified) if stored else Validators()
+
+    def renew(self, key: Hashable, endpoint: str) -> Tuple[bool, Any]:
+        """
+        Restart the TTL of ``key`` after a 304.
+
+        Returns:
+            Tuple[bool, Any]: ``(True, value)``, or ``(False, None)`` if the entry is gone.
+        """
+        ttl = self.ttl_for(endpoint)
+        now = self.clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            entry.expires_at = now + ttl
+            entry.stale_until = now + ttl + self.stale_ttl
+            self.revalidated += 1
+            return True, entry.value
+
+    def begin_refresh(self, key: Hashable) -> bool:
+        """Claim the background refresh for ``key``; False if one is already running."""
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            self.refreshes += 1
+            return True
+
+    def end_refresh(self, key: Hashable) -> None:
+        with self._lock:
+            self._refreshing.discard(key)
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        """Snapshot of the cache counters."""
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "refreshes": self.refreshes,
+                "revalidated": self.revalidated,
+            }
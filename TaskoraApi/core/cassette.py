@@ -0,0 +1,209 @@
+import base64
+import gzip
+import json
+import threading
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+from urllib.parse import urlencode
+
+from .errors import CassetteMissError
+
+MODES = ("record", "replay", "auto")
+#: Response headers kept in recordings; the rest are irrelevant to the clients.
+KEPT_HEADERS = ("Content-Type", "Retry-After", "ETag", "Last-Modified")
+
+
+def reason_phrase(status: int) -> str:
+    """Standard reason phrase for ``status``, used when rebuilding native errors from recordings."""
+    try:
+        return HTTPStatus(status).phrase
+    except ValueError:
+        return ""
+
+
+@dataclass
+class Interaction:
+    """
+    One recorded response.
+
+    Attributes:
+        method (str): HTTP method.
+        endpoint (str): Endpoint path as passed to ``_request``, without ``base_url``.
+        params (Dict[str, Any]): Query parameters and JSON body fields, with ignored ones (the API key) removed.
+        status (int): HTTP status.
+        headers (Dict[str, str]): The response headers listed in ``KEPT_HEADERS``.
+        body (bytes): Raw response body.
+    """
+
+    method: str
+    endpoint: str
+    params: Dict[str, Any]
+    status: int
+    headers: Dict[str, str] = field(default_factory=dict)
+    body: bytes = b""
+
+    def to_json(self) -> Dict[str, Any]:
+        data = {"method": self.method, "endpoint": self.endpoint, "params": self.params, "status": self.status}
+        if self.headers:
+            data["headers"] = self.headers
+        try:
+            data["body"] = self.body.decode("utf-8")
+        except UnicodeDecodeError:
+            data["body_b64"] = base64.b64encode(self.body).decode("ascii")
+        return data
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "Interaction":
+        if "body_b64" in data:
+            body = base64.b64decode(data["body_b64"])
+        else:
+            body = data.get("body", "").encode("utf-8")
+        return cls(data["method"], data["endpoint"], data.get("params") or {}, data["status"],
+                   data.get("headers") or {}, body)
+
+
+class Cassette:
+    """
+    Record real responses and replay them without a network.
+
+    Attach one to any client with ``client.cassette = Cassette(...)``. Requests
+    are matched on method, endpoint and query parameters (plus the fields of a
+    JSON object request body), ignoring
+    ``ignore_params`` (the API key by default), so a cassette recorded against
+    the live API replays against any ``base_url``.
+
+    Modes:
+        ``"record"``: every request goes to the network and its response is stored.
+        ``"replay"``: responses come from the cassette only; a miss raises
+        :class:`CassetteMissError`.
+        ``"auto"``: replay when a recording exists, otherwise fetch and record it.
+
+    Replayed responses pass through the normal pipeline (retries, circuit
+    breaker, error mapping, metrics), so recorded 429s and 5xx behave like live ones.
+    When a request was recorded several times, replay cycles through the recordings in order.
+
+    The file is newline-delimited JSON, gzip-compressed when ``path`` ends in ``.gz``.
+    Recordings are written by :meth:`save`, which also runs when the cassette is
+    used as a context manager.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        mode: str = "replay",
+        ignore_params: Iterable[str] = ("apikey",),
+    ):
+        """
+        Args:
+            path (str, optional): Cassette file; loaded now if it exists and written by ``save()``.
+            mode (str): "record", "replay" or "auto" (default: "replay").
+            ignore_params (Iterable[str]): Query parameters left out of matching and never written
+                to the file (default: the API key).
+        """
+        if mode not in MODES:
+            raise ValueError(f"mode must be one of {MODES}, got {mode!r}")
+        self.path = path
+        self.mode = mode
+        self.ignore_params = frozenset(ignore_params)
+        self.interactions: List[Interaction] = []
+        self._index: Dict[Tuple[str, str, str], List[Interaction]] = {}
+        self._cursor: Dict[Tuple[str, str, str], int] = {}
+        self._lock = threading.Lock()
+        self.hits = self.misses = 0
+        if path is not None:
+            try:
+                self.load(path)
+            except FileNotFoundError:
+                if mode == "replay":
+                    raise
+
+    def __enter__(self) -> "Cassette":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self.path is not None and self.mode != "replay":
+            self.save()
+
+    def __len__(self) -> int:
+        return len(self.interactions)
+
+    @property
+    def recording(self) -> bool:
+        return self.mode != "replay"
+
+    def _params(self, params: Optional[Mapping[str, Any]], json_body: Any = None) -> Dict[str, Any]:
+        merged = dict(params or {})
+        if isinstance(json_body, dict):
+            merged.update(json_body)
+        return {k: v for k, v in merged.items() if k not in self.ignore_params}
+
+    def _key(self, method: str, endpoint: str, params: Mapping[str, Any]) -> Tuple[str, str, str]:
+        return method.upper(), endpoint, urlencode(sorted((k, str(v)) for k, v in params.items()))
+
+    def _add(self, interaction: Interaction) -> None:
+        self.interactions.append(interaction)
+        key = self._key(interaction.method, interaction.endpoint, interaction.params)
+        self._index.setdefault(key, []).append(interaction)
+
+    def play(
+        self, method: str, endpoint: str, params: Optional[Mapping[str, Any]] = None, json_body: Any = None
+    ) -> Optional[Interaction]:
+        """
+        Recorded response for a request, or None in record mode and on an "auto" miss.
+
+        Raises:
+            CassetteMissError: In replay mode when nothing was recorded for the request.
+        """
+        if self.mode == "record":
+            return None
+        key = self._key(method, endpoint, self._params(params, json_body))
+        with self._lock:
+            recorded = self._index.get(key)
+            if not recorded:
+                self.misses += 1
+                if self.mode == "replay":
+                    raise CassetteMissError(f"no recorded response for {key[0]} {key[1]}?{key[2]}")
+                return None
+            cursor = self._cursor.get(key, 0)
+            self._cursor[key] = cursor + 1
+            self.hits += 1
+            return recorded[cursor % len(recorded)]
+
+    def record(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Mapping[str, Any]],
+        status: int,
+        headers: Mapping[str, str],
+        body: bytes,
+        json_body: Any = None,
+    ) -> None:
+        """Store a live response; a no-op in replay mode."""
+        if not self.recording:
+            return
+        kept = {name: headers[name] for name in KEPT_HEADERS if headers.get(name) is not None}
+        with self._lock:
+            self._add(Interaction(method.upper(), endpoint, self._params(params, json_body), status, kept, bytes(body)))
+
+    def load(self, path: str) -> None:
+        """Append the recordings in ``path``."""
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, "rt", encoding="utf-8") as file:
+            for line in file:
+                if line.strip():
+                    self._add(Interaction.from_json(json.loads(line)))
+
+    def save(self, path: Optional[str] = None) -> None:
+        """Write every recording to ``path`` (default: the cassette's own path)."""
+        path = path or self.path
+        if path is None:
+            raise ValueError("no path to save the cassette to")
+        opener = gzip.open if path.endswith(".gz") else open
+        with self._lock, opener(path, "wt", encoding="utf-8") as file:
+            for interaction in self.interactions:
+                file.write(json.dumps(interaction.to_json(), separators=(",", ":"), ensure_ascii=False) + "\n")
+
+    def stats(self) -> Dict[str, Any]:
+        return {"mode": self.mode, "interactions": len(self.interactions), "hits": self.hits, "misses": self.misses}
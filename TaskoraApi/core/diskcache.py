@@ -0,0 +1,303 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+from .cache import FRESH, MISS, STALE, Validators
+from .jsonlib import get_decoder, get_encoder
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key BLOB PRIMARY KEY,
+    endpoint TEXT NOT NULL,
+    value BLOB NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    expires REAL NOT NULL,
+    stale_until REAL NOT NULL,
+    keep_until REAL NOT NULL,
+    accessed REAL NOT NULL,
+    size INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed);
+CREATE TABLE IF NOT EXISTS usage (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    bytes INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO usage SELECT 0, COALESCE(SUM(size), 0) FROM responses;
+CREATE TRIGGER IF NOT EXISTS responses_insert AFTER INSERT ON responses BEGIN
+    UPDATE usage SET bytes = bytes + NEW.size;
+END;
+CREATE TRIGGER IF NOT EXISTS responses_delete AFTER DELETE ON responses BEGIN
+    UPDATE usage SET bytes = bytes - OLD.size;
+END;
+"""
+
+#: Hits refresh an entry's LRU position at most this often, to keep reads from writing.
+TOUCH_INTERVAL = 60.0
+
+
+def _busy(error: sqlite3.OperationalError) -> bool:
+    """True if ``error`` means another connection holds the lock."""
+    message = str(error)
+    return "locked" in message or "busy" in message
+
+
+class DiskCache:
+    """
+    Persistent response cache in a local SQLite file, shared across restarts and processes.
+
+    A drop-in alternative to :class:`ResponseCache` (``client.cache = DiskCache(path)``)
+    with the same per-endpoint TTLs and stale-while-revalidate window. On top:
+
+    - Entries whose response carried an ``ETag`` or ``Last-Modified`` are kept
+      for ``keep`` seconds after they expire, and are revalidated with a
+      conditional request; a 304 renews them without transferring the body.
+    - The total size of stored bodies is capped at ``max_bytes``; the least
+      recently used entries are evicted first.
+
+    Keys are hashed, so API keys in query parameters are never written to disk.
+    Values are stored as JSON and decoded on every hit, so each caller gets its own copy.
+
+    Calls run on the caller's thread, which is the event loop for the async
+    clients, so they never wait long for a lock held by another process: after
+    ``busy_timeout`` seconds a read counts as a miss and a write is skipped
+    (counted in ``contended``). The size cap is checked against the total kept
+    in the database, so it holds across processes.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike],
+        max_bytes: int = 256 * 1024 * 1024,
+        ttl: float = 3600.0,
+        ttls: Optional[Dict[str, float]] = None,
+        stale_ttl: float = 300.0,
+        keep: float = 7 * 86400.0,
+        busy_timeout: float = 0.05,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Args:
+            path (str | PathLike): SQLite database file, created if missing.
+            max_bytes (int): Cap on the total size of stored bodies (default: 256 MiB).
+            ttl (float): Default freshness in seconds (default: 3600).
+            ttls (Dict[str, float], optional): Per-endpoint freshness overriding ``ttl``.
+                A TTL of 0 disables caching for that endpoint.
+            stale_ttl (float): Seconds an expired entry may still be served while it is refreshed (default: 300).
+            keep (float): Seconds an expired entry with validators is kept for revalidation (default: 7 days).
+            busy_timeout (float): Seconds to wait for another process's lock before giving up (default: 0.05).
+            clock (Callable[[], float]): Wall-clock time source, since entries outlive the process.
+        """
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1.")
+        self.path = os.fspath(path)
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.ttls = dict(ttls or {})
+        self.stale_ttl = stale_ttl
+        self.keep = keep
+        self.clock = clock
+        self.json_dumps = get_encoder()
+        self.json_loads = get_decoder()
+        self._refreshing = set()
+        self._lock = threading.Lock()
+        # Setup may wait as long as it needs; only the per-request calls use ``busy_timeout``.
+        self._db = sqlite3.connect(self.path, timeout=30.0, isolation_level=None, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+        self._db.execute("DELETE FROM responses WHERE keep_until <= ?", (clock(),))
+        self._db.execute(f"PRAGMA busy_timeout = {int(busy_timeout * 1000)}")
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.refreshes = 0
+        self.revalidated = 0
+        self.contended = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @staticmethod
+    def make_key(method: str, endpoint: str, params: Optional[Dict[str, Any]]) -> bytes:
+        text = "\n".join([method, endpoint] + [f"{name}={value}" for name, value in sorted((params or {}).items())])
+        return hashlib.sha256(text.encode()).digest()
+
+    def ttl_for(self, endpoint: str) -> float:
+        return self.ttls.get(endpoint, self.ttl)
+
+    def lookup(self, key: bytes) -> Tuple[str, Any]:
+        """Return ``(FRESH | STALE | MISS, value)`` for ``key``."""
+        now = self.clock()
+        with self._lock:
+            row = self._row("SELECT value, expires, stale_until, accessed FROM responses WHERE key = ?", (key,))
+            if row is None or now >= row[2]:
+                # Expired entries stay behind for revalidation until ``keep_until``.
+                self.misses += 1
+                return MISS, None
+            value, expires, _, accessed = row
+            if now - accessed >= TOUCH_INTERVAL:
+                self._touch("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+            if now < expires:
+                self.hits += 1
+                state = FRESH
+            else:
+                self.stale_hits += 1
+                state = STALE
+        return state, self.json_loads(value)
+
+    def store(self, key: bytes, endpoint: str, value: Any, validators: Optional[Validators] = None) -> None:
+        ttl = self.ttl_for(endpoint)
+        if ttl <= 0:
+            return
+        body = self.json_dumps(value)
+        if len(body) > self.max_bytes:
+            return
+        now = self.clock()
+        expires, stale_until = now + ttl, now + ttl + self.stale_ttl
+        keep_until = stale_until + self.keep if validators else stale_until
+        etag = validators.etag if validators else None
+        last_modified = validators.last_modified if validators else None
+        with self._lock:
+            try:
+                self._db.execute("BEGIN IMMEDIATE")
+            except sqlite3.OperationalError as exc:
+                if not _busy(exc):
+                    raise
+                self.contended += 1
+                return
+            try:
+                # DELETE + INSERT rather than REPLACE, so the usage triggers see both rows.
+                self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._db.execute(
+                    "INSERT INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (key, endpoint, body, etag, last_modified, expires, stale_until, keep_until, now, len(body)),
+                )
+                if self._usage() > self.max_bytes:
+                    self._evict(now)
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            self._db.execute("COMMIT")
+
+    def _usage(self) -> int:
+        # Total body size across all processes, kept by the triggers in the same transactions.
+        return self._db.execute("SELECT bytes FROM usage").fetchone()[0]
+
+    def _row(self, query: str, args: Tuple[Any, ...]) -> Optional[Tuple[Any, ...]]:
+        # A read blocked by another process is answered as if the entry were missing.
+        try:
+            return self._db.execute(query, args).fetchone()
+        except sqlite3.OperationalError as exc:
+            if not _busy(exc):
+                raise
+            self.contended += 1
+            return None
+
+    def _touch(self, query: str, args: Tuple[Any, ...]) -> None:
+        # Best-effort bookkeeping write: skipped rather than waited for under contention.
+        try:
+            self._db.execute(query, args)
+        except sqlite3.OperationalError as exc:
+            if not _busy(exc):
+                raise
+            self.contended += 1
+
+    def _evict(self, now: float) -> None:
+        # Called inside a write transaction; free 10% headroom to evict in batches.
+        self.evictions += self._db.execute("DELETE FROM responses WHERE keep_until <= ?", (now,)).rowcount
+        stored = self._usage()
+        target = self.max_bytes * 0.9
+        if stored <= target:
+            return
+        victims = []
+        for key, size in self._db.execute("SELECT key, size FROM responses ORDER BY accessed"):
+            if stored <= target:
+                break
+            victims.append((key,))
+            stored -= size
+        self._db.executemany("DELETE FROM responses WHERE key = ?", victims)
+        self.evictions += len(victims)
+
+    def validators(self, key: bytes) -> Validators:
+        """Validators to revalidate ``key`` with; empty when none were stored or the entry is gone."""
+        with self._lock:
+            row = self._row(
+                "SELECT etag, last_modified FROM responses WHERE key = ? AND keep_until > ?", (key, self.clock())
+            )
+        return Validators(*row) if row else Validators()
+
+    def renew(self, key: bytes, endpoint: str) -> Tuple[bool, Any]:
+        """
+        Restart the TTL of ``key`` after a 304. Under contention the stored value is
+        still returned, and only the renewal is skipped.
+
+        Returns:
+            Tuple[bool, Any]: ``(True, value)``, or ``(False, None)`` if the entry is gone or locked.
+        """
+        now = self.clock()
+        ttl = self.ttl_for(endpoint)
+        stale_until = now + ttl + self.stale_ttl
+        with self._lock:
+            row = self._row("SELECT value FROM responses WHERE key = ?", (key,))
+            if row is None:
+                return False, None
+            self._touch(
+                "UPDATE responses SET expires = ?, stale_until = ?, keep_until = ?, accessed = ? WHERE key = ?",
+                (now + ttl, stale_until, stale_until + self.keep, now, key),
+            )
+            self.revalidated += 1
+        return True, self.json_loads(row[0])
+
+    def begin_refresh(self, key: bytes) -> bool:
+        """Claim the background refresh for ``key``; False if one is already running."""
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            self.refreshes += 1
+            return True
+
+    def end_refresh(self, key: bytes) -> None:
+        with self._lock:
+            self._refreshing.discard(key)
+
+    def invalidate(self, key: bytes) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def stats(self) -> Dict[str, int]:
+        """Snapshot of the cache counters, plus entry count and stored bytes."""
+        with self._lock:
+            size = self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            stored = self._usage()
+            return {
+                "size": size,
+                "bytes": stored,
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "refreshes": self.refreshes,
+                "revalidated": self.revalidated,
+                "contended": self.contended,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
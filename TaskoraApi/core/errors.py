@@ -0,0 +1,49 @@
+from typing import Any, Optional
+
+
+class TaskoraApiError(Exception):
+    """
+    Error returned by a Taskora API endpoint.
+
+    Attributes:
+        status (int, optional): HTTP status code, if a response was received.
+        data (Any): Decoded error body, or its text.
+        retry_after (float, optional): Seconds the server asked us to wait (``Retry-After``).
+    """
+
+    def __init__(self, status: Optional[int], data: Any = None, retry_after: Optional[float] = None):
+        super().__init__(f"API Error: {status} - {data}")
+        self.status = status
+        self.data = data
+        self.retry_after = retry_after
+
+
+class CircuitOpenError(TaskoraApiError):
+    """Raised without a request while the circuit breaker considers the backend down."""
+
+    def __init__(self, retry_in: float):
+        super().__init__(None, f"circuit open, backend unavailable; next probe in {retry_in:.1f}s")
+        self.retry_after = retry_in
+
+
+class QuotaExhaustedError(TaskoraApiError):
+    """Raised without a request when the key's remaining request budget is used up."""
+
+    def __init__(self):
+        super().__init__(None, "API key quota exhausted; no requests remaining")
+
+
+class DownloadError(TaskoraApiError):
+    """Raised when a media download cannot be completed or resumed consistently."""
+
+    def __init__(self, message: str, status: Optional[int] = None):
+        super().__init__(status, message)
+
+
+class CassetteMissError(LookupError):
+    """
+    Raised in replay mode when a cassette holds no response for a request.
+
+    Not a :class:`TaskoraApiError`: a miss is a test setup problem, so it is
+    never retried and never counted by the circuit breaker.
+    """
@@ -0,0 +1,222 @@
+import httpx
+import time
+import warnings
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .async_base import AsyncBaseClient
+from .cache import Validators
+from .cassette import Interaction
+from .errors import TaskoraApiError
+from .pool import PoolLimits
+from .resilience import parse_retry_after
+from .streaming import STREAM_ACCEPT, AsyncResponseStream
+
+# httpcore trace events -> timing marks understood by ``phase_timings``.
+_TRACE_MARKS = {
+    "connection.connect_tcp.started": "connect_start",
+    "connection.connect_tcp.complete": "connect_end",
+    "connection.start_tls.started": "tls_start",
+    "connection.start_tls.complete": "tls_end",
+    "http11.send_request_headers.started": "request_start",
+    "http2.send_request_headers.started": "request_start",
+    "http11.receive_response_headers.complete": "headers",
+    "http2.receive_response_headers.complete": "headers",
+}
+
+
+class HttpxBaseClient(AsyncBaseClient):
+    """
+    Shared httpx plumbing for the service clients.
+
+    Each instance keeps one long-lived ``httpx.AsyncClient`` whose transport
+    pools keep-alive connections, so consecutive calls skip DNS, TCP and TLS setup.
+    """
+
+    backend = "httpx"
+
+    #: Raise ``httpx.HTTPStatusError`` on HTTP errors instead of the generic API error.
+    native_errors = False
+
+    def __init__(
+        self,
+        base_url: str,
+        timeout: int = 60,
+        limits: Optional[PoolLimits] = None,
+        http2: bool = False,
+    ):
+        """
+        Args:
+            base_url (str): Prefix prepended to every endpoint.
+            timeout (int): Request timeout in seconds (default: 60).
+            limits (PoolLimits, optional): Connection pool settings.
+            http2 (bool): Offer HTTP/2 so concurrent calls share multiplexed connections.
+                Requires the ``h2`` package (``pip install httpx[http2]``); falls back to
+                HTTP/1.1 when it is missing or the server does not negotiate h2.
+        """
+        super().__init__(base_url, timeout, limits)
+        self.http2 = http2
+        self.http_version: Optional[str] = None
+        self.client: Optional[httpx.AsyncClient] = None
+
+    async def __aenter__(self):
+        await self._ensure_client()
+        return self
+
+    async def _ensure_client(self) -> httpx.AsyncClient:
+        if self.client is None or self.client.is_closed:
+            try:
+                self.client = httpx.AsyncClient(
+                    timeout=self.timeout,
+                    limits=self.limits.httpx_limits(),
+                    http2=self.http2,
+                )
+            except ImportError:
+                warnings.warn("http2=True needs the 'h2' package; falling back to HTTP/1.1.", RuntimeWarning)
+                self.http2 = False
+                return await self._ensure_client()
+        return self.client
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_body: Optional[Any] = None,
+        validators: Optional[Validators] = None,
+        decode: Optional[Callable[[bytes], Any]] = None,
+    ) -> Any:
+        """
+        Send one request over the pooled client and return the decoded JSON body.
+
+        Args:
+            method (str): HTTP method.
+            endpoint (str): Path appended to ``base_url``.
+            params (Dict[str, Any], optional): Query parameters.
+            json_body (Any, optional): Sent as a JSON request body when given.
+            validators (Validators, optional): Make the request conditional; a 304
+                returns None and sets ``validators.not_modified``.
+            decode (Callable[[bytes], Any], optional): Builds the result from the body
+                instead of ``self.json_loads``.
+
+        Returns:
+            Any: JSON response from the API.
+        """
+        if self.cassette is not None:
+            interaction = self.cassette.play(method, endpoint, params, json_body)
+            if interaction is not None:
+                return self._replay(method, endpoint, interaction, validators, decode)
+        client = await self._ensure_client()
+        data, headers = self._body_headers(json_body, validators.request_headers() if validators else None)
+        marks: Dict[str, float] = {}
+        status: Optional[int] = None
+        body = b""
+        error: Optional[BaseException] = None
+
+        async def trace(event: str, info: Dict[str, Any]) -> None:
+            mark = _TRACE_MARKS.get(event)
+            if mark is not None:
+                marks[mark] = time.perf_counter()
+
+        started = time.perf_counter()
+        try:
+            response = await client.request(
+                method, self.base_url + endpoint, params=params, content=data, headers=headers,
+                extensions={"trace": trace},
+            )
+            marks["done"] = time.perf_counter()
+            # "HTTP/2" when h2 was negotiated, "HTTP/1.1" after a fallback.
+            self.http_version = response.http_version
+            status, body = response.status_code, response.content
+            if self.cassette is not None:
+                self.cassette.record(method, endpoint, params, status, response.headers, body, json_body)
+            if validators is not None:
+                validators.update(status, response.headers)
+                if validators.not_modified:
+                    return None
+            if self.native_errors:
+                response.raise_for_status()
+            elif status != 200:
+                raise TaskoraApiError(
+                    status, self._error_data(body), parse_retry_after(response.headers.get("Retry-After"))
+                )
+            return (decode or self.json_loads)(body)
+        except BaseException as exc:
+            error = exc
+            raise
+        finally:
+            self._record(method, endpoint, status, len(body), marks, started, error)
+
+    async def _open_stream(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_body: Optional[Any] = None,
+    ) -> AsyncResponseStream:
+        """
+        Send a request asking for a streamed reply and return the open response once its status is OK.
+
+        Error statuses raise like ``_send``; the attempt is recorded when the stream is closed.
+        """
+        client = await self._ensure_client()
+        data, headers = self._body_headers(json_body, {"Accept": STREAM_ACCEPT})
+        marks: Dict[str, float] = {}
+        status: Optional[int] = None
+        body = b""
+
+        async def trace(event: str, info: Dict[str, Any]) -> None:
+            mark = _TRACE_MARKS.get(event)
+            if mark is not None:
+                marks[mark] = time.perf_counter()
+
+        started = time.perf_counter()
+        try:
+            request = client.build_request(
+                method, self.base_url + endpoint, params=params, content=data, headers=headers,
+                extensions={"trace": trace},
+            )
+            response = await client.send(request, stream=True)
+            self.http_version = response.http_version
+            status = response.status_code
+            if status != 200:
+                body = await response.aread()
+                marks["done"] = time.perf_counter()
+                await response.aclose()
+                if self.native_errors:
+                    response.raise_for_status()
+                raise TaskoraApiError(
+                    status, self._error_data(body), parse_retry_after(response.headers.get("Retry-After"))
+                )
+        except BaseException as exc:
+            self._record(method, endpoint, status, len(body), marks, started, exc)
+            raise
+        return AsyncResponseStream(
+            response.headers.get("Content-Type", ""),
+            response.aiter_bytes(),
+            response.aclose,
+            lambda size, error: self._record(method, endpoint, status, size, marks, started, error),
+        )
+
+    def _native_error(self, method: str, endpoint: str, interaction: Interaction) -> Exception:
+        request = httpx.Request(method, self.base_url + endpoint)
+        response = httpx.Response(
+            interaction.status, headers=interaction.headers, content=interaction.body, request=request
+        )
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError as exc:
+            return exc
+        return super()._native_error(method, endpoint, interaction)
+
+    def _failure_info(self, exc: Exception) -> Optional[Tuple[Optional[int], Optional[float]]]:
+        if isinstance(exc, httpx.HTTPStatusError):
+            return exc.response.status_code, parse_retry_after(exc.response.headers.get("Retry-After"))
+        if isinstance(exc, httpx.TransportError):
+            return None, None
+        return super()._failure_info(exc)
+
+    async def close(self) -> None:
+        """Close the pooled client and release its connections."""
+        await super().close()
+        if self.client and not self.client.is_closed:
+            await self.client.aclose()
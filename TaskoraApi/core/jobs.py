@@ -0,0 +1,376 @@
+import asyncio
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .bulk import BulkResult, bounded_gather
+from .errors import CircuitOpenError, QuotaExhaustedError
+from .jsonlib import get_decoder, get_encoder
+
+PENDING = "pending"
+LEASED = "leased"
+DONE = "done"
+FAILED = "failed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    job TEXT NOT NULL,
+    key TEXT NOT NULL,
+    state TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    owner TEXT,
+    expires REAL,
+    result BLOB,
+    error TEXT,
+    updated REAL NOT NULL,
+    PRIMARY KEY (job, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS items_state ON items (job, state, expires);
+"""
+
+
+def default_owner() -> str:
+    """Lease owner name unique to this process: ``host:pid:random``."""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class JobStore:
+    """
+    Durable work queue in a local SQLite file, for crawls that must survive restarts.
+
+    Each item of a named job is *pending*, *leased* to a worker, *done* with
+    its result, or *failed* with its error. Workers lease items for
+    ``lease_timeout`` seconds; items whose lease runs out (the worker died) are
+    handed out again, and give up as failed after ``max_attempts`` leases.
+    Failed attempts that may be retried wait ``retry_delay`` seconds, doubling
+    per attempt up to ``max_retry_delay``, before they can be leased again.
+
+    Completions and failures are buffered and written in one transaction per
+    ``batch_size`` items or ``flush_interval`` seconds, so a crash loses at most
+    one batch of results, whose items are simply leased and fetched again.
+
+    Any number of threads and processes may share one file (WAL mode). A worker
+    restarted under the same ``owner`` name takes its old leases back
+    immediately with :meth:`release` instead of waiting for them to expire.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike],
+        lease_timeout: float = 300.0,
+        max_attempts: int = 3,
+        batch_size: int = 100,
+        flush_interval: float = 1.0,
+        retry_delay: float = 1.0,
+        max_retry_delay: float = 60.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Args:
+            path (str | PathLike): SQLite database file, created if missing.
+            lease_timeout (float): Seconds a leased item stays reserved (default: 300).
+            max_attempts (int): Leases per item before it is marked failed (default: 3).
+            batch_size (int): Results buffered before a checkpoint (default: 100).
+            flush_interval (float): Maximum seconds between checkpoints (default: 1).
+            retry_delay (float): Seconds before a failed item is leased again, doubling per attempt (default: 1).
+            max_retry_delay (float): Cap on that delay (default: 60).
+            clock (Callable[[], float]): Wall-clock time source shared by all processes.
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1.")
+        self.path = os.fspath(path)
+        self.lease_timeout = lease_timeout
+        self.max_attempts = max_attempts
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.clock = clock
+        self.json_dumps = get_encoder()
+        self.json_loads = get_decoder()
+        self._pending: List[Tuple[str, str, Optional[bytes], Optional[str], bool]] = []
+        self._flushed = clock()
+        self._lock = threading.RLock()
+        self._db = sqlite3.connect(self.path, timeout=30.0, isolation_level=None, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        # BEGIN IMMEDIATE takes the write lock up front, so concurrent leasers never deadlock.
+        self._db.execute("BEGIN IMMEDIATE")
+        try:
+            yield self._db
+        except BaseException:
+            self._db.execute("ROLLBACK")
+            raise
+        self._db.execute("COMMIT")
+
+    def add(self, job: str, keys: Iterable[str]) -> int:
+        """
+        Enqueue ``keys`` as pending items of ``job``; keys already known are left alone.
+
+        Returns:
+            int: Number of new items.
+        """
+        now = self.clock()
+        with self._lock, self._transaction() as db:
+            before = db.total_changes
+            db.executemany(
+                "INSERT OR IGNORE INTO items (job, key, updated) VALUES (?, ?, ?)",
+                ((job, str(key), now) for key in keys),
+            )
+            return db.total_changes - before
+
+    def lease(self, job: str, count: int, owner: str, timeout: Optional[float] = None) -> List[str]:
+        """
+        Reserve up to ``count`` pending (and due) or expired items of ``job`` for ``owner``.
+
+        Items whose lease expired ``max_attempts`` times are marked failed instead.
+
+        Returns:
+            List[str]: The leased keys; empty when nothing is available right now.
+        """
+        now = self.clock()
+        expires = now + (self.lease_timeout if timeout is None else timeout)
+        with self._lock, self._transaction() as db:
+            db.execute(
+                "UPDATE items SET state = 'failed', owner = NULL, error = 'lease expired', updated = ?"
+                " WHERE job = ? AND state = 'leased' AND expires < ? AND attempts >= ?",
+                (now, job, now, self.max_attempts),
+            )
+            keys = [row[0] for row in db.execute(
+                "SELECT key FROM items WHERE job = ? AND (state = 'pending' AND (expires IS NULL OR expires <= ?)"
+                " OR state = 'leased' AND expires < ?) LIMIT ?",
+                (job, now, now, count),
+            )]
+            db.executemany(
+                "UPDATE items SET state = 'leased', owner = ?, expires = ?, attempts = attempts + 1, updated = ?"
+                " WHERE job = ? AND key = ?",
+                ((owner, expires, now, job, key) for key in keys),
+            )
+        return keys
+
+    def release(
+        self, job: Optional[str] = None, owner: Optional[str] = None, keys: Optional[Iterable[str]] = None
+    ) -> int:
+        """
+        Put leased items back to pending without counting the attempt, e.g. those of a restarted ``owner``.
+
+        Args:
+            job (str, optional): Only this job (default: all).
+            owner (str, optional): Only this owner's leases (default: every lease).
+            keys (Iterable[str], optional): Only these keys (default: all).
+
+        Returns:
+            int: Number of released items.
+        """
+        self.flush()
+        query = "UPDATE items SET state = 'pending', owner = NULL, expires = NULL, attempts = MAX(attempts - 1, 0)" \
+                " WHERE state = 'leased'"
+        args: List[Any] = []
+        if job is not None:
+            query += " AND job = ?"
+            args.append(job)
+        if owner is not None:
+            query += " AND owner = ?"
+            args.append(owner)
+        with self._lock, self._transaction() as db:
+            if keys is None:
+                return db.execute(query, args).rowcount
+            before = db.total_changes
+            db.executemany(query + " AND key = ?", ([*args, str(key)] for key in keys))
+            return db.total_changes - before
+
+    def complete(self, job: str, key: str, result: Any = None) -> None:
+        """Record ``key`` as done with ``result`` (JSON-serialisable) at the next checkpoint."""
+        self._buffer((job, key, self.json_dumps(result), None, False))
+
+    def fail(self, job: str, key: str, error: Union[str, BaseException], retry: bool = True) -> None:
+        """
+        Record a failed attempt at the next checkpoint.
+
+        The item goes back to pending, leasable again after the retry delay, while
+        it has attempts left and ``retry`` is True, and is marked failed otherwise.
+        """
+        message = error if isinstance(error, str) else f"{type(error).__name__}: {error}"
+        self._buffer((job, key, None, message, retry))
+
+    def _buffer(self, entry: Tuple[str, str, Optional[bytes], Optional[str], bool]) -> None:
+        with self._lock:
+            self._pending.append(entry)
+            if len(self._pending) >= self.batch_size or self.clock() - self._flushed >= self.flush_interval:
+                self.flush()
+
+    def flush(self) -> None:
+        """Write all buffered results in one transaction."""
+        with self._lock:
+            entries, self._pending = self._pending, []
+            self._flushed = now = self.clock()
+            if not entries:
+                return
+            with self._transaction() as db:
+                for job, key, result, error, retry in entries:
+                    if error is None:
+                        db.execute(
+                            "UPDATE items SET state = 'done', result = ?, error = NULL, owner = NULL, expires = NULL,"
+                            " updated = ? WHERE job = ? AND key = ? AND state != 'done'",
+                            (result, now, job, key),
+                        )
+                    else:
+                        # A retried item keeps ``expires`` as the time it becomes leasable again.
+                        db.execute(
+                            "UPDATE items SET state = CASE WHEN ? AND attempts < ? THEN 'pending' ELSE 'failed' END,"
+                            " expires = CASE WHEN ? AND attempts < ? THEN ? + MIN(?, ? * (1 << MAX(attempts - 1, 0))) END,"
+                            " error = ?, owner = NULL, updated = ?"
+                            " WHERE job = ? AND key = ? AND state != 'done'",
+                            (retry, self.max_attempts, retry, self.max_attempts, now, self.max_retry_delay,
+                             self.retry_delay, error, now, job, key),
+                        )
+
+    def stats(self, job: str) -> Dict[str, int]:
+        """Item counts of ``job`` per state."""
+        self.flush()
+        with self._lock:
+            counts = dict(self._db.execute("SELECT state, COUNT(*) FROM items WHERE job = ? GROUP BY state", (job,)))
+        return {state: counts.get(state, 0) for state in (PENDING, LEASED, DONE, FAILED)}
+
+    def next_due(self, job: str) -> Optional[float]:
+        """Seconds until a pending item of ``job`` can be leased (0 if one can now), or None if none is pending."""
+        self.flush()
+        with self._lock:
+            count, due = self._db.execute(
+                "SELECT COUNT(*), MIN(COALESCE(expires, 0)) FROM items WHERE job = ? AND state = 'pending'", (job,)
+            ).fetchone()
+        return max(0.0, due - self.clock()) if count else None
+
+    def results(self, job: str) -> Iterator[Tuple[str, Any]]:
+        """Yield ``(key, result)`` for every done item of ``job``."""
+        self.flush()
+        with self._lock:
+            rows = self._db.execute("SELECT key, result FROM items WHERE job = ? AND state = 'done'", (job,)).fetchall()
+        for key, result in rows:
+            yield key, self.json_loads(result)
+
+    def failures(self, job: str) -> Iterator[Tuple[str, str]]:
+        """Yield ``(key, error)`` for every failed item of ``job``."""
+        self.flush()
+        with self._lock:
+            rows = self._db.execute("SELECT key, error FROM items WHERE job = ? AND state = 'failed'", (job,)).fetchall()
+        yield from rows
+
+    def retry_failed(self, job: str) -> int:
+        """Give every failed item of ``job`` a fresh set of attempts."""
+        with self._lock, self._transaction() as db:
+            return db.execute(
+                "UPDATE items SET state = 'pending', attempts = 0, error = NULL, expires = NULL, updated = ?"
+                " WHERE job = ? AND state = 'failed'",
+                (self.clock(), job),
+            ).rowcount
+
+    def close(self) -> None:
+        """Checkpoint buffered results and close the database."""
+        with self._lock:
+            self.flush()
+            self._db.close()
+
+
+def retryable(error: BaseException) -> bool:
+    """Default ``run_job`` retry rule: everything except client errors (4xx other than 429)."""
+    status = getattr(error, "status", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    return status is None or status >= 500 or status == 429
+
+
+async def run_job(
+    store: JobStore,
+    job: str,
+    func: Callable[[str], Awaitable[Any]],
+    concurrency: int = 10,
+    owner: Optional[str] = None,
+    keys: Optional[Iterable[str]] = None,
+    retry: Callable[[BaseException], bool] = retryable,
+) -> AsyncIterator[BulkResult]:
+    """
+    Work through ``job`` with ``func``, checkpointing every result into ``store``.
+
+    Items are leased in small batches as slots free up, so several processes can
+    run the same job against one store. Rerunning after a crash continues with
+    the items not yet done; with a fixed ``owner`` its old leases are reclaimed
+    at once. Failed items are retried after the store's retry delay. Returns
+    when no item is left pending.
+
+    Outages do not use up attempts: on :class:`CircuitOpenError` the item is
+    released and leasing pauses until the breaker's ``retry_after``; on
+    :class:`QuotaExhaustedError` the item is released, the calls in flight
+    finish, and the error is raised, so a later run continues the job.
+
+    Args:
+        store (JobStore): The job store.
+        job (str): Job name.
+        func (Callable): Coroutine function taking one key, e.g. ``client.get_posts``.
+        concurrency (int): Calls in flight at most (default: 10).
+        owner (str, optional): Stable worker name; defaults to one unique to this run.
+        keys (Iterable[str], optional): Keys to enqueue first; known keys keep their state.
+        retry (Callable): Whether a failed item may be attempted again (default: :func:`retryable`).
+
+    Yields:
+        BulkResult: One result per attempt made by this worker, in completion order.
+    """
+    if keys is not None:
+        store.add(job, keys)
+    if owner is None:
+        owner = default_owner()
+    else:
+        store.release(job, owner)
+    paused_until = 0.0
+    exhausted: Optional[QuotaExhaustedError] = None
+
+    async def leased() -> AsyncIterator[str]:
+        while exhausted is None:
+            pause = paused_until - time.monotonic()
+            if pause > 0:
+                await asyncio.sleep(pause)
+                continue
+            batch = store.lease(job, concurrency, owner)
+            if not batch:
+                return
+            for key in batch:
+                yield key
+
+    try:
+        while True:
+            async for result in bounded_gather(func, leased(), concurrency):
+                if result.ok:
+                    store.complete(job, result.key, result.value)
+                elif isinstance(result.error, QuotaExhaustedError):
+                    store.release(job, owner, [result.key])
+                    exhausted = result.error
+                elif isinstance(result.error, CircuitOpenError):
+                    store.release(job, owner, [result.key])
+                    paused_until = max(paused_until, time.monotonic() + (result.error.retry_after or 1.0))
+                else:
+                    store.fail(job, result.key, result.error, retry(result.error))
+                yield result
+            if exhausted is not None:
+                raise exhausted
+            # Nothing leasable right now: wait for the earliest delayed retry, if any.
+            due = store.next_due(job)
+            if due is None:
+                return
+            await asyncio.sleep(max(due, paused_until - time.monotonic(), 0.0))
+    finally:
+        store.flush()
@@ -0,0 +1,34 @@
+from importlib import import_module
+from typing import Callable, Dict, List, Tuple
+
+
+def lazy_exports(package: str, exports: Dict[str, str]) -> Tuple[Callable[[str], object], Callable[[], List[str]]]:
+    """
+    Build a module-level ``__getattr__``/``__dir__`` pair that imports exports on first access.
+
+    Only the submodule that defines the requested name is imported, so picking
+    one backend never pulls in the others.
+
+    Args:
+        package (str): ``__name__`` of the module doing the exporting.
+        exports (Dict[str, str]): Exported name -> module path, relative to the
+            exporting module's package (e.g. ``".aiohttp_client"``).
+
+    Returns:
+        Tuple: ``(__getattr__, __dir__)`` to assign in the package namespace.
+    """
+    namespace = import_module(package).__dict__
+
+    def __getattr__(name: str) -> object:
+        try:
+            module_path = exports[name]
+        except KeyError:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}") from None
+        value = getattr(import_module(module_path, namespace["__package__"]), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(exports))
+
+    return __getattr__, __dir__
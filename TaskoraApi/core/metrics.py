@@ -0,0 +1,282 @@
+import threading
+import warnings
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+#: Histogram bucket upper bounds in seconds: 1 ms to ~131 s, four buckets per doubling.
+BOUNDS: Tuple[float, ...] = tuple(0.001 * 2 ** (i / 4) for i in range(69))
+#: Subset of ``BOUNDS`` (the powers of two) exported to Prometheus.
+EXPORT_BOUNDS: Tuple[float, ...] = BOUNDS[::4]
+PHASES = ("dns", "connect", "tls", "ttfb", "download", "total")
+
+Hook = Callable[["RequestEvent"], None]
+
+
+@dataclass
+class RequestEvent:
+    """
+    One HTTP attempt, emitted after it finished or failed.
+
+    Attributes:
+        client (str): Client class name, e.g. "AiohttpInstagramAPI".
+        backend (str): "aiohttp", "httpx" or "requests".
+        method (str): HTTP method.
+        endpoint (str): Endpoint path as passed to ``_request`` (no query string).
+        status (int, optional): HTTP status, or None if no response arrived.
+        bytes (int): Size of the response body.
+        timings (Dict[str, float]): Seconds spent per phase. ``total`` is always present.
+            ``dns``, ``connect`` and ``tls`` appear only for new connections, as far as the
+            backend reports them. ``ttfb`` is the wait from sending to the first response
+            byte, and ``download`` is the body transfer.
+        error (BaseException, optional): The exception raised, if any.
+    """
+
+    client: str
+    backend: str
+    method: str
+    endpoint: str
+    status: Optional[int]
+    bytes: int
+    timings: Dict[str, float] = field(default_factory=dict)
+    error: Optional[BaseException] = None
+
+
+def phase_timings(marks: Dict[str, float], started: float, finished: float) -> Dict[str, float]:
+    """
+    Turn ``perf_counter`` marks recorded by a backend into per-phase durations.
+
+    Recognised marks: ``dns_start/end``, ``connect_start/end``, ``tls_start/end``,
+    ``request_start`` (headers being sent), ``headers`` (response headers received).
+    """
+    timings = {"total": finished - started}
+    dns = connect = tls = 0.0
+    if "dns_end" in marks and "dns_start" in marks:
+        dns = timings["dns"] = marks["dns_end"] - marks["dns_start"]
+    if "tls_end" in marks and "tls_start" in marks:
+        tls = timings["tls"] = marks["tls_end"] - marks["tls_start"]
+    if "connect_end" in marks and "connect_start" in marks:
+        connect = marks["connect_end"] - marks["connect_start"]
+        # Backends that resolve or handshake inside their connect step report one span.
+        if marks.get("dns_start", -1.0) >= marks["connect_start"]:
+            connect -= dns
+        if marks.get("tls_end", float("inf")) <= marks["connect_end"]:
+            connect -= tls
+        timings["connect"] = max(0.0, connect)
+    if "headers" in marks:
+        sent = marks.get("request_start") or max(
+            marks.get("connect_end", started), marks.get("tls_end", started), started
+        )
+        timings["ttfb"] = max(0.0, marks["headers"] - sent)
+        timings["download"] = max(0.0, finished - marks["headers"])
+    return timings
+
+
+def _label(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def emit(hooks: Iterable[Hook], event: RequestEvent) -> None:
+    """Call every hook with ``event``; a failing hook is reported, never raised into the request."""
+    for hook in hooks:
+        try:
+            hook(event)
+        except Exception as exc:
+            warnings.warn(f"Request hook {hook!r} failed: {exc!r}", RuntimeWarning)
+
+
+class LatencyHistogram:
+    """
+    Log-bucketed latency histogram with constant memory.
+
+    Percentiles are interpolated within a bucket; buckets are 19% wide, which
+    bounds the relative error of any percentile.
+    """
+
+    __slots__ = ("counts", "count", "sum", "min", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(BOUNDS) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect_left(BOUNDS, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Estimated ``q``-quantile in seconds (``q`` in 0..1), or None when empty."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index, bucket in enumerate(self.counts):
+            if bucket and seen + bucket >= rank:
+                lower = BOUNDS[index - 1] if index else 0.0
+                upper = BOUNDS[index] if index < len(BOUNDS) else self.max
+                value = lower + (upper - lower) * (rank - seen) / bucket
+                return min(max(value, self.min), self.max)
+            seen += bucket
+        return self.max
+
+    def cumulative(self, bounds: Iterable[float] = EXPORT_BOUNDS) -> List[Tuple[float, int]]:
+        """Cumulative counts at the given bucket bounds (which must be members of ``BOUNDS``)."""
+        result, total, index = [], 0, 0
+        for bound in bounds:
+            stop = BOUNDS.index(bound) + 1
+            total += sum(self.counts[index:stop])
+            index = stop
+            result.append((bound, total))
+        return result
+
+    def summary(self) -> Dict[str, Optional[float]]:
+        return {
+            "count": self.count,
+            "mean": self.sum / self.count if self.count else None,
+            "p50": self.percentile(0.50),
+            "p95": self.percentile(0.95),
+            "p99": self.percentile(0.99),
+            "max": self.max if self.count else None,
+        }
+
+
+class _EndpointStats:
+    __slots__ = ("phases", "statuses", "errors", "bytes")
+
+    def __init__(self):
+        self.phases: Dict[str, LatencyHistogram] = {}
+        self.statuses: Dict[str, int] = {}
+        self.errors = 0
+        self.bytes = 0
+
+
+class Metrics:
+    """
+    Thread-safe per-endpoint aggregation of :class:`RequestEvent` objects.
+
+    Every client records into its own ``client.metrics`` by default; assign one
+    instance to several clients to aggregate them together. Also usable as a
+    plain hook (``client.add_hook(metrics)``).
+    """
+
+    def __init__(self):
+        self._endpoints: Dict[Tuple[str, str], _EndpointStats] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, event: RequestEvent) -> None:
+        self.record(event)
+
+    def record(self, event: RequestEvent) -> None:
+        key = (event.client, event.endpoint)
+        status = str(event.status) if event.status is not None else "error"
+        with self._lock:
+            stats = self._endpoints.get(key)
+            if stats is None:
+                stats = self._endpoints[key] = _EndpointStats()
+            stats.statuses[status] = stats.statuses.get(status, 0) + 1
+            stats.bytes += event.bytes
+            if event.error is not None:
+                stats.errors += 1
+            for phase, seconds in event.timings.items():
+                histogram = stats.phases.get(phase)
+                if histogram is None:
+                    histogram = stats.phases[phase] = LatencyHistogram()
+                histogram.observe(seconds)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._endpoints.clear()
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Per-endpoint counters and latency percentiles.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: ``{endpoint: {requests, errors, bytes, statuses, latency, phases}}``,
+            where ``latency`` and each phase hold count, mean, p50, p95, p99 and max in seconds.
+            Endpoints of different clients sharing this instance are prefixed with the client name.
+        """
+        with self._lock:
+            clients = {client for client, _ in self._endpoints}
+            result = {}
+            for (client, endpoint), stats in sorted(self._endpoints.items()):
+                name = endpoint if len(clients) == 1 else f"{client}:{endpoint}"
+                phases = {phase: h.summary() for phase, h in stats.phases.items()}
+                result[name] = {
+                    "requests": sum(stats.statuses.values()),
+                    "errors": stats.errors,
+                    "bytes": stats.bytes,
+                    "statuses": dict(stats.statuses),
+                    "latency": phases.pop("total", LatencyHistogram().summary()),
+                    "phases": phases,
+                }
+            return result
+
+    def to_prometheus(self, prefix: str = "taskora") -> str:
+        """
+        Render all series in the Prometheus text exposition format.
+
+        Exposes ``<prefix>_requests_total{client,endpoint,status}``,
+        ``<prefix>_response_bytes_total{client,endpoint}`` and the
+        ``<prefix>_request_duration_seconds{client,endpoint,phase}`` histogram.
+        """
+        def labels(**values: Any) -> str:
+            return "{" + ",".join(f'{key}="{_label(value)}"' for key, value in values.items()) + "}"
+
+        with self._lock:
+            items = sorted(self._endpoints.items())
+            requests = [f"# HELP {prefix}_requests_total Requests by endpoint and status.",
+                        f"# TYPE {prefix}_requests_total counter"]
+            sizes = [f"# HELP {prefix}_response_bytes_total Response body bytes received.",
+                     f"# TYPE {prefix}_response_bytes_total counter"]
+            durations = [f"# HELP {prefix}_request_duration_seconds Request latency by phase.",
+                         f"# TYPE {prefix}_request_duration_seconds histogram"]
+            for (client, endpoint), stats in items:
+                for status, count in sorted(stats.statuses.items()):
+                    requests.append(f"{prefix}_requests_total{labels(client=client, endpoint=endpoint, status=status)} {count}")
+                sizes.append(f"{prefix}_response_bytes_total{labels(client=client, endpoint=endpoint)} {stats.bytes}")
+                for phase in PHASES:
+                    histogram = stats.phases.get(phase)
+                    if histogram is None:
+                        continue
+                    base = dict(client=client, endpoint=endpoint, phase=phase)
+                    for bound, count in histogram.cumulative():
+                        durations.append(f"{prefix}_request_duration_seconds_bucket{labels(**base, le=f'{bound:g}')} {count}")
+                    durations.append(f"{prefix}_request_duration_seconds_bucket{labels(**base, le='+Inf')} {histogram.count}")
+                    durations.append(f"{prefix}_request_duration_seconds_sum{labels(**base)} {histogram.sum}")
+                    durations.append(f"{prefix}_request_duration_seconds_count{labels(**base)} {histogram.count}")
+        return "\n".join(requests + sizes + durations) + "\n"
+
+
+def serve_prometheus(metrics: Metrics, port: int = 9464, host: str = "127.0.0.1", prefix: str = "taskora"):
+    """
+    Serve ``metrics.to_prometheus()`` at ``http://host:port/metrics`` from a daemon thread.
+
+    Returns:
+        http.server.ThreadingHTTPServer: Call ``shutdown()`` to stop it.
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = metrics.to_prometheus(prefix).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, name="TaskoraApi-metrics", daemon=True).start()
+    return server
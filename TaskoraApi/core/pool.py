@@ -0,0 +1,59 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class PoolLimits:
+    """
+    Connection pool settings shared by every backend.
+
+    Attributes:
+        max_connections (int): Total number of open connections the client may hold (aiohttp and httpx).
+        max_connections_per_host (int): Connections allowed to a single host.
+        keepalive_expiry (float): Seconds an idle connection is kept before it is dropped.
+        dns_cache_ttl (int): Seconds resolved addresses are cached (aiohttp only).
+    """
+
+    max_connections: int = 100
+    max_connections_per_host: int = 20
+    keepalive_expiry: float = 30.0
+    dns_cache_ttl: int = 300
+
+    def aiohttp_connector(self):
+        """Build an ``aiohttp.TCPConnector`` honouring these limits."""
+        import aiohttp
+
+        return aiohttp.TCPConnector(
+            limit=self.max_connections,
+            limit_per_host=self.max_connections_per_host,
+            keepalive_timeout=self.keepalive_expiry,
+            ttl_dns_cache=self.dns_cache_ttl,
+        )
+
+    def httpx_limits(self):
+        """Build an ``httpx.Limits`` honouring these limits."""
+        import httpx
+
+        # httpx has no per-host cap; every client here talks to one host, so the
+        # per-host value bounds the idle keep-alive pool instead.
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_connections_per_host,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def requests_adapter(self):
+        """
+        Build a ``requests`` HTTPAdapter honouring these limits.
+
+        urllib3 only knows a per-host cap: ``pool_maxsize`` with ``pool_block``
+        makes callers wait for a free connection instead of opening extra ones.
+        ``pool_connections`` is how many per-host pools are cached, not a
+        connection limit, so it keeps its default. urllib3 has no idle expiry;
+        ``RequestsBaseClient`` enforces ``keepalive_expiry`` itself.
+        """
+        from requests.adapters import HTTPAdapter
+
+        return HTTPAdapter(pool_maxsize=self.max_connections_per_host, pool_block=True)
+
+
+DEFAULT_LIMITS = PoolLimits()
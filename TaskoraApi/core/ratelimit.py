@@ -0,0 +1,234 @@
+import asyncio
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from .errors import QuotaExhaustedError
+
+
+# Normalised key-status field name -> seconds per period.
+_RATE_FIELDS = {
+    "requests_per_second": 1, "rate_per_second": 1, "per_second": 1, "rps": 1,
+    "requests_per_minute": 60, "rate_per_minute": 60, "per_minute": 60, "rpm": 60, "rate_limit": 60,
+    "requests_per_hour": 3600, "per_hour": 3600, "hourly_limit": 3600,
+    "requests_per_day": 86400, "per_day": 86400, "daily_limit": 86400,
+}
+_REMAINING_FIELDS = ("remaining", "remaining_requests", "requests_left", "remaining_calls", "usage_left", "left")
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket shared by any number of clients, threads and event loops.
+
+    Tokens accrue at ``rate`` per second up to ``capacity``. Each request takes
+    one; when none are left the caller waits exactly until its token is due,
+    so bursts are smoothed into a steady stream instead of server-side 429s.
+
+    Optionally the bucket also tracks the key's overall ``remaining`` budget and
+    raises :class:`QuotaExhaustedError` once it is spent, without a round trip.
+    """
+
+    _shared: Dict[str, "TokenBucket"] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        remaining: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            rate (float): Tokens added per second.
+            capacity (float, optional): Maximum burst size (default: ``max(1, rate)``).
+            remaining (int, optional): Total requests the key may still make; None for unlimited.
+            clock (Callable[[], float]): Time source, monotonic by default.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive.")
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        self.remaining = remaining
+        self.clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+        self.waited = 0.0
+
+    @classmethod
+    def shared(cls, service: str, rate: float, capacity: Optional[float] = None) -> "TokenBucket":
+        """
+        Return the process-wide bucket for ``service``, creating it on first use.
+
+        Every client handed the same shared bucket draws from one budget, e.g.
+        ``TokenBucket.shared("instagram", rate=5)``. Later calls return the existing
+        bucket unchanged; use :meth:`configure` to adjust it.
+        """
+        with cls._shared_lock:
+            bucket = cls._shared.get(service)
+            if bucket is None:
+                bucket = cls._shared[service] = cls(rate, capacity)
+            return bucket
+
+    def configure(
+        self,
+        rate: Optional[float] = None,
+        capacity: Optional[float] = None,
+        remaining: Optional[int] = None,
+    ) -> None:
+        """Change the rate, burst size or remaining budget in place."""
+        with self._lock:
+            self._refill()
+            if rate is not None:
+                if rate <= 0:
+                    raise ValueError("rate must be positive.")
+                self.rate = float(rate)
+            if capacity is not None:
+                self.capacity = float(capacity)
+                self._tokens = min(self._tokens, self.capacity)
+            if remaining is not None:
+                self.remaining = remaining
+
+    def seed_from_status(self, status: Dict[str, Any]) -> bool:
+        """
+        Adopt the rate and remaining budget reported by a validate-key response.
+
+        The lookup is best-effort: it searches the (possibly nested) response for
+        common field names such as ``requests_per_minute``, ``rate_limit`` or
+        ``remaining``. ``rate_limit`` is read as requests per minute.
+
+        Args:
+            status (Dict[str, Any]): Response of ``validate_key``, ``is_key_validate`` or ``rechaptcha_key_status``.
+
+        Returns:
+            bool: True if at least one value was applied.
+        """
+        rate = remaining = None
+        stack = [status]
+        while stack:
+            node = stack.pop()
+            if not isinstance(node, dict):
+                continue
+            for name, value in node.items():
+                if isinstance(value, dict):
+                    stack.append(value)
+                    continue
+                if isinstance(value, bool) or not isinstance(value, (int, float)):
+                    continue
+                field = str(name).lower().replace("-", "_")
+                if rate is None and field in _RATE_FIELDS and value > 0:
+                    rate = value / _RATE_FIELDS[field]
+                elif remaining is None and field in _REMAINING_FIELDS and value >= 0:
+                    remaining = int(value)
+        if rate is None and remaining is None:
+            return False
+        self.configure(rate=rate, remaining=remaining)
+        return True
+
+    def _refill(self) -> None:
+        now = self.clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, tokens: float = 1) -> float:
+        """
+        Take ``tokens`` now and return how many seconds the caller must wait before using them.
+
+        Raises:
+            QuotaExhaustedError: If the remaining budget is spent.
+        """
+        with self._lock:
+            if self.remaining is not None:
+                if self.remaining < tokens:
+                    raise QuotaExhaustedError()
+                self.remaining -= int(tokens)
+            self._refill()
+            self._tokens -= tokens
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            self.waited += delay
+            return delay
+
+    async def acquire(self, tokens: float = 1) -> None:
+        """Wait until ``tokens`` may be spent (async)."""
+        delay = self.reserve(tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def acquire_sync(self, tokens: float = 1) -> None:
+        """Wait until ``tokens`` may be spent (blocking)."""
+        delay = self.reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+
+    def stats(self) -> Dict[str, Any]:
+        """Current rate, available tokens, remaining budget and total time callers spent waiting."""
+        with self._lock:
+            self._refill()
+            return {
+                "rate": self.rate,
+                "capacity": self.capacity,
+                "tokens": self._tokens,
+                "remaining": self.remaining,
+                "waited": self.waited,
+            }
+
+
+class SharedTokenBucket(TokenBucket):
+    """
+    :class:`TokenBucket` whose state lives in shared memory, for one budget across processes.
+
+    Pass the bucket to worker processes when starting them (``Process`` args or a
+    pool initializer); each worker sets it as its client's ``rate_limiter``.
+    The clock must be system-wide, which ``time.monotonic`` is.
+    """
+
+    # Slots of the shared array; remaining is -1 when unlimited.
+    _TOKENS, _UPDATED, _REMAINING, _WAITED, _RATE, _CAPACITY = range(6)
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        remaining: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+        context: Any = None,
+    ):
+        """
+        Args:
+            rate (float): Tokens added per second, across all processes.
+            capacity (float, optional): Maximum burst size (default: ``max(1, rate)``).
+            remaining (int, optional): Total requests the key may still make; None for unlimited.
+            clock (Callable[[], float]): System-wide time source, monotonic by default.
+            context (multiprocessing context, optional): Context the workers are started with.
+        """
+        import multiprocessing
+
+        self._state = (context or multiprocessing).Array("d", 6)
+        super().__init__(rate, capacity, remaining, clock)
+        self._lock = self._state.get_lock()
+
+    def _slot(index: int) -> property:
+        def get(self) -> float:
+            return self._state[index]
+
+        def set(self, value: float) -> None:
+            self._state[index] = value
+
+        return property(get, set)
+
+    _tokens = _slot(_TOKENS)
+    _updated = _slot(_UPDATED)
+    waited = _slot(_WAITED)
+    rate = _slot(_RATE)
+    capacity = _slot(_CAPACITY)
+    del _slot
+
+    @property
+    def remaining(self) -> Optional[int]:
+        value = self._state[self._REMAINING]
+        return None if value < 0 else int(value)
+
+    @remaining.setter
+    def remaining(self, value: Optional[int]) -> None:
+        self._state[self._REMAINING] = -1 if value is None else value
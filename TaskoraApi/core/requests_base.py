@@ -0,0 +1,546 @@
+import threading
+import time
+import requests
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .bulk import threaded_map
+from .cache import FRESH, STALE, ResponseCache, Validators
+from .cassette import Cassette, Interaction, reason_phrase
+from .errors import TaskoraApiError
+from .jsonlib import get_decoder, get_encoder
+from .metrics import Hook, Metrics, RequestEvent, emit, phase_timings
+from .pool import DEFAULT_LIMITS, PoolLimits
+from .ratelimit import TokenBucket
+from .resilience import DEFAULT_RESILIENCE, ResiliencePolicy, parse_retry_after
+from .streaming import STREAM_ACCEPT, ResponseStream
+
+
+def _star_call(func: Callable[..., Any], args: Iterable[Any]) -> Any:
+    return func(*args)
+
+
+class RequestsBaseClient:
+    """
+    Shared requests plumbing for the service clients.
+
+    Each thread using an instance gets its own ``requests.Session`` with a sized
+    connection pool, so one client can be shared by worker threads (see
+    :meth:`map_concurrent`). Connections idle for longer than
+    ``limits.keepalive_expiry`` are dropped before the next call instead of
+    being reused half-closed.
+
+    With a ``rate_limiter`` set, every request that reaches the network first
+    waits for a token; cache hits are free.
+
+    Failed attempts are retried and counted by ``self.resilience`` (see
+    :class:`ResiliencePolicy`); idempotent calls retry on transport errors and
+    5xx, others only on 429.
+
+    Response bodies are decoded from raw bytes with ``self.json_loads``, the
+    fastest installed decoder (see :func:`get_decoder`), chosen once per client.
+
+    Every HTTP attempt is timed and aggregated into ``self.metrics``; ``stats()``
+    returns a snapshot and ``add_hook`` subscribes to the raw events. requests
+    exposes no connection events, so only ``ttfb``, ``download`` and ``total`` are measured.
+
+    Attach a :class:`Cassette` as ``self.cassette`` to record live responses or
+    replay recorded ones without touching the network.
+    """
+
+    backend = "requests"
+
+    #: Name of the method returning the key's status, used by ``seed_rate_limiter``.
+    key_status_method: Optional[str] = None
+    #: Cheap endpoint probed by a half-open circuit breaker.
+    status_endpoint = "/api/v1/status"
+
+    #: Raise ``requests.HTTPError`` on HTTP errors instead of the generic API error.
+    native_errors = False
+
+    def __init__(self, base_url: str, timeout: int = 60, limits: Optional[PoolLimits] = None):
+        """
+        Args:
+            base_url (str): Prefix prepended to every endpoint.
+            timeout (int): Request timeout in seconds (default: 60).
+            limits (PoolLimits, optional): Connection pool settings.
+        """
+        self.base_url = base_url
+        self.timeout = timeout
+        self.limits = limits or DEFAULT_LIMITS
+        self.cache: Optional[ResponseCache] = None
+        self.rate_limiter: Optional[TokenBucket] = None
+        self.resilience: ResiliencePolicy = DEFAULT_RESILIENCE
+        self.json_loads = get_decoder()
+        self.json_dumps = get_encoder()
+        self.metrics: Optional[Metrics] = Metrics()
+        self.hooks: List[Hook] = []
+        self.cassette: Optional[Cassette] = None
+        self._local = threading.local()
+        self._sessions: Dict[threading.Thread, requests.Session] = {}
+        self._sessions_lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _new_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = self.limits.requests_adapter()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    @property
+    def session(self) -> requests.Session:
+        """The calling thread's pooled session, created on first use."""
+        local = self._local
+        now = time.monotonic()
+        session = getattr(local, "session", None)
+        if session is None:
+            session = local.session = self._new_session()
+            with self._sessions_lock:
+                self._prune_sessions()
+                self._sessions[threading.current_thread()] = session
+        elif now - local.last_used > self.limits.keepalive_expiry:
+            # Closing the adapters empties their pools; the session stays usable.
+            session.close()
+        local.last_used = now
+        return session
+
+    def _prune_sessions(self) -> None:
+        # Called with ``_sessions_lock`` held: drop the sessions of finished threads.
+        for thread in [thread for thread in self._sessions if not thread.is_alive()]:
+            self._sessions.pop(thread).close()
+
+    def map_concurrent(
+        self,
+        method: Union[str, Callable[..., Any]],
+        args: Iterable[Any],
+        workers: int = 10,
+        ordered: bool = True,
+        star: bool = False,
+    ) -> Iterator[Any]:
+        """
+        Call ``method`` for every item of ``args`` on a pool of ``workers`` threads.
+
+        Each worker thread uses its own pooled session. Unlike the ``*_many``
+        bulk methods, results are the plain return values, and an item's
+        exception is raised when its result is reached.
+
+        Args:
+            method (str | Callable): Client method name (e.g. "get_profile") or any callable.
+            args (Iterable): One item per call, consumed lazily.
+            workers (int): Number of worker threads (default: 10).
+            ordered (bool): Yield results in input order (default) or as they complete.
+            star (bool): Unpack each item as positional arguments.
+
+        Yields:
+            Any: The results.
+        """
+        func = getattr(self, method) if isinstance(method, str) else method
+        if star:
+            func = partial(_star_call, func)
+        try:
+            yield from threaded_map(func, args, workers, ordered)
+        finally:
+            with self._sessions_lock:
+                self._prune_sessions()
+
+    def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        cached: bool = False,
+        idempotent: Optional[bool] = None,
+    ) -> Any:
+        """
+        Send a request and return the decoded JSON body.
+
+        Args:
+            method (str): HTTP method.
+            endpoint (str): Path appended to ``base_url``.
+            params (Dict[str, Any], optional): Query parameters.
+            cached (bool): Serve from ``self.cache`` when one is configured.
+                Stale entries are refreshed on a background thread.
+            idempotent (bool, optional): Whether repeating the call is harmless, which
+                allows retrying it. Defaults to True for GET and False otherwise.
+
+        Returns:
+            Any: JSON response from the API.
+        """
+        if idempotent is None:
+            idempotent = method == "GET"
+        if not cached or self.cache is None:
+            return self._transmit(method, endpoint, params, idempotent)
+
+        key = self.cache.make_key(method, endpoint, params)
+        state, value = self.cache.lookup(key)
+        if state == FRESH:
+            return value
+        if state == STALE:
+            if self.cache.begin_refresh(key):
+                threading.Thread(
+                    target=self._refresh,
+                    args=(key, method, endpoint, params, idempotent),
+                    name="TaskoraApi-cache-refresh",
+                    daemon=True,
+                ).start()
+            return value
+        return self._cache_fill(key, method, endpoint, params, idempotent)
+
+    def _request_decoded(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        decode: Callable[[bytes], Any],
+        convert: Callable[[Any], Any],
+        idempotent: Optional[bool] = None,
+    ) -> Any:
+        """
+        Send a request and build the result straight from the response bytes with ``decode``.
+
+        With ``self.cache`` configured the decoded JSON goes through the cache as in
+        ``_request(cached=True)``, and ``convert`` builds the result from it instead.
+        """
+        if idempotent is None:
+            idempotent = method == "GET"
+        if self.cache is not None:
+            return convert(self._request(method, endpoint, params, cached=True, idempotent=idempotent))
+        return self._transmit(method, endpoint, params, idempotent, partial(self._send, decode=decode))
+
+    def _cache_fill(
+        self, key: Any, method: str, endpoint: str, params: Optional[Dict[str, Any]], idempotent: bool
+    ) -> Any:
+        """Fetch a response into the cache, as a conditional request when validators are stored for it."""
+        def fetch(validators: Validators) -> Any:
+            return self._transmit(method, endpoint, params, idempotent, partial(self._send, validators=validators))
+
+        validators = self.cache.validators(key)
+        value = fetch(validators)
+        if validators.not_modified:
+            found, value = self.cache.renew(key, endpoint)
+            if found:
+                return value
+            # Evicted meanwhile: fetch the body unconditionally.
+            validators = Validators()
+            value = fetch(validators)
+        self.cache.store(key, endpoint, value, validators)
+        return value
+
+    def _refresh(
+        self, key: Any, method: str, endpoint: str, params: Optional[Dict[str, Any]], idempotent: bool
+    ) -> None:
+        try:
+            self._cache_fill(key, method, endpoint, params, idempotent)
+        except Exception:
+            # Keep serving the stale entry; the next stale hit schedules another attempt.
+            pass
+        finally:
+            self.cache.end_refresh(key)
+
+    def add_hook(self, hook: Hook) -> Hook:
+        """
+        Call ``hook`` with a :class:`RequestEvent` after every HTTP attempt.
+
+        Returns the hook, so this also works as a decorator.
+        """
+        self.hooks.append(hook)
+        return hook
+
+    def _record(
+        self,
+        method: str,
+        endpoint: str,
+        status: Optional[int],
+        size: int,
+        marks: Dict[str, float],
+        started: float,
+        error: Optional[BaseException],
+    ) -> None:
+        if self.metrics is None and not self.hooks:
+            return
+        finished = marks.get("done") or time.perf_counter()
+        event = RequestEvent(
+            type(self).__name__, self.backend, method, endpoint, status, size,
+            phase_timings(marks, started, finished), error,
+        )
+        if self.metrics is not None:
+            self.metrics.record(event)
+        emit(self.hooks, event)
+
+    def _error_data(self, body: bytes) -> Any:
+        """Decode an error body, falling back to its text."""
+        try:
+            return self.json_loads(body)
+        except Exception:
+            return body.decode("utf-8", "replace")
+
+    def _body_headers(
+        self, json_body: Optional[Any], headers: Optional[Dict[str, str]] = None
+    ) -> Tuple[Optional[bytes], Dict[str, str]]:
+        """Encode an optional JSON request body; returns ``(data, headers)``."""
+        headers = dict(headers or {})
+        if json_body is None:
+            return None, headers
+        headers["Content-Type"] = "application/json"
+        return self.json_dumps(json_body), headers
+
+    def _native_error(self, method: str, endpoint: str, interaction: Interaction) -> Exception:
+        """The error the HTTP library would raise for a recorded failure; see ``native_errors``."""
+        response = requests.Response()
+        response.status_code = interaction.status
+        response.reason = reason_phrase(interaction.status)
+        response.headers.update(interaction.headers)
+        response._content = interaction.body
+        response.url = self.base_url + endpoint
+        response.request = requests.Request(method, response.url).prepare()
+        try:
+            response.raise_for_status()
+        except requests.HTTPError as exc:
+            return exc
+        return TaskoraApiError(
+            interaction.status, self._error_data(interaction.body),
+            parse_retry_after(interaction.headers.get("Retry-After")),
+        )
+
+    def _replay(
+        self,
+        method: str,
+        endpoint: str,
+        interaction: Interaction,
+        validators: Optional[Validators] = None,
+        decode: Optional[Callable[[bytes], Any]] = None,
+    ) -> Any:
+        """Return or raise a recorded response exactly as ``_send`` would for a live one."""
+        status, body = interaction.status, interaction.body
+        if validators is not None:
+            validators.update(status, interaction.headers)
+            if validators.not_modified:
+                self._record(method, endpoint, status, len(body), {}, time.perf_counter(), None)
+                return None
+        error: Optional[BaseException] = None
+        started = time.perf_counter()
+        try:
+            if self.native_errors:
+                if status >= 400:
+                    raise self._native_error(method, endpoint, interaction)
+            elif status != 200:
+                raise TaskoraApiError(
+                    status, self._error_data(body), parse_retry_after(interaction.headers.get("Retry-After"))
+                )
+            return (decode or self.json_loads)(body)
+        except BaseException as exc:
+            error = exc
+            raise
+        finally:
+            self._record(method, endpoint, status, len(body), {}, started, error)
+
+    def _failure_info(self, exc: Exception) -> Optional[Tuple[Optional[int], Optional[float]]]:
+        """
+        Classify an exception raised by ``_send``.
+
+        Returns:
+            Optional[Tuple]: ``(status, retry_after)`` for HTTP and transport failures
+            (status None for the latter), or None for anything else.
+        """
+        if isinstance(exc, TaskoraApiError):
+            return exc.status, exc.retry_after
+        if isinstance(exc, requests.HTTPError) and exc.response is not None:
+            return exc.response.status_code, parse_retry_after(exc.response.headers.get("Retry-After"))
+        # ChunkedEncodingError: the connection broke mid-body, e.g. a truncated response.
+        if isinstance(exc, (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError)):
+            return None, None
+        return None
+
+    def _probe(self) -> None:
+        breaker = self.resilience.breaker
+        try:
+            self._send("GET", self.status_endpoint)
+        except BaseException:
+            breaker.record_failure()
+            raise
+        breaker.record_success()
+
+    def _transmit(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        idempotent: bool,
+        send: Optional[Callable[..., Any]] = None,
+    ) -> Any:
+        """Run ``send`` (default ``_send``) under the circuit breaker, rate limiter and retry policy."""
+        send = send or self._send
+        retry, breaker = self.resilience.retry, self.resilience.breaker
+        attempt = 0
+        while True:
+            if breaker is not None and breaker.before_call():
+                self._probe()
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire_sync()
+            try:
+                result = send(method, endpoint, params)
+            except Exception as exc:
+                info = self._failure_info(exc)
+                if info is None:
+                    raise
+                status, retry_after = info
+                if breaker is not None:
+                    if self.resilience.is_backend_failure(status):
+                        breaker.record_failure()
+                    else:
+                        breaker.record_success()
+                delay = retry.next_delay(attempt, status, retry_after, idempotent) if retry else None
+                if delay is None:
+                    raise
+                attempt += 1
+                time.sleep(delay)
+            else:
+                if breaker is not None:
+                    breaker.record_success()
+                return result
+
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_body: Optional[Any] = None,
+        validators: Optional[Validators] = None,
+        decode: Optional[Callable[[bytes], Any]] = None,
+    ) -> Any:
+        """
+        Send one request over the pooled session and return the decoded JSON body.
+
+        Args:
+            method (str): HTTP method.
+            endpoint (str): Path appended to ``base_url``.
+            params (Dict[str, Any], optional): Query parameters.
+            json_body (Any, optional): Sent as a JSON request body when given.
+            validators (Validators, optional): Make the request conditional; a 304
+                returns None and sets ``validators.not_modified``.
+            decode (Callable[[bytes], Any], optional): Builds the result from the body
+                instead of ``self.json_loads``.
+
+        Returns:
+            Any: JSON response from the API.
+        """
+        if self.cassette is not None:
+            interaction = self.cassette.play(method, endpoint, params, json_body)
+            if interaction is not None:
+                return self._replay(method, endpoint, interaction, validators, decode)
+        data, headers = self._body_headers(json_body, validators.request_headers() if validators else None)
+        marks: Dict[str, float] = {}
+        status: Optional[int] = None
+        body = b""
+        error: Optional[BaseException] = None
+        started = time.perf_counter()
+        try:
+            response = self.session.request(
+                method, self.base_url + endpoint, params=params, data=data, headers=headers, timeout=self.timeout
+            )
+            marks["done"] = time.perf_counter()
+            # ``elapsed`` runs from sending the request until the headers were parsed.
+            marks["headers"] = started + response.elapsed.total_seconds()
+            status, body = response.status_code, response.content
+            if self.cassette is not None:
+                self.cassette.record(method, endpoint, params, status, response.headers, body, json_body)
+            if validators is not None:
+                validators.update(status, response.headers)
+                if validators.not_modified:
+                    return None
+            if self.native_errors:
+                response.raise_for_status()
+            elif status != 200:
+                raise TaskoraApiError(
+                    status, self._error_data(body), parse_retry_after(response.headers.get("Retry-After"))
+                )
+            return (decode or self.json_loads)(body)
+        except BaseException as exc:
+            error = exc
+            raise
+        finally:
+            self._record(method, endpoint, status, len(body), marks, started, error)
+
+    def _open_stream(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_body: Optional[Any] = None,
+    ) -> ResponseStream:
+        """
+        Send a request asking for a streamed reply and return the open response once its status is OK.
+
+        Error statuses raise like ``_send``; the attempt is recorded when the stream is closed.
+        """
+        data, headers = self._body_headers(json_body, {"Accept": STREAM_ACCEPT})
+        marks: Dict[str, float] = {}
+        status: Optional[int] = None
+        body = b""
+        started = time.perf_counter()
+        try:
+            response = self.session.request(
+                method, self.base_url + endpoint, params=params, data=data, headers=headers,
+                timeout=self.timeout, stream=True,
+            )
+            marks["headers"] = started + response.elapsed.total_seconds()
+            status = response.status_code
+            if status != 200:
+                body = response.content
+                marks["done"] = time.perf_counter()
+                if self.native_errors:
+                    response.raise_for_status()
+                raise TaskoraApiError(
+                    status, self._error_data(body), parse_retry_after(response.headers.get("Retry-After"))
+                )
+        except BaseException as exc:
+            self._record(method, endpoint, status, len(body), marks, started, exc)
+            raise
+        return ResponseStream(
+            response.headers.get("Content-Type", ""),
+            response.iter_content(chunk_size=None),
+            response.close,
+            lambda size, error: self._record(method, endpoint, status, size, marks, started, error),
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Snapshot of this client's request metrics and of every optional layer.
+
+        Returns:
+            Dict[str, Any]: ``requests`` (per-endpoint counts and p50/p95/p99 latencies,
+            see :meth:`Metrics.snapshot`) plus ``cache``, ``rate_limiter`` and ``circuit`` when those are enabled.
+        """
+        breaker = self.resilience.breaker
+        return {
+            "requests": self.metrics.snapshot() if self.metrics is not None else {},
+            "cache": self.cache.stats() if self.cache is not None else None,
+            "rate_limiter": self.rate_limiter.stats() if self.rate_limiter is not None else None,
+            "circuit": breaker.state if breaker is not None else None,
+        }
+
+    def seed_rate_limiter(self) -> bool:
+        """
+        Query the key status endpoint and adopt its rate and remaining budget.
+
+        Returns:
+            bool: True if the limiter was updated.
+        """
+        if self.rate_limiter is None or self.key_status_method is None:
+            return False
+        status = getattr(self, self.key_status_method)()
+        return self.rate_limiter.seed_from_status(status)
+
+    def close(self) -> None:
+        """Close every thread's pooled session and release their connections."""
+        with self._sessions_lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+            self._local = threading.local()
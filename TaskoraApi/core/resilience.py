@@ -0,0 +1,178 @@
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Callable, FrozenSet, Optional
+
+from .errors import CircuitOpenError
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Convert a ``Retry-After`` header (seconds or HTTP date) to seconds from now."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter.
+
+    Idempotent calls are retried after transport errors (connection reset,
+    timeout) and the statuses in ``retry_statuses``. Other calls are retried
+    only after a 429, because then the server did not act on them.
+    A ``Retry-After`` header replaces the computed backoff.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 20.0,
+        retry_statuses: FrozenSet[int] = frozenset({408, 425, 429, 500, 502, 503, 504}),
+        max_retry_after: float = 60.0,
+    ):
+        """
+        Args:
+            max_attempts (int): Total attempts including the first (default: 3).
+            backoff_base (float): Backoff ceiling of the first retry in seconds; doubles per retry (default: 0.5).
+            backoff_max (float): Upper bound of any backoff (default: 20).
+            retry_statuses (FrozenSet[int]): HTTP statuses worth retrying.
+            max_retry_after (float): Give up instead of honouring a longer ``Retry-After`` (default: 60).
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1.")
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_statuses = frozenset(retry_statuses)
+        self.max_retry_after = max_retry_after
+
+    def next_delay(
+        self,
+        attempt: int,
+        status: Optional[int],
+        retry_after: Optional[float],
+        idempotent: bool,
+    ) -> Optional[float]:
+        """
+        Seconds to wait before the next attempt, or None to give up.
+
+        Args:
+            attempt (int): Zero-based index of the attempt that just failed.
+            status (int, optional): HTTP status, or None for a transport error.
+            retry_after (float, optional): Server-provided ``Retry-After`` in seconds.
+            idempotent (bool): Whether repeating the call is harmless.
+        """
+        if attempt + 1 >= self.max_attempts:
+            return None
+        if status is None:
+            retryable = idempotent
+        else:
+            retryable = status in self.retry_statuses and (idempotent or status == 429)
+        if not retryable:
+            return None
+        if retry_after is not None:
+            return retry_after if retry_after <= self.max_retry_after else None
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+
+class CircuitBreaker:
+    """
+    Fails fast while the backend is down.
+
+    After ``failure_threshold`` consecutive failures (transport errors or 5xx)
+    the circuit opens and calls raise :class:`CircuitOpenError` immediately.
+    Once ``recovery_timeout`` has passed, the next caller probes the backend's
+    status endpoint: success closes the circuit, failure re-opens it. Other
+    callers keep failing fast while the probe is in flight.
+
+    Thread-safe; share one breaker between clients that hit the same backend.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            failure_threshold (int): Consecutive failures that open the circuit (default: 5).
+            recovery_timeout (float): Seconds to stay open before probing (default: 30).
+            clock (Callable[[], float]): Time source, monotonic by default.
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.clock = clock
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def before_call(self) -> bool:
+        """
+        Check whether a call may proceed.
+
+        Returns:
+            bool: True if the caller must probe the backend first (half-open).
+
+        Raises:
+            CircuitOpenError: While the circuit is open or another caller is probing.
+        """
+        with self._lock:
+            if self.state == CLOSED:
+                return False
+            remaining = self.opened_at + self.recovery_timeout - self.clock()
+            if self.state == OPEN and remaining <= 0:
+                self.state = HALF_OPEN
+                return True
+            raise CircuitOpenError(max(0.0, remaining))
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = CLOSED
+            self.failures = 0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = OPEN
+                self.opened_at = self.clock()
+
+
+class ResiliencePolicy:
+    """
+    Retry policy and optional circuit breaker applied to every request of a client.
+
+    Share one instance between clients to share the breaker state.
+    """
+
+    def __init__(self, retry: Optional[RetryPolicy] = None, breaker: Optional[CircuitBreaker] = None):
+        """
+        Args:
+            retry (RetryPolicy, optional): Retry behaviour; None disables retries.
+            breaker (CircuitBreaker, optional): Circuit breaker; None disables it.
+        """
+        self.retry = retry
+        self.breaker = breaker
+
+    @staticmethod
+    def is_backend_failure(status: Optional[int]) -> bool:
+        """Transport errors and 5xx count against the breaker; 4xx mean the backend is up."""
+        return status is None or status >= 500
+
+
+DEFAULT_RESILIENCE = ResiliencePolicy(retry=RetryPolicy())
@@ -0,0 +1,49 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical calls into one.
+
+    While a call for a key is in flight, further callers with the same key
+    await the same future instead of starting their own request. The first
+    caller being cancelled does not cancel the shared request.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self.calls = 0
+        self.deduplicated = 0
+
+    def _forget(self, key: Hashable, future: asyncio.Future) -> None:
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        if not future.cancelled():
+            # Mark the exception as retrieved even if every waiter went away.
+            future.exception()
+
+    async def do(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Await ``factory()`` unless a call for ``key`` is already running, in which case share its result.
+
+        Args:
+            key (Hashable): Identity of the call.
+            factory (Callable): Zero-argument coroutine function performing the call.
+
+        Returns:
+            Any: The shared result.
+        """
+        future = self._inflight.get(key)
+        if future is not None:
+            self.deduplicated += 1
+        else:
+            self.calls += 1
+            future = asyncio.ensure_future(factory())
+            self._inflight[key] = future
+            future.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(future)
+
+    def stats(self) -> Dict[str, int]:
+        """Number of requests actually sent, deduplicated, and currently in flight."""
+        return {"calls": self.calls, "deduplicated": self.deduplicated, "in_flight": len(self._inflight)}
@@ -0,0 +1,202 @@
+import codecs
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, List, Optional, Tuple
+
+#: Accept header for streamed calls: SSE first, then NDJSON, then a plain JSON reply.
+STREAM_ACCEPT = "text/event-stream, application/x-ndjson;q=0.9, application/json;q=0.5"
+NDJSON_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl", "application/json-seq")
+
+Event = Tuple[str, Any]
+
+
+class EventDecoder:
+    """
+    Incremental decoder for streamed response bodies.
+
+    Feed raw chunks as they arrive and collect ``(event, data)`` pairs:
+
+    - ``text/event-stream``: one pair per server-sent event; ``event`` is its type
+      ("message" by default) and ``data`` its decoded JSON, or the text when it is not JSON.
+      A ``[DONE]`` payload ends the stream (``done`` becomes True).
+    - NDJSON: one ("message", object) pair per line.
+    - Any other text type: ("message", text) for every decoded chunk.
+    - ``application/json``: nothing until :meth:`close`, which returns the whole
+      decoded body; this is the buffered fallback for servers that do not stream.
+    """
+
+    def __init__(self, content_type: str, loads: Callable[[bytes], Any]):
+        mime = content_type.split(";", 1)[0].strip().lower()
+        if mime == "text/event-stream":
+            self.mode = "sse"
+        elif mime in NDJSON_TYPES:
+            self.mode = "ndjson"
+        elif mime.endswith("json"):
+            self.mode = "json"
+        else:
+            self.mode = "text"
+        self.loads = loads
+        self.done = False
+        self._buffer = bytearray()
+        self._text = codecs.getincrementaldecoder("utf-8")("replace")
+        self._event = "message"
+        self._data: List[str] = []
+
+    @property
+    def streaming(self) -> bool:
+        """False when the server sent one buffered JSON document."""
+        return self.mode != "json"
+
+    def feed(self, chunk: bytes) -> List[Event]:
+        if self.done:
+            return []
+        if self.mode == "text":
+            text = self._text.decode(chunk)
+            return [("message", text)] if text else []
+        self._buffer += chunk
+        if self.mode == "json":
+            return []
+        events: List[Event] = []
+        while True:
+            end = self._buffer.find(b"\n")
+            if end < 0:
+                break
+            line = bytes(self._buffer[:end]).rstrip(b"\r")
+            del self._buffer[: end + 1]
+            self._line(line, events)
+            if self.done:
+                break
+        return events
+
+    def close(self) -> List[Event]:
+        """Flush what is left once the body has ended."""
+        if self.done:
+            return []
+        events: List[Event] = []
+        if self.mode == "json":
+            if self._buffer:
+                events.append(("message", self.loads(bytes(self._buffer))))
+        elif self.mode == "text":
+            text = self._text.decode(b"", final=True)
+            if text:
+                events.append(("message", text))
+        else:
+            if self._buffer:
+                self._line(bytes(self._buffer).rstrip(b"\r"), events)
+            if self.mode == "sse":
+                self._line(b"", events)
+        self._buffer.clear()
+        self.done = True
+        return events
+
+    def _decode(self, data: str) -> Any:
+        if data[:1] in ("{", "[", '"'):
+            try:
+                return self.loads(data.encode())
+            except Exception:
+                pass
+        return data
+
+    def _line(self, line: bytes, events: List[Event]) -> None:
+        text = line.decode("utf-8", "replace")
+        if self.mode == "ndjson":
+            if text.strip():
+                events.append(("message", self.loads(line)))
+            return
+        if not text:
+            # A blank line dispatches the event collected so far.
+            if self._data:
+                data = "\n".join(self._data)
+                if data.strip() == "[DONE]":
+                    self.done = True
+                else:
+                    events.append((self._event, self._decode(data)))
+            self._event, self._data = "message", []
+            return
+        if text.startswith(":"):
+            return
+        name, _, value = text.partition(":")
+        if value.startswith(" "):
+            value = value[1:]
+        if name == "data":
+            self._data.append(value)
+        elif name == "event":
+            self._event = value or "message"
+
+
+class AsyncResponseStream:
+    """
+    An open HTTP response whose body is read incrementally.
+
+    Returned by ``_open_stream`` once the status was checked. Iterate
+    :meth:`chunks` and always call :meth:`aclose`, which releases the
+    connection and records the attempt in the client's metrics.
+    """
+
+    def __init__(
+        self,
+        content_type: str,
+        chunks: AsyncIterator[bytes],
+        release: Callable[[], Awaitable[None]],
+        finish: Callable[[int, Optional[BaseException]], None],
+    ):
+        self.content_type = content_type
+        self.size = 0
+        self._chunks = chunks
+        self._release = release
+        self._finish = finish
+        self._error: Optional[BaseException] = None
+        self._closed = False
+
+    async def chunks(self) -> AsyncIterator[bytes]:
+        try:
+            async for chunk in self._chunks:
+                self.size += len(chunk)
+                yield chunk
+        except BaseException as exc:
+            self._error = exc
+            raise
+
+    async def aclose(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            await self._release()
+        finally:
+            self._finish(self.size, self._error)
+
+
+class ResponseStream:
+    """Blocking counterpart of :class:`AsyncResponseStream`; call :meth:`close` when done."""
+
+    def __init__(
+        self,
+        content_type: str,
+        chunks: Iterator[bytes],
+        release: Callable[[], None],
+        finish: Callable[[int, Optional[BaseException]], None],
+    ):
+        self.content_type = content_type
+        self.size = 0
+        self._chunks = chunks
+        self._release = release
+        self._finish = finish
+        self._error: Optional[BaseException] = None
+        self._closed = False
+
+    def chunks(self) -> Iterator[bytes]:
+        try:
+            for chunk in self._chunks:
+                self.size += len(chunk)
+                yield chunk
+        except BaseException as exc:
+            self._error = exc
+            raise
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._release()
+        finally:
+            self._finish(self.size, self._error)
@@ -0,0 +1,89 @@
+import asyncio
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Optional
+from urllib.request import urlopen
+
+PYPI_URL = "https://pypi.org/pypi/TaskoraApi/json"
+CACHE_FILE = os.path.join(tempfile.gettempdir(), "TaskoraApi-latest-version.json")
+
+
+def _read_cache(max_age: float) -> Optional[str]:
+    try:
+        with open(CACHE_FILE, encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if time.time() - cached.get("checked_at", 0) > max_age:
+        return None
+    return cached.get("version")
+
+
+def _write_cache(version: str) -> None:
+    try:
+        with open(CACHE_FILE, "w", encoding="utf-8") as f:
+            json.dump({"version": version, "checked_at": time.time()}, f)
+    except OSError:
+        pass
+
+
+def latest_version(timeout: float = 3.0, max_age: float = 86400.0) -> Optional[str]:
+    """
+    Look up the newest TaskoraApi release on PyPI.
+
+    The answer is cached on disk for ``max_age`` seconds, so repeated process
+    starts do not hit the network. Network failures are swallowed.
+
+    Args:
+        timeout (float): Seconds to wait for PyPI (default: 3).
+        max_age (float): Seconds a cached answer stays valid (default: one day).
+
+    Returns:
+        Optional[str]: The latest version, or None if it could not be determined.
+    """
+    version = _read_cache(max_age)
+    if version is not None:
+        return version
+    try:
+        with urlopen(PYPI_URL, timeout=timeout) as response:
+            version = json.loads(response.read())["info"]["version"]
+    except Exception:
+        return None
+    _write_cache(version)
+    return version
+
+
+def check_for_update(timeout: float = 3.0, max_age: float = 86400.0) -> Optional[str]:
+    """
+    Print a notice when a newer TaskoraApi release is available.
+
+    Args:
+        timeout (float): Seconds to wait for PyPI (default: 3).
+        max_age (float): Seconds a cached answer stays valid (default: one day).
+
+    Returns:
+        Optional[str]: The newer version if one exists, otherwise None.
+    """
+    from .. import __TITLE__, __VERSION__, __DISCORD__
+
+    newest = latest_version(timeout, max_age)
+    if newest is None or newest == __VERSION__:
+        return None
+    print(f"New version of {__TITLE__} available: {newest} (Using {__VERSION__})")
+    print(f"Visit our discord - {__DISCORD__}")
+    return newest
+
+
+async def acheck_for_update(timeout: float = 3.0, max_age: float = 86400.0) -> Optional[str]:
+    """Async variant of :func:`check_for_update` that runs the lookup in a worker thread."""
+    return await asyncio.to_thread(check_for_update, timeout, max_age)
+
+
+def check_for_update_in_background(timeout: float = 3.0, max_age: float = 86400.0) -> threading.Thread:
+    """Run :func:`check_for_update` on a daemon thread and return immediately."""
+    thread = threading.Thread(target=check_for_update, args=(timeout, max_age), daemon=True)
+    thread.start()
+    return thread
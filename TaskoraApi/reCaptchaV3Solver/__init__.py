@@ -1,9 +1,19 @@
-from .client import AiohttpreChaptchaAPI
-from .client import HttpxreChaptchaAPI
-from .client import RequestsreChaptchaAPI
+from ..core.lazy import lazy_exports
 
 __all__ =[
     "HttpxreChaptchaAPI",
     "AiohttpreChaptchaAPI",
-    "RequestsreChaptchaAPI"
+    "RequestsreChaptchaAPI",
+    "SyncreChaptchaAPI",
+    "AsyncTokenPool",
+    "TokenPool",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "AiohttpreChaptchaAPI": ".aiohttp_client",
+    "HttpxreChaptchaAPI": ".httpx_client",
+    "RequestsreChaptchaAPI": ".requests_client",
+    "SyncreChaptchaAPI": ".sync_client",
+    "AsyncTokenPool": ".pool",
+    "TokenPool": ".pool",
+})
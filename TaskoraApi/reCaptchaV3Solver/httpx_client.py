@@ -0,0 +1,117 @@
+from typing import Optional, Dict, Any, Iterable
+
+from ..core.httpx_base import HttpxBaseClient
+from ..core.pool import PoolLimits
+from ..core.ratelimit import TokenBucket
+from ..core.resilience import ResiliencePolicy
+from .pool import AsyncTokenPool
+
+
+class HttpxreChaptchaAPI(HttpxBaseClient):
+    """
+    Asynchronous client using httpx for interacting with the Quiz API.
+    """
+
+    key_status_method = "rechaptcha_key_status"
+
+    def __init__(
+        self,
+        apikey: str,
+        timeout: int = 60,
+        limits: Optional[PoolLimits] = None,
+        http2: bool = False,
+        rate_limiter: Optional[TokenBucket] = None,
+        resilience: Optional[ResiliencePolicy] = None,
+    ):
+        """
+        Initialize the API client.
+        :param apikey: Your API key for accessing the service.
+        :param timeout: Request timeout in seconds.
+        :param limits: Connection pool settings for the shared client.
+        :param http2: Multiplex concurrent calls over HTTP/2 when the server supports it.
+        :param rate_limiter: Token bucket every request waits on; may be shared across clients.
+        :param resilience: Retry policy and circuit breaker; retries transient failures by default.
+        """
+        super().__init__("https://taskora.onrender.com", timeout, limits, http2)
+        self.apikey = apikey
+        self.rate_limiter = rate_limiter
+        self.resilience = resilience or self.resilience
+        self.token_pool: Optional[AsyncTokenPool] = None
+
+    async def _get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Perform a GET request to the given endpoint.
+
+        :param endpoint: API route path.
+        :param params: Optional query parameters.
+        :return: JSON response from the API.
+        """
+        return await self._request("GET", endpoint, params)
+
+    async def rechaptcha_v3_solver(self, anchorUrl: str) -> Dict[str, Any]:
+        """
+        Solve a reCAPTCHA v3 challenge.
+
+        :param anchorUrl: Anchor URL of the reCAPTCHA.
+        :return: Dictionary with the solver result.
+        """
+        params = {
+            "apikey": self.apikey,
+            "anchor_url": anchorUrl
+        }
+        # Tokens are single-use and each solve is billed: never coalesce or automatically retry a solve.
+        return await self._request("GET", "/api/v1/recaptcha-solver/v3", params, idempotent=False)
+
+    async def rechaptcha_key_status(self) -> Dict[str, Any]:
+        """
+        Check API key status and expiration.
+
+        :return: Dictionary with API key status.
+        """
+        return await self._get("/api/v1/recaptcha-solver/validate_key", params={"apikey": self.apikey})
+
+    async def enable_token_pool(
+        self,
+        anchorUrls: Iterable[str] = (),
+        size: int = 5,
+        min_ready: int = 1,
+        margin: float = 10.0,
+        max_concurrency: int = 4,
+    ) -> AsyncTokenPool:
+        """
+        Keep pre-solved tokens ready so ``get_token`` returns without waiting for a solve.
+
+        Tokens are discarded ``margin`` seconds before they expire. Each URL's pool
+        follows the observed demand, between ``min_ready`` and ``size`` tokens.
+
+        :param anchorUrls: Anchor URLs to warm up now; others join on their first ``get_token``.
+        :param size: Most tokens kept ready per anchor URL.
+        :param min_ready: Tokens kept ready per anchor URL even without demand.
+        :param margin: Seconds before expiry at which a token is no longer handed out.
+        :param max_concurrency: Solves running at once per anchor URL.
+        :return: The pool, exposing ``stats()`` and ``last_error``.
+        """
+        if self.token_pool is not None:
+            self.token_pool.close()
+        self.token_pool = AsyncTokenPool(
+            self.rechaptcha_v3_solver, anchorUrls, size, min_ready, margin=margin, max_concurrency=max_concurrency
+        )
+        self.token_pool.start()
+        return self.token_pool
+
+    async def get_token(self, anchorUrl: str) -> Dict[str, Any]:
+        """
+        Solved reCAPTCHA v3 token for ``anchorUrl``, from the token pool when enabled.
+
+        :param anchorUrl: Anchor URL to solve.
+        :return: Solver result from the API, as returned by ``rechaptcha_v3_solver``.
+        """
+        if self.token_pool is None:
+            return await self.rechaptcha_v3_solver(anchorUrl)
+        return await self.token_pool.get(anchorUrl)
+
+    async def close(self) -> None:
+        """Stop the token pool and close the pooled connections."""
+        if self.token_pool is not None:
+            self.token_pool.close()
+        await super().close()
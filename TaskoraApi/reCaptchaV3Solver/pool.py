@@ -0,0 +1,393 @@
+import asyncio
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Deque, Dict, Iterable, Optional, Set, Tuple
+
+#: Seconds a reCAPTCHA v3 token stays valid after it was issued.
+TOKEN_TTL = 120.0
+
+
+class _Anchor:
+    """Pool state of one anchor URL."""
+
+    __slots__ = ("ready", "waiters", "in_flight", "taken", "solve_time", "failures", "retry_at")
+
+    def __init__(self):
+        self.ready: Deque[Tuple[float, Dict[str, Any]]] = deque()
+        self.waiters: Deque[Any] = deque()
+        self.in_flight = 0
+        self.taken: Deque[float] = deque()
+        self.solve_time: Optional[float] = None
+        self.failures = 0
+        self.retry_at = 0.0
+
+
+class _TokenPoolBase:
+    def __init__(
+        self,
+        anchor_urls: Iterable[str],
+        size: int,
+        min_ready: int,
+        ttl: float,
+        margin: float,
+        max_concurrency: int,
+        window: float,
+        clock: Callable[[], float],
+    ):
+        if not 0 <= min_ready <= size or size < 1:
+            raise ValueError("Expected 0 <= min_ready <= size and size >= 1.")
+        if not 0 <= margin < ttl:
+            raise ValueError("Expected 0 <= margin < ttl.")
+        self.size = size
+        self.min_ready = min_ready
+        self.ttl = ttl
+        self.margin = margin
+        self.max_concurrency = max_concurrency
+        self.window = window
+        self.clock = clock
+        self.anchors: Dict[str, _Anchor] = {url: _Anchor() for url in anchor_urls}
+        self.last_error: Optional[BaseException] = None
+        self.solved = self.served_warm = self.served_cold = self.expired = 0
+
+    def _prune(self, anchor: _Anchor, now: float) -> None:
+        while anchor.ready and anchor.ready[0][0] <= now:
+            anchor.ready.popleft()
+            self.expired += 1
+        while anchor.taken and anchor.taken[0] <= now - self.window:
+            anchor.taken.popleft()
+
+    def _rate(self, anchor: _Anchor, now: float) -> float:
+        """Tokens taken per second, over the window or the shorter time since demand began."""
+        if not anchor.taken:
+            return 0.0
+        return len(anchor.taken) / min(self.window, max(1.0, now - anchor.taken[0]))
+
+    def _target(self, anchor: _Anchor, now: float) -> int:
+        # Enough tokens to cover twice the demand expected while one solve runs.
+        wanted = math.ceil(2 * self._rate(anchor, now) * (anchor.solve_time or 0.0))
+        return min(self.size, max(self.min_ready, wanted))
+
+    def _launches(self, anchor: _Anchor, now: float) -> int:
+        """Number of solves to start now; call with ``_prune`` already applied."""
+        if now < anchor.retry_at:
+            return 0
+        deficit = self._target(anchor, now) + len(anchor.waiters) - len(anchor.ready) - anchor.in_flight
+        return max(0, min(deficit, self.max_concurrency - anchor.in_flight))
+
+    def _next_wakeup(self, now: float) -> Optional[float]:
+        """Seconds until a token expires or a failed anchor may retry, or None if nothing is pending."""
+        deadlines = [anchor.ready[0][0] for anchor in self.anchors.values() if anchor.ready]
+        deadlines += [anchor.retry_at for anchor in self.anchors.values() if anchor.retry_at > now]
+        return max(0.0, min(deadlines) - now) if deadlines else None
+
+    def _solved(self, anchor: _Anchor, started: float, response: Dict[str, Any]) -> Optional[Tuple[float, Dict[str, Any]]]:
+        """Record a successful solve; returns the entry to queue, or None if it was handed to a waiter."""
+        elapsed = self.clock() - started
+        anchor.solve_time = elapsed if anchor.solve_time is None else 0.8 * anchor.solve_time + 0.2 * elapsed
+        anchor.failures = 0
+        anchor.retry_at = 0.0
+        self.solved += 1
+        # The token may have been issued at any point of the call, so its lifetime starts at the request.
+        entry = (started + self.ttl - self.margin, response)
+        while anchor.waiters:
+            waiter = anchor.waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(response)
+                return None
+        return entry
+
+    def _failed(self, anchor: _Anchor, exc: BaseException) -> None:
+        self.last_error = exc
+        anchor.failures += 1
+        anchor.retry_at = self.clock() + min(30.0, 2.0 ** (anchor.failures - 1))
+        # Fail one waiter per failed solve so callers never hang on a broken backend.
+        while anchor.waiters:
+            waiter = anchor.waiters.popleft()
+            if not waiter.done():
+                waiter.set_exception(exc)
+                return
+
+    def _fail_waiters(self) -> None:
+        """Fail every caller still waiting for a token; used on close."""
+        error = RuntimeError("The token pool was closed.")
+        for anchor in self.anchors.values():
+            while anchor.waiters:
+                waiter = anchor.waiters.popleft()
+                if not waiter.done():
+                    waiter.set_exception(error)
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters plus, per anchor URL, ready tokens, solves in flight, demand and target size."""
+        now = self.clock()
+        anchors = {}
+        for url, anchor in self.anchors.items():
+            self._prune(anchor, now)
+            anchors[url] = {
+                "ready": len(anchor.ready),
+                "in_flight": anchor.in_flight,
+                "rate_per_s": self._rate(anchor, now),
+                "target": self._target(anchor, now),
+                "solve_time": anchor.solve_time,
+            }
+        return {
+            "solved": self.solved,
+            "served_warm": self.served_warm,
+            "served_cold": self.served_cold,
+            "expired": self.expired,
+            "anchors": anchors,
+        }
+
+
+class AsyncTokenPool(_TokenPoolBase):
+    """
+    Per-anchor-URL pools of pre-solved reCAPTCHA v3 tokens, refilled in the background.
+
+    Each token is usable until ``ttl - margin`` seconds after its solve began;
+    older ones are discarded unused. The pool watches how fast tokens are taken
+    and keeps enough ready to cover twice the demand of one solve, between
+    ``min_ready`` and ``size``, solving up to ``max_concurrency`` at a time per URL.
+
+    ``get`` returns at once when a token is ready. Otherwise it waits for the
+    next solve to finish rather than starting one of its own.
+    """
+
+    def __init__(
+        self,
+        solve: Callable[[str], Awaitable[Dict[str, Any]]],
+        anchor_urls: Iterable[str] = (),
+        size: int = 5,
+        min_ready: int = 1,
+        ttl: float = TOKEN_TTL,
+        margin: float = 10.0,
+        max_concurrency: int = 4,
+        window: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            solve (Callable): Coroutine function ``(anchor_url) -> response`` hitting the solver.
+            anchor_urls (Iterable[str]): URLs to keep warm from the start; others are added on first use.
+            size (int): Most tokens kept ready per URL (default: 5).
+            min_ready (int): Tokens kept ready per URL even without demand (default: 1).
+            ttl (float): Token lifetime in seconds (default: 120).
+            margin (float): Seconds before expiry at which a token is discarded (default: 10).
+            max_concurrency (int): Solves running at once per URL (default: 4).
+            window (float): Seconds of history used to measure demand (default: 60).
+            clock (Callable): Monotonic time source.
+        """
+        super().__init__(anchor_urls, size, min_ready, ttl, margin, max_concurrency, window, clock)
+        self._solve = solve
+        self._wakeup: Optional[asyncio.Event] = None
+        self._runner: Optional[asyncio.Task] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    def start(self) -> None:
+        """Begin filling the pools in the background."""
+        if self._runner is None or self._runner.done():
+            self._wakeup = asyncio.Event()
+            self._runner = asyncio.ensure_future(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            self._wakeup.clear()
+            now = self.clock()
+            for url, anchor in self.anchors.items():
+                self._prune(anchor, now)
+                for _ in range(self._launches(anchor, now)):
+                    anchor.in_flight += 1
+                    task = asyncio.ensure_future(self._fill(url, anchor))
+                    self._tasks.add(task)
+                    task.add_done_callback(self._tasks.discard)
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self._next_wakeup(now))
+            except asyncio.TimeoutError:
+                pass
+
+    async def _fill(self, url: str, anchor: _Anchor) -> None:
+        started = self.clock()
+        try:
+            response = await self._solve(url)
+        except Exception as exc:
+            self._failed(anchor, exc)
+        else:
+            entry = self._solved(anchor, started, response)
+            if entry is not None:
+                anchor.ready.append(entry)
+        finally:
+            anchor.in_flight -= 1
+            if self._wakeup is not None:
+                self._wakeup.set()
+
+    async def get(self, anchor_url: str) -> Dict[str, Any]:
+        """
+        Take a solved token for ``anchor_url``, waiting for a solve if none is ready.
+
+        Returns:
+            Dict[str, Any]: The solver response, as returned by ``rechaptcha_v3_solver``.
+        """
+        self.start()
+        anchor = self.anchors.get(anchor_url)
+        if anchor is None:
+            anchor = self.anchors[anchor_url] = _Anchor()
+        now = self.clock()
+        self._prune(anchor, now)
+        anchor.taken.append(now)
+        self._wakeup.set()
+        if anchor.ready:
+            self.served_warm += 1
+            return anchor.ready.popleft()[1]
+        self.served_cold += 1
+        waiter = asyncio.get_running_loop().create_future()
+        anchor.waiters.append(waiter)
+        try:
+            return await waiter
+        finally:
+            if not waiter.done():
+                anchor.waiters.remove(waiter)
+
+    def close(self) -> None:
+        """Stop refilling, cancel solves in flight and fail pending ``get`` calls; ``get`` restarts the pool."""
+        if self._runner is not None:
+            self._runner.cancel()
+            # A cancelled task is not done until the loop runs it, so forget it for ``start``.
+            self._runner = None
+            self._wakeup = None
+        for task in list(self._tasks):
+            task.cancel()
+        self._fail_waiters()
+
+
+class TokenPool(_TokenPoolBase):
+    """
+    Thread-backed counterpart of :class:`AsyncTokenPool` for the blocking client.
+
+    A daemon thread decides when to solve and hands the solves to a small
+    thread pool per anchor URL; ``get`` blocks only when no token is ready.
+    """
+
+    def __init__(
+        self,
+        solve: Callable[[str], Dict[str, Any]],
+        anchor_urls: Iterable[str] = (),
+        size: int = 5,
+        min_ready: int = 1,
+        ttl: float = TOKEN_TTL,
+        margin: float = 10.0,
+        max_concurrency: int = 4,
+        window: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            solve (Callable): Function ``(anchor_url) -> response`` hitting the solver.
+            anchor_urls (Iterable[str]): URLs to keep warm from the start; others are added on first use.
+            size (int): Most tokens kept ready per URL (default: 5).
+            min_ready (int): Tokens kept ready per URL even without demand (default: 1).
+            ttl (float): Token lifetime in seconds (default: 120).
+            margin (float): Seconds before expiry at which a token is discarded (default: 10).
+            max_concurrency (int): Solves running at once per URL (default: 4).
+            window (float): Seconds of history used to measure demand (default: 60).
+            clock (Callable): Monotonic time source.
+        """
+        super().__init__(anchor_urls, size, min_ready, ttl, margin, max_concurrency, window, clock)
+        self._solve = solve
+        self._wakeup = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        # One executor per anchor URL, so URLs added later get their own ``max_concurrency`` threads.
+        self._executors: Dict[str, ThreadPoolExecutor] = {}
+        self._queued: Dict[Future, _Anchor] = {}
+
+    def start(self) -> None:
+        """Start the refill thread; also restarts a closed pool."""
+        with self._wakeup:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="TaskoraApi-recaptcha-pool", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        with self._wakeup:
+            # A closed pool clears ``_thread``; a restart replaces it, so this thread exits either way.
+            while self._thread is threading.current_thread():
+                now = self.clock()
+                for url, anchor in self.anchors.items():
+                    self._prune(anchor, now)
+                    for _ in range(self._launches(anchor, now)):
+                        self._submit(url, anchor)
+                self._wakeup.wait(self._next_wakeup(now))
+
+    def _submit(self, url: str, anchor: _Anchor) -> None:
+        # Called with ``_wakeup`` held.
+        executor = self._executors.get(url)
+        if executor is None:
+            executor = self._executors[url] = ThreadPoolExecutor(
+                max(1, self.max_concurrency), thread_name_prefix="TaskoraApi-recaptcha"
+            )
+        anchor.in_flight += 1
+        future = executor.submit(self._fill, url, anchor)
+        self._queued[future] = anchor
+        future.add_done_callback(self._dequeue)
+
+    def _dequeue(self, future: Future) -> None:
+        with self._wakeup:
+            self._queued.pop(future, None)
+
+    def _fill(self, url: str, anchor: _Anchor) -> None:
+        started = self.clock()
+        try:
+            response = self._solve(url)
+        except Exception as exc:
+            with self._wakeup:
+                self._failed(anchor, exc)
+                anchor.in_flight -= 1
+                self._wakeup.notify_all()
+            return
+        with self._wakeup:
+            entry = self._solved(anchor, started, response)
+            if entry is not None:
+                anchor.ready.append(entry)
+            anchor.in_flight -= 1
+            self._wakeup.notify_all()
+
+    def get(self, anchor_url: str) -> Dict[str, Any]:
+        """
+        Take a solved token for ``anchor_url``, blocking for a solve if none is ready.
+
+        Returns:
+            Dict[str, Any]: The solver response, as returned by ``rechaptcha_v3_solver``.
+        """
+        self.start()
+        with self._wakeup:
+            anchor = self.anchors.get(anchor_url)
+            if anchor is None:
+                anchor = self.anchors[anchor_url] = _Anchor()
+            now = self.clock()
+            self._prune(anchor, now)
+            anchor.taken.append(now)
+            self._wakeup.notify_all()
+            if anchor.ready:
+                self.served_warm += 1
+                return anchor.ready.popleft()[1]
+            self.served_cold += 1
+            waiter: Future = Future()
+            anchor.waiters.append(waiter)
+        return waiter.result()
+
+    def close(self) -> None:
+        """
+        Stop the refill thread, drop queued solves and fail pending ``get`` calls.
+
+        Solves already running finish in the background. A later ``get`` restarts the pool.
+        """
+        with self._wakeup:
+            self._thread = None
+            executors, self._executors = self._executors, {}
+            for future, anchor in list(self._queued.items()):
+                if future.cancel():
+                    anchor.in_flight -= 1
+            self._fail_waiters()
+            self._wakeup.notify_all()
+        for executor in executors.values():
+            executor.shutdown(wait=False)
@@ -0,0 +1,16 @@
+from ..core.background import SyncFacade
+
+
+class SyncreChaptchaAPI(SyncFacade):
+    """
+    Blocking reCAPTCHA v3 solver client running the async client on a shared background event loop.
+
+    Takes the same arguments as ``AiohttpreChaptchaAPI`` plus ``backend`` ("aiohttp" or
+    "httpx"). Methods block like the ``Requests`` client's, but ``submit()`` and
+    ``map()`` run many calls concurrently over one connection pool (see :class:`SyncClient`).
+    """
+
+    BACKENDS = {
+        "aiohttp": "..reCaptchaV3Solver.aiohttp_client:AiohttpreChaptchaAPI",
+        "httpx": "..reCaptchaV3Solver.httpx_client:HttpxreChaptchaAPI",
+    }
@@ -0,0 +1,7 @@
+from ..core.lazy import lazy_exports
+
+__all__ = ["FakeTaskoraServer"]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "FakeTaskoraServer": ".server",
+})
@@ -0,0 +1,357 @@
+import argparse
+import asyncio
+import hashlib
+import json
+import random
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from aiohttp import web
+
+INSTAGRAM_MEDIA_ENDPOINTS = ("posts", "reels", "stories", "highlight_stories")
+INSTAGRAM_SINGLE_ENDPOINTS = ("get", "GET", "story")
+#: Last path segments whose payload depends on the query and is rebuilt per request.
+DYNAMIC_ENDPOINTS = frozenset({"quiz", "chatbot", "v3", "profile", "userInfo"})
+
+
+@dataclass
+class Fault:
+    """
+    Failure injected into matching requests by :meth:`FakeTaskoraServer.inject`.
+
+    Attributes:
+        status (int, optional): Respond with this HTTP status and a JSON error body.
+        retry_after (float, optional): ``Retry-After`` header sent with ``status``.
+        delay (float): Extra seconds before responding.
+        truncate (bool): Send the headers and half of the body, then close the connection.
+        drop (bool): Close the connection without responding.
+        path (str, optional): Only requests whose path contains this string.
+        rate (float): Probability of applying to a matching request (default: 1).
+        times (int, optional): Stop after applying this many times.
+    """
+
+    status: Optional[int] = None
+    retry_after: Optional[float] = None
+    delay: float = 0.0
+    truncate: bool = False
+    drop: bool = False
+    path: Optional[str] = None
+    rate: float = 1.0
+    times: Optional[int] = None
+    applied: int = 0
+
+
+def _media(index: int, base: str) -> Dict[str, Any]:
+    return {
+        "id": str(3_000_000_000_000_000_000 + index),
+        "code": f"C{index:010d}",
+        "taken_at": 1_700_000_000 + index * 3600,
+        "media_type": 2 if index % 3 else 1,
+        "like_count": (index * 7919) % 2_000_000,
+        "comment_count": (index * 104_729) % 50_000,
+        "caption_text": f"Synthetic caption number {index} #taskora " + "lorem ipsum " * 8,
+        "display_url": f"{base}/media/{index}.jpg",
+        "video_url": f"{base}/media/{index}.mp4",
+        "owner": {"id": "25025320", "username": "instagram", "is_verified": True},
+        "image_versions": [{"url": f"{base}/media/{index}_{w}.jpg", "width": w, "height": w} for w in (320, 640, 1080)],
+    }
+
+
+class FakeTaskoraServer:
+    """
+    Local stand-in for the Taskora API, for benchmarks and offline tests.
+
+    Serves every endpoint the clients call, with synthetic but well-formed
+    payloads. ``latency`` (seconds, plus up to ``jitter``) is added to every
+    response and ``items`` sets the length of list payloads. ``hits`` counts
+    requests per path.
+
+    Chatbot calls with ``stream=true`` are answered word by word, every
+    ``token_delay`` seconds, as server-sent events (``stream_format="sse"``),
+    NDJSON (``"ndjson"``) or chunked plain text (``"text"``); with
+    ``stream_format=None`` they get the buffered JSON reply.
+
+    :meth:`inject` adds faults: slow responses, 429s with ``Retry-After``,
+    5xx, truncated bodies and dropped connections, for every request or a
+    random fraction of them. ``seed`` makes the random choices repeatable.
+
+    Runs on its own event loop in a daemon thread::
+
+        with FakeTaskoraServer(latency=0.02) as server:
+            client = server.point(RequestsInstagramAPI("key"))
+            client.get_profile("instagram")
+
+    or as a separate process with ``python -m TaskoraApi.testing.server``.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        items: int = 10,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        seed: Optional[int] = None,
+        stream_format: Optional[str] = "sse",
+        token_delay: float = 0.0,
+    ):
+        """
+        Args:
+            latency (float): Seconds added to every response (default: 0).
+            jitter (float): Extra random delay of up to this many seconds (default: 0).
+            items (int): Number of items in list payloads such as ``get_posts`` (default: 10).
+            host (str): Interface to bind (default: 127.0.0.1).
+            port (int): Port to bind; 0 picks a free one.
+            seed (int, optional): Seed for jitter and fault rates.
+            stream_format (str, optional): "sse", "ndjson", "text" or None (default: "sse").
+            token_delay (float): Seconds between streamed chatbot words (default: 0).
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.items = items
+        self.host = host
+        self.port = port
+        self.stream_format = stream_format
+        self.token_delay = token_delay
+        self.hits: Counter = Counter()
+        self.faults: List[Fault] = []
+        self.random = random.Random(seed)
+        self.url = ""
+        self._bodies: Dict[str, bytes] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._runner: Optional[web.AppRunner] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "FakeTaskoraServer":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    # ----------- Faults ------------
+
+    def inject(self, fault: Optional[Fault] = None, **kwargs: Any) -> Fault:
+        """
+        Add a fault, given as a :class:`Fault` or as its keyword arguments.
+
+        Faults are checked in the order they were added; the first matching
+        one whose ``rate`` draw succeeds is applied. Returns the fault, whose
+        ``applied`` attribute counts activations.
+        """
+        fault = fault or Fault(**kwargs)
+        self.faults.append(fault)
+        return fault
+
+    def clear_faults(self) -> None:
+        self.faults.clear()
+
+    def _pick_fault(self, path: str) -> Optional[Fault]:
+        for fault in self.faults:
+            if fault.path is not None and fault.path not in path:
+                continue
+            if fault.times is not None and fault.applied >= fault.times:
+                continue
+            if fault.rate < 1 and self.random.random() >= fault.rate:
+                continue
+            fault.applied += 1
+            return fault
+        return None
+
+    # ----------- Payloads ------------
+
+    def payload(self, path: str, query: Dict[str, str]) -> Any:
+        """Response body for ``path``; override to customise the fake."""
+        name = path.rsplit("/", 1)[-1]
+        if path.endswith("validate_key"):
+            return {"valid": True, "plan": "benchmark", "rate_limit": 6000, "remaining": 1_000_000}
+        if path == "/api/v1/status":
+            return {"status": "ok"}
+        if path == "/api/v1/author":
+            return {"author": "taskora", "version": "fake"}
+        if path == "/api/v1/quiz/collections":
+            return {"collections": {"python": 500, "anime": 500, "games": 500}}
+        if path == "/api/v1/quiz":
+            size = int(query.get("size", 1))
+            return {"questions": [
+                {"question": f"{query.get('QuizType')} question {self.random.random():.6f}",
+                 "options": ["a", "b", "c", "d"], "answer": "a"}
+                for _ in range(size)
+            ]}
+        if path == "/api/v1/chatbot":
+            return {"response": f"echo: {query.get('message', '')}"}
+        if path == "/api/v1/recaptcha-solver/v3":
+            return {"success": True, "token": "03A" + "%032x" % self.random.getrandbits(128)}
+        if name in ("profile", "userInfo"):
+            return {"status": "ok", "data": {
+                "id": "25025320", "username": query.get("username", "instagram"), "full_name": "Instagram",
+                "biography": "Bringing you closer to the people and things you love.",
+                "follower_count": 672_000_000, "following_count": 150, "media_count": 7_900,
+                "is_private": False, "is_verified": True, "profile_pic_url": f"{self.url}/media/pic.jpg",
+            }}
+        if name in INSTAGRAM_MEDIA_ENDPOINTS:
+            return {"status": "ok", "items": [_media(i, self.url) for i in range(self.items)]}
+        if name == "highlights":
+            return {"status": "ok", "items": [
+                {"id": f"highlight:{i}", "title": f"Highlight {i}", "media_count": 12} for i in range(self.items)
+            ]}
+        if name in INSTAGRAM_SINGLE_ENDPOINTS:
+            return {"status": "ok", "data": _media(0, self.url)}
+        if name == "links":
+            return {"status": "ok", "links": [{"url": f"{self.url}/media/{i}.mp4"} for i in range(2)]}
+        if name == "hls":
+            return {"status": "ok", "url": f"{self.url}/media/master.m3u8"}
+        return None
+
+    def _body(self, path: str, query: Dict[str, str]) -> Optional[bytes]:
+        # Static payloads are serialised once so the server stays cheap under load.
+        if path in self._bodies:
+            return self._bodies[path]
+        data = self.payload(path, query)
+        if data is None:
+            return None
+        body = json.dumps(data).encode()
+        if path.rsplit("/", 1)[-1] not in DYNAMIC_ENDPOINTS:
+            self._bodies[path] = body
+        return body
+
+    # ----------- Server ------------
+
+    async def handle(self, request: web.Request) -> web.StreamResponse:
+        self.hits[request.path] += 1
+        fault = self._pick_fault(request.path) if self.faults else None
+        delay = self.latency + (self.random.uniform(0, self.jitter) if self.jitter else 0.0)
+        if fault is not None:
+            delay += fault.delay
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if fault is not None and fault.drop:
+            request.transport.close()
+            raise asyncio.CancelledError
+        if fault is not None and fault.status is not None:
+            headers = {"Retry-After": f"{fault.retry_after:g}"} if fault.retry_after is not None else None
+            return web.json_response({"detail": f"injected {fault.status}"}, status=fault.status, headers=headers)
+        query = dict(request.query)
+        if request.content_type == "application/json" and request.can_read_body:
+            query.update(await request.json())
+        if request.path == "/api/v1/chatbot" and query.get("stream") and self.stream_format:
+            return await self._stream_reply(request, query)
+        body = self._body(request.path, query)
+        if body is None:
+            return web.json_response({"detail": "Not Found"}, status=404)
+        if fault is not None and fault.truncate:
+            response = web.StreamResponse(headers={"Content-Type": "application/json"})
+            response.content_length = len(body)
+            await response.prepare(request)
+            await response.write(body[: len(body) // 2])
+            request.transport.close()
+            raise asyncio.CancelledError
+        etag = '"%s"' % hashlib.blake2b(body, digest_size=8).hexdigest()
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304, headers={"ETag": etag})
+        return web.Response(body=body, content_type="application/json", headers={"ETag": etag})
+
+    async def _stream_reply(self, request: web.Request, query: Dict[str, Any]) -> web.StreamResponse:
+        words = f"echo: {query.get('message', '')}".split(" ")
+        content_type = {"sse": "text/event-stream", "ndjson": "application/x-ndjson"}.get(
+            self.stream_format, "text/plain; charset=utf-8"
+        )
+        response = web.StreamResponse(headers={"Content-Type": content_type, "Cache-Control": "no-cache"})
+        await response.prepare(request)
+        try:
+            for index, word in enumerate(words):
+                if index and self.token_delay:
+                    await asyncio.sleep(self.token_delay)
+                delta = word if index == len(words) - 1 else word + " "
+                if self.stream_format == "sse":
+                    chunk = f"data: {json.dumps({'delta': delta})}\n\n"
+                elif self.stream_format == "ndjson":
+                    chunk = json.dumps({"delta": delta}) + "\n"
+                else:
+                    chunk = delta
+                await response.write(chunk.encode())
+            if self.stream_format == "sse":
+                await response.write(b"data: [DONE]\n\n")
+            await response.write_eof()
+        except ConnectionResetError:
+            # The client stopped reading early, which streaming callers may do.
+            pass
+        return response
+
+    def make_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_route("*", "/{tail:.*}", self.handle)
+        return app
+
+    def start(self) -> str:
+        """Start serving in a background thread and return the base URL."""
+        ready = threading.Event()
+        failure = []
+
+        def run() -> None:
+            loop = self._loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+            try:
+                self._runner = web.AppRunner(self.make_app(), access_log=None)
+                loop.run_until_complete(self._runner.setup())
+                site = web.TCPSite(self._runner, self.host, self.port)
+                loop.run_until_complete(site.start())
+                self.port = site._server.sockets[0].getsockname()[1]
+            except BaseException as exc:
+                failure.append(exc)
+                ready.set()
+                return
+            ready.set()
+            loop.run_forever()
+            loop.run_until_complete(self._runner.cleanup())
+            loop.close()
+
+        self._thread = threading.Thread(target=run, name="TaskoraApi-fake-server", daemon=True)
+        self._thread.start()
+        ready.wait()
+        if failure:
+            raise failure[0]
+        self.url = f"http://{self.host}:{self.port}"
+        return self.url
+
+    def stop(self) -> None:
+        """Stop the server and wait for its thread to exit."""
+        if self._loop is not None and self._thread is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop = self._thread = None
+
+    def point(self, client: Any) -> Any:
+        """Redirect ``client`` to this server and return it."""
+        client.base_url = self.base_url_for(client)
+        return client
+
+    def base_url_for(self, client: Any) -> str:
+        # The Instagram clients use ".../api/v1/" as base and relative endpoints.
+        return self.url + "/api/v1/" if "Instagram" in type(client).__name__ else self.url
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Serve a fake Taskora API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--items", type=int, default=10)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests failing with --error-status")
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args(argv)
+    server = FakeTaskoraServer(
+        args.latency_ms / 1000, args.jitter_ms / 1000, args.items, args.host, args.port, args.seed
+    )
+    if args.error_rate:
+        server.inject(status=args.error_status, rate=args.error_rate, retry_after=1 if args.error_status == 429 else None)
+    server.url = f"http://{args.host}:{args.port}"
+    web.run_app(server.make_app(), host=args.host, port=args.port, access_log=None, print=None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,280 @@
+"""
+Cross-backend benchmark suite against a local fake Taskora server.
+
+Starts ``TaskoraApi.testing.server`` in its own process with the configured
+latency and payload size, then runs each workload for each client class at
+each concurrency level in a fresh subprocess, so CPU time and peak memory
+belong to that client alone. Reports throughput, latency percentiles, CPU
+seconds per 1000 requests and peak RSS, and writes every cell to a JSON file
+that later runs can be compared against.
+
+Async clients are driven by ``asyncio`` tasks behind a semaphore, sync clients
+by a thread pool of the same size. Every call uses a distinct argument, so
+request coalescing never hides work.
+
+Run with:
+    python benchmarks/backend_suite.py [--latency-ms 20] [--items 10] [--concurrency 1,10,50]
+        [--requests 500] [--backends aiohttp,httpx,requests] [--workloads instagram,quiz,chatbot,recaptcha]
+        [--output results.json] [--baseline old.json --tolerance 0.15]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import resource
+import socket
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+CLIENTS = {
+    "instagram": {
+        "aiohttp": "TaskoraApi.InstagramApi:AiohttpInstagramAPI",
+        "httpx": "TaskoraApi.InstagramApi:HttpxInstagramAPI",
+        "requests": "TaskoraApi.InstagramApi:RequestsInstagramAPI",
+    },
+    "posts": {
+        "aiohttp": "TaskoraApi.InstagramApi:AiohttpInstagramAPI",
+        "httpx": "TaskoraApi.InstagramApi:HttpxInstagramAPI",
+        "requests": "TaskoraApi.InstagramApi:RequestsInstagramAPI",
+    },
+    "quiz": {
+        "aiohttp": "TaskoraApi.QuizApi:AiohttpQuizAPI",
+        "httpx": "TaskoraApi.QuizApi:HttpxQuizAPI",
+        "requests": "TaskoraApi.QuizApi:RequestQuizAPI",
+    },
+    "chatbot": {
+        "aiohttp": "TaskoraApi.chatBot:AiohttpChatbotAPI",
+        "httpx": "TaskoraApi.chatBot:HttpxChatbotAPI",
+        "requests": "TaskoraApi.chatBot:RequestsChatbotAPI",
+    },
+    "recaptcha": {
+        "aiohttp": "TaskoraApi.reCaptchaV3Solver:AiohttpreChaptchaAPI",
+        "httpx": "TaskoraApi.reCaptchaV3Solver:HttpxreChaptchaAPI",
+        "requests": "TaskoraApi.reCaptchaV3Solver:RequestsreChaptchaAPI",
+    },
+}
+
+#: One call per workload; ``i`` makes every request distinct.
+CALLS = {
+    "instagram": lambda client, i: client.get_profile(f"user{i}"),
+    "posts": lambda client, i: client.get_posts(f"user{i}"),
+    "quiz": lambda client, i: client.get_python_quiz(5),
+    "chatbot": lambda client, i: client.chatbot(f"message number {i}"),
+    "recaptcha": lambda client, i: client.rechaptcha_v3_solver(f"https://www.google.com/recaptcha/api2/anchor?k={i}"),
+}
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    if not ordered:
+        return None
+    index = min(len(ordered) - 1, max(0, round(q * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def make_client(workload, backend, url):
+    module, name = CLIENTS[workload][backend].split(":")
+    cls = getattr(__import__(module, fromlist=[name]), name)
+    if workload == "chatbot":
+        return cls("bench", url)
+    client = cls("bench")
+    client.base_url = url + "/api/v1/" if workload in ("instagram", "posts") else url
+    return client
+
+
+async def drive_async(client, call, requests, concurrency, warmup):
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies, errors = [], 0
+
+    async def one(i, record=True):
+        nonlocal errors
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                await call(client, i)
+            except Exception:
+                errors += 1
+            if record:
+                latencies.append(time.perf_counter() - started)
+
+    await asyncio.gather(*(one(-i - 1, False) for i in range(warmup)))
+    cpu, started = _cpu(), time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(requests)))
+    elapsed, cpu = time.perf_counter() - started, _cpu() - cpu
+    await client.close()
+    return latencies, errors, elapsed, cpu
+
+
+def drive_sync(client, call, requests, concurrency, warmup):
+    latencies, errors = [], 0
+
+    def one(i):
+        started = time.perf_counter()
+        try:
+            call(client, i)
+            return time.perf_counter() - started, False
+        except Exception:
+            return time.perf_counter() - started, True
+
+    with ThreadPoolExecutor(concurrency) as pool:
+        list(pool.map(one, range(-warmup, 0)))
+        cpu, started = _cpu(), time.perf_counter()
+        for latency, failed in pool.map(one, range(requests)):
+            latencies.append(latency)
+            errors += failed
+        elapsed, cpu = time.perf_counter() - started, _cpu() - cpu
+    client.close()
+    return latencies, errors, elapsed, cpu
+
+
+def _cpu():
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+def run_cell(workload, backend, url, requests, concurrency, warmup):
+    """Benchmark one (workload, backend, concurrency) cell in this process."""
+    client = make_client(workload, backend, url)
+    call = CALLS[workload]
+    if backend == "requests":
+        latencies, errors, elapsed, cpu = drive_sync(client, call, requests, concurrency, warmup)
+    else:
+        latencies, errors, elapsed, cpu = asyncio.run(drive_async(client, call, requests, concurrency, warmup))
+    # ru_maxrss is KiB on Linux and bytes on macOS.
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+    return {
+        "workload": workload,
+        "backend": backend,
+        "client": CLIENTS[workload][backend].split(":")[1],
+        "concurrency": concurrency,
+        "requests": requests,
+        "errors": errors,
+        "seconds": elapsed,
+        "rps": requests / elapsed if elapsed else None,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p95_ms": percentile(latencies, 0.95) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "max_ms": max(latencies) * 1000,
+        "cpu_ms_per_1k": cpu / requests * 1_000_000,
+        "peak_rss_mb": rss / 2 ** 20,
+    }
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(args):
+    port = free_port()
+    command = [sys.executable, "-m", "TaskoraApi.testing.server", "--port", str(port),
+               "--latency-ms", str(args.latency_ms), "--jitter-ms", str(args.jitter_ms), "--items", str(args.items)]
+    process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    deadline = time.monotonic() + 15
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"fake server exited: {process.stderr.read().decode()}")
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+            return process, f"http://127.0.0.1:{port}"
+        except OSError:
+            time.sleep(0.05)
+    process.kill()
+    raise RuntimeError("fake server did not start")
+
+
+def versions():
+    result = {"python": platform.python_version(), "platform": platform.platform()}
+    for name in ("aiohttp", "httpx", "requests", "orjson", "msgspec"):
+        try:
+            result[name] = __import__(name).__version__
+        except ImportError:
+            result[name] = None
+    return result
+
+
+def compare(results, baseline, tolerance):
+    """Return cells whose throughput dropped more than ``tolerance`` below the baseline."""
+    key = lambda row: (row["workload"], row["backend"], row["concurrency"])
+    previous = {key(row): row for row in baseline["results"]}
+    regressions = []
+    for row in results:
+        old = previous.get(key(row))
+        if old and old["rps"] and row["rps"] < old["rps"] * (1 - tolerance):
+            regressions.append((row, old))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--items", type=int, default=10, help="items in list payloads (posts)")
+    parser.add_argument("--concurrency", default="1,10,50")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--backends", default="aiohttp,httpx,requests")
+    parser.add_argument("--workloads", default="instagram,posts,quiz,chatbot,recaptcha")
+    parser.add_argument("--output", default="backend_suite.json")
+    parser.add_argument("--baseline", help="earlier --output file to compare throughput against")
+    parser.add_argument("--tolerance", type=float, default=0.15)
+    parser.add_argument("--cell", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.cell:
+        workload, backend, url, concurrency = args.cell.split("|")
+        row = run_cell(workload, backend, url, args.requests, int(concurrency), args.warmup)
+        print(json.dumps(row))
+        return
+
+    server, url = start_server(args)
+    results = []
+    print(f"{'workload':<10} {'client':<22} {'conc':>4} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} "
+          f"{'p99 ms':>8} {'cpu ms/1k':>10} {'rss MB':>7} {'errors':>6}")
+    try:
+        for workload in args.workloads.split(","):
+            for backend in args.backends.split(","):
+                for concurrency in map(int, args.concurrency.split(",")):
+                    cell = "|".join((workload, backend, url, str(concurrency)))
+                    command = [sys.executable, __file__, "--cell", cell,
+                               "--requests", str(args.requests), "--warmup", str(args.warmup)]
+                    out = subprocess.run(command, check=True, capture_output=True, text=True,
+                                         env=dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path)))
+                    row = json.loads(out.stdout.strip().splitlines()[-1])
+                    results.append(row)
+                    print(f"{workload:<10} {row['client']:<22} {concurrency:>4} {row['rps']:>9.1f} "
+                          f"{row['p50_ms']:>8.2f} {row['p95_ms']:>8.2f} {row['p99_ms']:>8.2f} "
+                          f"{row['cpu_ms_per_1k']:>10.1f} {row['peak_rss_mb']:>7.1f} {row['errors']:>6}")
+    finally:
+        server.terminate()
+        server.wait()
+
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "versions": versions(),
+            "args": {key: value for key, value in vars(args).items() if key != "cell"},
+        },
+        "results": results,
+    }
+    with open(args.output, "w") as file:
+        json.dump(report, file, indent=2)
+    print(f"\nwrote {len(results)} results to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            regressions = compare(results, json.load(file), args.tolerance)
+        for row, old in regressions:
+            print(f"REGRESSION {row['workload']}/{row['backend']} c={row['concurrency']}: "
+                  f"{row['rps']:.1f} req/s vs {old['rps']:.1f}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+HLS download benchmark against a local stand-in server.
+
+Serves a synthetic master playlist with three renditions, an fMP4 init section
+and deterministic segments, each delayed by ``--delay-ms`` to mimic CDN latency.
+Downloads the stream with increasing fetch windows, checks the output is
+byte-identical to the expected concatenation, and reports throughput.
+
+Run with:
+    python benchmarks/hls_benchmark.py [--segments 60] [--segment-kb 256] [--delay-ms 50] [--backend aiohttp]
+"""
+
+import argparse
+import asyncio
+import hashlib
+import io
+import time
+
+from aiohttp import web
+
+from TaskoraApi.InstagramApi.hls import HlsDownloader
+
+VARIANTS = ((400_000, "640x360"), (1_500_000, "1280x720"), (4_000_000, "1920x1080"))
+
+
+def segment_bytes(height, index, size):
+    seed = hashlib.sha256(f"{height}-{index}".encode()).digest()
+    return (seed * (size // len(seed) + 1))[:size]
+
+
+def make_app(args):
+    async def master(request):
+        lines = ["#EXTM3U", "#EXT-X-VERSION:7"]
+        for bandwidth, resolution in VARIANTS:
+            height = resolution.split("x")[1]
+            lines += [f'#EXT-X-STREAM-INF:BANDWIDTH={bandwidth},RESOLUTION={resolution},CODECS="avc1.64001f"',
+                      f"{height}p/index.m3u8"]
+        return web.Response(text="\n".join(lines) + "\n", content_type="application/vnd.apple.mpegurl")
+
+    async def media(request):
+        lines = ["#EXTM3U", "#EXT-X-VERSION:7", "#EXT-X-TARGETDURATION:2", "#EXT-X-MEDIA-SEQUENCE:0",
+                 '#EXT-X-MAP:URI="init.mp4"']
+        for i in range(args.segments):
+            lines += ["#EXTINF:2.000,", f"seg{i}.m4s"]
+        lines.append("#EXT-X-ENDLIST")
+        return web.Response(text="\n".join(lines) + "\n", content_type="application/vnd.apple.mpegurl")
+
+    async def segment(request):
+        await asyncio.sleep(args.delay_ms / 1000)
+        height = request.match_info["height"]
+        name = request.match_info["name"]
+        index = -1 if name == "init.mp4" else int(name[3:-4])
+        return web.Response(body=segment_bytes(height, index, args.segment_kb * 1024))
+
+    app = web.Application()
+    app.router.add_get("/master.m3u8", master)
+    app.router.add_get("/{height}p/index.m3u8", media)
+    app.router.add_get("/{height}p/{name}", segment)
+    return app
+
+
+async def main_async(args):
+    runner = web.AppRunner(make_app(args))
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    url = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}/master.m3u8"
+
+    size = args.segment_kb * 1024
+    expected = hashlib.sha256(b"".join(segment_bytes("720", i, size) for i in range(-1, args.segments))).hexdigest()
+    print(f"{args.segments} segments x {args.segment_kb} KiB, {args.delay_ms} ms latency, backend {args.backend}\n")
+    try:
+        for window in (1, 4, 8, 16):
+            async with HlsDownloader(args.backend, window=window, max_connections=16) as downloader:
+                sink = io.BytesIO()
+                start = time.perf_counter()
+                result = await downloader.download(url, sink, max_height=720)
+                elapsed = time.perf_counter() - start
+            ok = hashlib.sha256(sink.getvalue()).hexdigest() == expected
+            print(f"window {window:>2}: {result.size / elapsed / 2**20:7.1f} MiB/s  {elapsed:6.2f} s  "
+                  f"variant {result.variant.resolution[1]}p  output {'ok' if ok else 'MISMATCH'}")
+    finally:
+        await runner.cleanup()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--segments", type=int, default=60)
+    parser.add_argument("--segment-kb", type=int, default=256)
+    parser.add_argument("--delay-ms", type=float, default=50)
+    parser.add_argument("--backend", choices=("aiohttp", "httpx"), default="aiohttp")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+HTTP/1.1 vs HTTP/2 benchmark for the httpx-backed clients.
+
+Starts a local TLS stand-in server that speaks HTTP/2 (via ``h2``) and HTTP/1.1,
+negotiated with ALPN, and adds a fixed server-side delay to every response so
+concurrency actually matters. Reports throughput, the number of TCP connections
+the server accepted, and the protocol the client ended up using.
+
+Requires ``h2`` (``pip install TaskoraApi[http2]``) and the ``openssl`` CLI for
+the throwaway certificate.
+
+Run with:
+    python benchmarks/http2_benchmark.py [--requests 2000] [--concurrency 200] [--delay-ms 20]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import ssl
+import subprocess
+import tempfile
+import time
+
+import h2.config
+import h2.connection
+import h2.events
+import httpx
+
+from TaskoraApi.InstagramApi.httpx_client import HttpxInstagramAPI
+
+PAYLOAD = json.dumps({"username": "instagram", "followers": 1000}).encode()
+
+
+class StandInProtocol(asyncio.Protocol):
+    """Answers every request with PAYLOAD over whichever protocol ALPN selected."""
+
+    def __init__(self, server):
+        self.server = server
+        self.transport = None
+        self.h2 = None
+        self.buffer = b""
+
+    def connection_made(self, transport):
+        self.server.connections += 1
+        self.transport = transport
+        if transport.get_extra_info("ssl_object").selected_alpn_protocol() == "h2":
+            self.h2 = h2.connection.H2Connection(h2.config.H2Configuration(client_side=False))
+            self.h2.initiate_connection()
+            transport.write(self.h2.data_to_send())
+
+    def data_received(self, data):
+        if self.h2 is None:
+            self.buffer += data
+            while b"\r\n\r\n" in self.buffer:
+                _, self.buffer = self.buffer.split(b"\r\n\r\n", 1)
+                self.server.loop.call_later(self.server.delay, self.reply_http1)
+            return
+        for event in self.h2.receive_data(data):
+            if isinstance(event, h2.events.StreamEnded):
+                self.server.loop.call_later(self.server.delay, self.reply_h2, event.stream_id)
+        self.transport.write(self.h2.data_to_send())
+
+    def reply_http1(self):
+        if not self.transport.is_closing():
+            self.transport.write(
+                b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                b"Content-Length: %d\r\n\r\n%s" % (len(PAYLOAD), PAYLOAD)
+            )
+
+    def reply_h2(self, stream_id):
+        if self.transport.is_closing():
+            return
+        self.h2.send_headers(stream_id, [
+            (":status", "200"),
+            ("content-type", "application/json"),
+            ("content-length", str(len(PAYLOAD))),
+        ])
+        self.h2.send_data(stream_id, PAYLOAD, end_stream=True)
+        self.transport.write(self.h2.data_to_send())
+
+
+class StandInServer:
+    def __init__(self, certfile, keyfile, delay, alpn):
+        self.loop = asyncio.get_running_loop()
+        self.delay = delay
+        self.connections = 0
+        self.context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+        self.context.load_cert_chain(certfile, keyfile)
+        self.context.set_alpn_protocols(alpn)
+        self.server = None
+
+    async def start(self):
+        self.server = await self.loop.create_server(lambda: StandInProtocol(self), "127.0.0.1", 0, ssl=self.context)
+        return f"https://127.0.0.1:{self.server.sockets[0].getsockname()[1]}/api/v1/"
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+
+def make_certificate(directory):
+    certfile, keyfile = os.path.join(directory, "cert.pem"), os.path.join(directory, "key.pem")
+    subprocess.run(
+        ["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+         "-subj", "/CN=127.0.0.1", "-addext", "subjectAltName=IP:127.0.0.1",
+         "-keyout", keyfile, "-out", certfile],
+        check=True, capture_output=True,
+    )
+    return certfile, keyfile
+
+
+async def run_case(label, certfile, keyfile, alpn, http2, args):
+    server = StandInServer(certfile, keyfile, args.delay_ms / 1000, alpn)
+    base_url = await server.start()
+    client = HttpxInstagramAPI("bench", http2=http2)
+    client.base_url = base_url
+    # Same client the library would build, but trusting the throwaway certificate.
+    client.client = httpx.AsyncClient(
+        timeout=client.timeout,
+        limits=client.limits.httpx_limits(),
+        http2=client.http2,
+        verify=ssl.create_default_context(cafile=certfile),
+    )
+    sem = asyncio.Semaphore(args.concurrency)
+
+    async def call():
+        async with sem:
+            await client.get_profile("x")
+
+    try:
+        start = time.perf_counter()
+        await asyncio.gather(*(call() for _ in range(args.requests)))
+        elapsed = time.perf_counter() - start
+    finally:
+        await client.close()
+        await server.stop()
+    print(f"{label:<34} {args.requests / elapsed:>9.1f} req/s {server.connections:>5} connections   {client.http_version}")
+
+
+async def main_async(args):
+    with tempfile.TemporaryDirectory() as directory:
+        certfile, keyfile = make_certificate(directory)
+        await run_case("http2=False", certfile, keyfile, ["h2", "http/1.1"], False, args)
+        await run_case("http2=True", certfile, keyfile, ["h2", "http/1.1"], True, args)
+        await run_case("http2=True, server without h2", certfile, keyfile, ["http/1.1"], True, args)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--delay-ms", type=float, default=20.0)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
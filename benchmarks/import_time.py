@@ -0,0 +1,73 @@
+"""
+Import-time benchmark.
+
+Runs ``python -X importtime`` in fresh interpreters and reports the cumulative
+cost of importing TaskoraApi and of each backend client. Exits with status 1
+when ``import TaskoraApi`` exceeds the budget or pulls in an HTTP library, so
+it can guard against regressions in CI.
+
+Run with:
+    python benchmarks/import_time.py [--runs 5] [--budget-ms 50]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+BACKENDS = ("aiohttp", "httpx", "requests")
+
+CASES = {
+    "import TaskoraApi": "import TaskoraApi",
+    "AiohttpInstagramAPI": "from TaskoraApi import AiohttpInstagramAPI",
+    "HttpxQuizAPI": "from TaskoraApi import HttpxQuizAPI",
+    "RequestsChatbotAPI": "from TaskoraApi import RequestsChatbotAPI",
+}
+
+
+def measure(statement):
+    """Return (cumulative microseconds of the statement's imports, set of top-level packages imported)."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [os.getcwd(), os.environ.get("PYTHONPATH")])))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True, text=True, env=env, check=True,
+    )
+    total, modules, inside = 0, set(), False
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # Anything imported at or after the first TaskoraApi module is attributed to the statement;
+        # interpreter start-up modules come before it.
+        inside = inside or "TaskoraApi" in name
+        if inside:
+            modules.add(name.strip().split(".")[0])
+            if not name.startswith("  "):
+                total += int(cumulative)
+    return total, modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=50.0)
+    args = parser.parse_args()
+
+    failed = False
+    for label, statement in CASES.items():
+        samples = [measure(statement) for _ in range(args.runs)]
+        best = min(total for total, _ in samples) / 1000
+        backends = sorted(set(BACKENDS) & samples[0][1])
+        print(f"{label:<24} {best:>8.1f} ms   backends: {', '.join(backends) or '-'}")
+        if statement == "import TaskoraApi":
+            if best > args.budget_ms:
+                print(f"  FAIL: over the {args.budget_ms:.0f} ms budget")
+                failed = True
+            if backends:
+                print("  FAIL: bare import must not load an HTTP library")
+                failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
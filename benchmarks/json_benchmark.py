@@ -0,0 +1,91 @@
+"""
+JSON decoding micro-benchmark on Instagram-shaped payloads.
+
+Builds synthetic ``get_posts``, ``get_reels`` and ``get_highlight_stories``
+responses and times every installed decoder on the raw response bytes, next to
+the old ``response.json()`` path (decode bytes to ``str``, then ``json.loads``).
+
+Run with:
+    python benchmarks/json_benchmark.py [--items 50] [--rounds 200]
+"""
+
+import argparse
+import json
+import random
+import string
+import time
+
+from TaskoraApi.core.jsonlib import PREFERENCE, decoder_name, get_decoder
+
+
+def _text(rng, n):
+    return "".join(rng.choice(string.ascii_letters + "  #@é🙂") for _ in range(n))
+
+
+def _media(rng, i):
+    return {
+        "id": str(3_000_000_000_000_000_000 + i),
+        "shortcode": _text(rng, 11),
+        "taken_at": 1_700_000_000 + i * 3600,
+        "caption": _text(rng, rng.randint(40, 600)),
+        "like_count": rng.randint(0, 2_000_000),
+        "comment_count": rng.randint(0, 50_000),
+        "is_video": bool(i % 3),
+        "video_duration": round(rng.uniform(3, 90), 3),
+        "owner": {"id": "25025320", "username": "instagram", "is_verified": True},
+        "display_resources": [
+            {"src": f"https://scontent.cdninstagram.com/v/{_text(rng, 60)}.jpg", "width": w, "height": w}
+            for w in (640, 750, 1080)
+        ],
+        "tagged_users": [{"username": _text(rng, 10), "x": rng.random(), "y": rng.random()} for _ in range(3)],
+    }
+
+
+def payloads(items):
+    rng = random.Random(0)
+    return {
+        "get_posts": {"status": "ok", "posts": [_media(rng, i) for i in range(items)]},
+        "get_reels": {"status": "ok", "reels": [_media(rng, i) for i in range(items)]},
+        "get_highlight_stories": {
+            "status": "ok",
+            "items": [dict(_media(rng, i), expiring_at=1_700_086_400 + i) for i in range(items * 2)],
+        },
+    }
+
+
+def _time(func, body, rounds):
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(rounds):
+            func(body)
+        best = min(best, time.perf_counter() - start)
+    return best / rounds * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=50, help="posts/reels per payload")
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    decoders = {"response.json()": lambda body: json.loads(body.decode("utf-8"))}
+    for name in PREFERENCE:
+        try:
+            decoders[name + " (bytes)"] = get_decoder(name)
+        except ImportError:
+            print(f"{name}: not installed, skipped")
+    print(f"default decoder: {decoder_name(get_decoder())}\n")
+
+    for endpoint, payload in payloads(args.items).items():
+        body = json.dumps(payload, ensure_ascii=False).encode()
+        print(f"{endpoint} ({len(body) / 1024:.0f} KiB)")
+        baseline = None
+        for label, func in decoders.items():
+            micros = _time(func, body, args.rounds)
+            baseline = baseline or micros
+            print(f"  {label:<18} {micros:9.1f} µs   x{baseline / micros:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Memory benchmark: raw response dicts vs. compact Instagram models.
+
+Decodes a batch of synthetic ``get_posts`` responses and keeps every post
+alive, once as plain dicts and once as :class:`TaskoraApi.InstagramApi.Post`
+models, measuring the retained heap with ``tracemalloc``. Also times the
+conversion and a hot-field scan over all items.
+
+Run with:
+    python benchmarks/models_memory.py [--posts 100000]
+"""
+
+import argparse
+import json
+import random
+import string
+import time
+import tracemalloc
+
+from TaskoraApi.core.jsonlib import get_decoder
+from TaskoraApi.InstagramApi.models import Post
+
+PAGE = 50
+
+
+def _text(rng, n):
+    return "".join(rng.choice(string.ascii_letters + " #@") for _ in range(n))
+
+
+def make_pages(posts):
+    rng = random.Random(0)
+    pages = []
+    for start in range(0, posts, PAGE):
+        items = []
+        for i in range(start, min(start + PAGE, posts)):
+            items.append({
+                "id": str(3_000_000_000_000_000_000 + i),
+                "code": _text(rng, 11),
+                "taken_at": 1_700_000_000 + i,
+                "media_type": 1 + i % 2,
+                "like_count": rng.randint(0, 2_000_000),
+                "comment_count": rng.randint(0, 50_000),
+                "caption_text": _text(rng, rng.randint(20, 200)),
+                "display_url": f"https://scontent.cdninstagram.com/v/{_text(rng, 40)}.jpg",
+                "owner": {"id": "25025320", "username": "instagram", "is_verified": True},
+                "image_versions": [{"url": _text(rng, 60), "width": w, "height": w} for w in (320, 640, 1080)],
+                "usertags": [{"username": _text(rng, 10), "x": rng.random(), "y": rng.random()}],
+            })
+        pages.append(json.dumps({"status": "ok", "items": items}).encode())
+    return pages
+
+
+def measure(label, build, pages):
+    tracemalloc.start()
+    start = time.perf_counter()
+    kept = build(pages)
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    scan = time.perf_counter()
+    total = sum(item["like_count"] for item in kept)
+    scan = time.perf_counter() - scan
+    print(f"{label:<8} {current / 2**20:8.1f} MiB   {current / len(kept):7.0f} B/item"
+          f"   build {elapsed:6.2f} s   scan {scan * 1e3:6.1f} ms   ({total})")
+    return current
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--posts", type=int, default=100_000)
+    args = parser.parse_args()
+
+    pages = make_pages(args.posts)
+    decode = get_decoder()
+    print(f"{args.posts} posts in {len(pages)} pages\n")
+    as_dicts = measure("dicts", lambda pages: [p for body in pages for p in decode(body)["items"]], pages)
+    as_models = measure("models", lambda pages: [p for body in pages for p in Post.many_from_json(body)], pages)
+    print(f"\nmodels use {as_models / as_dicts:.0%} of the dict footprint")
+
+
+if __name__ == "__main__":
+    main()
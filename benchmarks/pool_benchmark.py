@@ -0,0 +1,120 @@
+"""
+Connection pooling benchmark.
+
+Compares requests/sec of a fresh session per call (the old behaviour of the
+Instagram and reCaptcha clients) against the pooled clients, using a local
+keep-alive stand-in server so the network is not the bottleneck.
+
+Run with:
+    python benchmarks/pool_benchmark.py [--requests 500] [--concurrency 20]
+"""
+
+import argparse
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import aiohttp
+import httpx
+import requests
+
+from TaskoraApi.InstagramApi.aiohttp_client import AiohttpInstagramAPI
+from TaskoraApi.InstagramApi.httpx_client import HttpxInstagramAPI
+from TaskoraApi.InstagramApi.requests_client import RequestsInstagramAPI
+
+PAYLOAD = json.dumps({"username": "instagram", "followers": 1000}).encode()
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    wbufsize = 1 << 16
+
+    def _reply(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(PAYLOAD)))
+        self.end_headers()
+        self.wfile.write(PAYLOAD)
+
+    do_GET = do_POST = _reply
+
+    def log_message(self, *args):
+        pass
+
+
+def start_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/api/v1/"
+
+
+def report(name, count, elapsed):
+    print(f"{name:<32} {count / elapsed:>10.1f} req/s")
+
+
+async def run_async(base_url, total, concurrency):
+    sem = asyncio.Semaphore(concurrency)
+
+    async def unpooled_aiohttp():
+        async with sem:
+            async with aiohttp.ClientSession() as session:
+                async with session.post(base_url + "profile", params={"username": "x"}) as response:
+                    await response.json()
+
+    async def unpooled_httpx():
+        async with sem:
+            async with httpx.AsyncClient() as client:
+                (await client.post(base_url + "profile", params={"username": "x"})).json()
+
+    for name, factory in (("aiohttp, session per call", unpooled_aiohttp), ("httpx, client per call", unpooled_httpx)):
+        start = time.perf_counter()
+        await asyncio.gather(*(factory() for _ in range(total)))
+        report(name, total, time.perf_counter() - start)
+
+    for name, cls in (("aiohttp, pooled", AiohttpInstagramAPI), ("httpx, pooled", HttpxInstagramAPI)):
+        async with cls("bench") as client:
+            client.base_url = base_url
+
+            async def call():
+                async with sem:
+                    await client.get_profile("x")
+
+            start = time.perf_counter()
+            await asyncio.gather(*(call() for _ in range(total)))
+            report(name, total, time.perf_counter() - start)
+
+
+def run_sync(base_url, total):
+    start = time.perf_counter()
+    for _ in range(total):
+        requests.post(base_url + "profile", params={"username": "x"}).json()
+    report("requests, no session", total, time.perf_counter() - start)
+
+    with RequestsInstagramAPI("bench") as client:
+        client.base_url = base_url
+        start = time.perf_counter()
+        for _ in range(total):
+            client.get_profile("x")
+        report("requests, pooled", total, time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=20)
+    args = parser.parse_args()
+
+    server, base_url = start_server()
+    try:
+        asyncio.run(run_async(base_url, args.requests, args.concurrency))
+        run_sync(base_url, args.requests)
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
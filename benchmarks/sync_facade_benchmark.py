@@ -0,0 +1,94 @@
+"""
+Sync facade benchmark.
+
+Compares blocking code firing many Instagram requests through:
+
+- ``RequestsInstagramAPI.get_profiles_many`` (one thread per in-flight request),
+- ``SyncInstagramAPI.map`` on the shared background loop (aiohttp and httpx).
+
+The fake Taskora server runs in a subprocess with simulated latency, so the
+numbers reflect how well each path overlaps waiting rather than raw parsing.
+
+Run with:
+    python benchmarks/sync_facade_benchmark.py [--requests 2000] [--concurrency 64] [--latency-ms 20]
+"""
+
+import argparse
+import os
+import resource
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+from TaskoraApi.InstagramApi.requests_client import RequestsInstagramAPI
+from TaskoraApi.InstagramApi.sync_client import SyncInstagramAPI
+from TaskoraApi.core.pool import PoolLimits
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(latency_ms):
+    port = free_port()
+    command = [sys.executable, "-m", "TaskoraApi.testing.server", "--port", str(port), "--latency-ms", str(latency_ms)]
+    process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    deadline = time.monotonic() + 15
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"fake server exited: {process.stderr.read().decode()}")
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+            return process, f"http://127.0.0.1:{port}/api/v1/"
+        except OSError:
+            time.sleep(0.05)
+    process.kill()
+    raise RuntimeError("fake server did not start")
+
+
+def measure(name, run, total):
+    cpu = time.process_time()
+    started = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - started
+    cpu = time.process_time() - cpu
+    print(f"{name:<34} {total / elapsed:>9.1f} req/s {cpu * 1000 / total * 1000:>9.1f} CPU ms/1k "
+          f"{threading.active_count():>4} threads")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    args = parser.parse_args()
+
+    process, base_url = start_server(args.latency_ms)
+    usernames = [f"user{i}" for i in range(args.requests)]
+    limits = PoolLimits(max_connections=args.concurrency, max_connections_per_host=args.concurrency)
+    try:
+        print(f"{args.requests} requests, concurrency {args.concurrency}, {args.latency_ms:g} ms server latency")
+
+        with RequestsInstagramAPI("key", limits=limits) as client:
+            client.base_url = base_url
+            measure("requests + threads", lambda: list(client.get_profiles_many(usernames, args.concurrency)), args.requests)
+
+        for backend in ("aiohttp", "httpx"):
+            with SyncInstagramAPI("key", backend=backend, limits=limits) as client:
+                client.base_url = base_url
+                measure(f"SyncInstagramAPI.map ({backend})",
+                        lambda: list(client.map("get_profile", usernames, concurrency=args.concurrency)),
+                        args.requests)
+
+        print(f"peak RSS {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.0f} MiB (pid {os.getpid()})")
+    finally:
+        process.terminate()
+        process.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -18,6 +18,10 @@ setup(
         "httpx>=0.24.0",
         "requests>=2.25.0"
     ],
+    extras_require={
+        "http2": ["httpx[http2]>=0.24.0"],
+        "fast-json": ["orjson>=3.8"],
+    },
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",